@@ -1,36 +1,104 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Dict, Optional
 
 import pandas as pd
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
-app = FastAPI(title="Rx Repurpose API", version="0.1.0")
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Load the tables before the first request rather than inside it.
+    await run_in_threadpool(_warm_tables)
+    yield
+
+
+app = FastAPI(title="Rx Repurpose API", version="0.1.0", lifespan=_lifespan)
 
 SEED_PATH = Path("disease_seeds.csv")
 SCORE_PATH = Path("target_scores.csv")
 DRUG_TARGET_PATH = Path("drug_target_mapping.csv")
 
 
-def _load_csv(path: Path) -> pd.DataFrame:
-    if not path.exists():
+KEY_SUFFIX = "_lc"
+
+
+@lru_cache(maxsize=8)
+def _cached_csv(path_str: str, mtime_ns: int, key_column: Optional[str]) -> pd.DataFrame:
+    df = pd.read_csv(path_str, engine="pyarrow")
+    if key_column and key_column in df.columns:
+        keys = df[key_column].astype(str).str.lower().rename(key_column + KEY_SUFFIX)
+        df = df.set_index(keys).sort_index(kind="stable")
+    return df
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _load_csv(path: Path, key_column: Optional[str] = None) -> pd.DataFrame:
+    """Return the parsed table, re-reading only when the file changes on disk."""
+    mtime_ns = _mtime_ns(path)
+    if mtime_ns is None:
         return pd.DataFrame()
-    return pd.read_csv(path)
+    return _cached_csv(str(path), mtime_ns, key_column)
+
+
+@lru_cache(maxsize=2)
+def _cached_target_index(score_mtime: Optional[int], target_mtime: Optional[int]) -> Dict[str, dict]:
+    scores = _load_csv(SCORE_PATH, "target_id")
+    targets = _load_csv(DRUG_TARGET_PATH, "target_id")
+
+    index: Dict[str, dict] = {}
+    if not targets.empty and "target_id" in targets.columns:
+        for key, record in zip(targets.index, targets.to_dict(orient="records")):
+            index.setdefault(key, {"drugs": []})["drugs"].append(record)
+    if not scores.empty and "target_id" in scores.columns:
+        first = scores[~scores.index.duplicated(keep="first")]
+        for key in first.index:
+            index.setdefault(key, {"drugs": []})
+        if "score" in first.columns:
+            for key, value in first["score"].items():
+                index[key]["score"] = float(value)
+    return index
+
+
+def _target_index() -> Dict[str, dict]:
+    """Pre-joined score and drug lookups keyed by lowercased target id."""
+    return _cached_target_index(_mtime_ns(SCORE_PATH), _mtime_ns(DRUG_TARGET_PATH))
+
+
+def _match(df: pd.DataFrame, value: str) -> pd.DataFrame:
+    try:
+        return df.loc[[value.lower()]]
+    except KeyError:
+        return df.iloc[0:0]
+
+
+def _warm_tables() -> None:
+    _load_csv(SEED_PATH, "disease_id")
+    _target_index()
 
 
 @app.get("/health")
-def health() -> dict:
+async def health() -> dict:
     return {"status": "ok"}
 
 
 @app.get("/diseases/{disease_id}")
-def disease_detail(disease_id: str) -> dict:
-    seeds = _load_csv(SEED_PATH)
+async def disease_detail(disease_id: str) -> dict:
+    seeds = await run_in_threadpool(_load_csv, SEED_PATH, "disease_id")
     if seeds.empty:
         raise HTTPException(status_code=404, detail="Seed table not found")
 
-    subset = seeds[seeds["disease_id"].str.lower() == disease_id.lower()]
+    subset = _match(seeds, disease_id)
     if subset.empty:
         raise HTTPException(status_code=404, detail="Disease not found")
 
@@ -41,24 +109,13 @@ def disease_detail(disease_id: str) -> dict:
 
 
 @app.get("/targets/{target_id}")
-def target_detail(target_id: str) -> dict:
-    scores = _load_csv(SCORE_PATH)
-    targets = _load_csv(DRUG_TARGET_PATH)
-
-    score_row: Optional[pd.Series] = None
-    if not scores.empty and "target_id" in scores.columns:
-        matched = scores[scores["target_id"].str.lower() == target_id.lower()]
-        if not matched.empty:
-            score_row = matched.iloc[0]
-
-    linked_drugs = []
-    if not targets.empty and "target_id" in targets.columns:
-        linked_drugs = targets[targets["target_id"].str.lower() == target_id.lower()].to_dict(orient="records")
-
-    if score_row is None and not linked_drugs:
+async def target_detail(target_id: str) -> dict:
+    index = await run_in_threadpool(_target_index)
+    entry = index.get(target_id.lower())
+    if entry is None:
         raise HTTPException(status_code=404, detail="Target not found")
 
-    payload = {"target_id": target_id, "drugs": linked_drugs}
-    if score_row is not None and "score" in score_row:
-        payload["score"] = float(score_row["score"])
+    payload = {"target_id": target_id, "drugs": entry["drugs"]}
+    if "score" in entry:
+        payload["score"] = entry["score"]
     return payload
@@ -12,7 +12,7 @@ OCULAR_SEARCH = "eye"
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("--output", type=Path, default=Path("ocular_safety.csv"))
+    parser.add_argument("--output", type=Path, default=Path("ocular_safety.parquet"))
     parser.add_argument("--term", default=OCULAR_SEARCH, help="Term to query from openFDA")
     return parser.parse_args()
 
@@ -22,7 +22,10 @@ def main() -> None:
     events = load_openfda_events(args.term)
     ocular_events = extract_ocular_events(events)
     summary = summarise_ocular_events(ocular_events)
-    summary.to_csv(args.output, index=False)
+    if args.output.suffix.lower() in {".parquet", ".pq"}:
+        summary.to_parquet(args.output, index=False)
+    else:
+        summary.to_csv(args.output, index=False)
 
 
 if __name__ == "__main__":
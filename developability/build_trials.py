@@ -10,7 +10,7 @@ from developability.trials import fetch_trials, summarise_trials
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--condition", action="append", dest="conditions", required=True)
-    parser.add_argument("--output", type=Path, default=Path("trial_summary.csv"))
+    parser.add_argument("--output", type=Path, default=Path("trial_summary.parquet"))
     return parser.parse_args()
 
 
@@ -18,7 +18,10 @@ def main() -> None:
     args = parse_args()
     trials = fetch_trials(args.conditions)
     summary = summarise_trials(trials)
-    summary.to_csv(args.output, index=False)
+    if args.output.suffix.lower() in {".parquet", ".pq"}:
+        summary.to_parquet(args.output, index=False)
+    else:
+        summary.to_csv(args.output, index=False)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import re
+from pathlib import Path
 from typing import Dict, Iterable, List
 
 import pandas as pd
@@ -19,8 +20,20 @@ OCULAR_PATTERNS = [
     ]
 ]
 
+SNIPPET_SECTIONS = frozenset({"adverse reactions", "warnings and precautions", "dosage and administration"})
+
+
+def _combine(patterns: Iterable[re.Pattern]) -> re.Pattern:
+    return re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns), re.IGNORECASE)
+
+
+OCULAR_REGEX = _combine(OCULAR_PATTERNS)
+
 
 def load_dailymed_sections(path: str = "dailymed_processed_data.csv") -> pd.DataFrame:
+    parquet_path = Path(path).with_suffix(".parquet")
+    if parquet_path.exists():
+        return pd.read_parquet(parquet_path)
     try:
         return pd.read_csv(path)
     except FileNotFoundError:
@@ -31,23 +44,23 @@ def extract_ocular_snippets(sections: pd.DataFrame, patterns: Iterable[re.Patter
     if sections.empty:
         return pd.DataFrame(columns=["drug_name", "section", "snippet"])
 
+    regex = OCULAR_REGEX if patterns is OCULAR_PATTERNS else _combine(patterns)
+    section_columns = [column for column in sections.columns if column.lower() in SNIPPET_SECTIONS]
+    if "drug_name" in sections.columns:
+        names = sections["drug_name"]
+    elif "setid" in sections.columns:
+        names = sections["setid"]
+    else:
+        names = pd.Series("unknown", index=sections.index)
+
     records: List[Dict[str, str]] = []
-    for row in sections.to_dict(orient="records"):
-        for section, text in row.items():
-            if section.lower() in {"adverse reactions", "warnings and precautions", "dosage and administration"}:
-                if not isinstance(text, str):
-                    continue
-                for pattern in patterns:
-                    if pattern.search(text):
-                        snippet = pattern.search(text)
-                        start = max(snippet.start() - 80, 0)
-                        end = snippet.end() + 120
-                        records.append(
-                            {
-                                "drug_name": row.get("drug_name", row.get("setid", "unknown")),
-                                "section": section,
-                                "snippet": text[start:end].strip(),
-                            }
-                        )
-                        break
+    for name, *texts in zip(names, *(sections[column] for column in section_columns)):
+        for section, text in zip(section_columns, texts):
+            if not isinstance(text, str):
+                continue
+            match = regex.search(text)
+            if match:
+                start = max(match.start() - 80, 0)
+                end = match.end() + 120
+                records.append({"drug_name": name, "section": section, "snippet": text[start:end].strip()})
     return pd.DataFrame(records)
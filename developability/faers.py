@@ -16,6 +16,7 @@ OCULAR_TERMS = {
     "vision blurred",
     "conjunctival haemorrhage",
 }
+OCULAR_TERMS_LC = frozenset(term.lower() for term in OCULAR_TERMS)
 
 
 def load_openfda_events(term: str) -> pd.DataFrame:
@@ -28,30 +29,40 @@ def load_openfda_events(term: str) -> pd.DataFrame:
 
 
 def extract_ocular_events(events: pd.DataFrame, ocular_terms: Iterable[str] = OCULAR_TERMS) -> pd.DataFrame:
-    if events.empty:
+    if events.empty or not {"reactions", "drugs"} <= set(events.columns):
         return pd.DataFrame(columns=["safetyreportid", "reaction", "drug"])
 
-    rows = []
-    ocular_terms_lc = {term.lower() for term in ocular_terms}
-    for record in events.to_dict(orient="records"):
-        reactions = record.get("reactions", []) or []
-        drugs = record.get("drugs", []) or []
-        for reaction in reactions:
-            if reaction and reaction.lower() in ocular_terms_lc:
-                for drug in drugs:
-                    rows.append({
-                        "safetyreportid": record.get("safetyreportid"),
-                        "reaction": reaction,
-                        "drug": drug,
-                    })
-    return pd.DataFrame(rows)
+    ocular_terms_lc = OCULAR_TERMS_LC if ocular_terms is OCULAR_TERMS else {term.lower() for term in ocular_terms}
+    # The explodes below pair reactions with drugs by index label, so give every report its own.
+    events = events.reset_index(drop=True)
+    reactions = events["reactions"].explode().rename("reaction")
+    reactions = reactions[reactions.str.lower().isin(ocular_terms_lc)]
+    drugs = events["drugs"].explode().rename("drug")
+    # Drop only the placeholder rows explode emits for empty or missing drug lists; ``None``
+    # entries inside a list are reported as they always were.
+    has_drugs = events["drugs"].map(lambda value: isinstance(value, (list, tuple)) and len(value) > 0)
+    drugs = drugs[has_drugs.reindex(drugs.index).to_numpy()]
+    matched = reactions.to_frame().join(drugs, how="inner")
+    report_ids = events["safetyreportid"] if "safetyreportid" in events.columns else pd.Series(None, index=events.index)
+    matched.insert(0, "safetyreportid", report_ids.loc[matched.index].to_numpy())
+    return matched.reset_index(drop=True)
 
 
 def summarise_ocular_events(ocular_events: pd.DataFrame) -> pd.DataFrame:
     if ocular_events.empty:
         return pd.DataFrame(columns=["drug", "reports", "unique_reactions"])
-    return (
-        ocular_events.groupby("drug")
-        .agg(reports=("safetyreportid", "nunique"), unique_reactions=("reaction", lambda x: "|".join(sorted(set(x)))))
-        .reset_index()
+    ocular_events = ocular_events.astype({"drug": "category", "reaction": "category"})
+    reports = ocular_events.groupby("drug", observed=True)["safetyreportid"].nunique()
+    # Equivalent of string_agg(DISTINCT reaction ORDER BY reaction): dedupe and sort once, then join per drug.
+    reactions = (
+        ocular_events[["drug", "reaction"]]
+        .drop_duplicates()
+        .astype(str)
+        .sort_values(["drug", "reaction"], kind="stable")
+        .groupby("drug", sort=False)["reaction"]
+        .agg("|".join)
     )
+    summary = pd.DataFrame({"reports": reports})
+    summary.index = summary.index.astype(str)
+    summary["unique_reactions"] = reactions
+    return summary.rename_axis("drug").reset_index()
@@ -2,32 +2,44 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional
 
 import pandas as pd
 import requests
 
+from etl._http import SESSION, get_json
+
 API_URL = "https://clinicaltrials.gov/api/v2/studies"
+MAX_WORKERS = 8
+
+
+def _fetch_condition(session: requests.Session, condition: str, max_records: int) -> Optional[dict]:
+    params = {
+        "format": "json",
+        "cond": condition,
+        "fields": "NCTId,BriefTitle,Condition,OverallStatus,StudyType,StartDate,Phase",
+        "pageSize": min(max_records, 100),
+    }
+    try:
+        return get_json(API_URL, params, session=session)
+    except Exception as exc:  # pragma: no cover - network
+        logging.warning("Failed to fetch trials for %s: %s", condition, exc)
+        return None
 
 
 def fetch_trials(conditions: Iterable[str], recruitment: str = "Recruiting", max_records: int = 200) -> pd.DataFrame:
-    """Fetch trial metadata for the supplied conditions."""
+    """Fetch trial metadata for the supplied conditions, querying them concurrently."""
 
+    conditions = list(conditions)
     records: List[dict] = []
-    for condition in conditions:
-        params = {
-            "format": "json",
-            "cond": condition,
-            "fields": "NCTId,BriefTitle,Condition,OverallStatus,StudyType,StartDate,Phase",
-            "pageSize": min(max_records, 100),
-        }
-        try:
-            response = requests.get(API_URL, params=params, timeout=60)
-            response.raise_for_status()
-        except Exception as exc:  # pragma: no cover - network
-            logging.warning("Failed to fetch trials for %s: %s", condition, exc)
+    if not conditions:
+        return pd.DataFrame(records)
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(conditions))) as pool:
+        payloads = list(pool.map(lambda condition: _fetch_condition(SESSION, condition, max_records), conditions))
+    for payload in payloads:
+        if payload is None:
             continue
-        payload = response.json()
         studies = payload.get("studies", [])
         for study in studies:
             attribs = study.get("protocolSection", {}).get("identificationModule", {})
@@ -54,13 +66,15 @@ def summarise_trials(trials: pd.DataFrame) -> pd.DataFrame:
     if trials.empty:
         return pd.DataFrame(columns=["condition", "active_trials"])
 
-    exploded = trials.assign(condition_list=trials["conditions"].str.split("|") if "conditions" in trials else [[]])
-    exploded = exploded.explode("condition_list")
-    exploded["condition_list"].fillna("", inplace=True)
-    exploded = exploded[exploded["condition_list"].str.len() > 0]
-    return (
-        exploded.groupby("condition_list")
-        .agg(active_trials=("nct_id", "nunique"))
-        .reset_index()
-        .rename(columns={"condition_list": "condition"})
-    )
+    if "conditions" not in trials:
+        return pd.DataFrame(columns=["condition", "active_trials"])
+
+    # Project to the two needed columns, explode once and count distinct trials per condition.
+    pairs = pd.DataFrame({"condition": trials["conditions"].str.split("|"), "nct_id": trials["nct_id"]})
+    pairs = pairs.explode("condition")
+    pairs = pairs[(pairs["condition"].fillna("").str.len() > 0) & pairs["nct_id"].notna()].drop_duplicates()
+    counts = pairs["condition"].astype("category").value_counts(sort=False)
+    counts = counts[counts > 0].sort_index()
+    summary = counts.rename_axis("condition").reset_index(name="active_trials")
+    summary["condition"] = summary["condition"].astype(str)
+    return summary
@@ -0,0 +1,184 @@
+"""Column helpers shared by the tabular ETL loaders."""
+from __future__ import annotations
+
+import csv
+import json
+import sqlite3
+from pathlib import Path
+from typing import List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:  # multithreaded C++ CSV encoder; pandas' writer is the fallback
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pa_parquet
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+try:  # optional Rust reader that fills Arrow buffers without per-row Python objects
+    import connectorx
+except ImportError:  # pragma: no cover - optional dependency
+    connectorx = None
+
+EMPTY_JSON = "{}"
+
+
+def _json_default(value: object) -> object:
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_json(value: object) -> str:
+    """Serialise ``value`` as compact JSON, unwrapping numpy scalars taken from frames."""
+    # Stdlib only: orjson differs on non-ASCII text and NaN/inf, and evidence blobs must not
+    # depend on which optional packages are installed.
+    return json.dumps(value, separators=(",", ":"), default=_json_default)
+
+
+def _header(path: Path, sep: str) -> List[str]:
+    with path.open(newline="", encoding="utf-8-sig") as handle:
+        return next(csv.reader(handle, delimiter=sep), [])
+
+
+def read_delimited(
+    path: Path, text_columns: Sequence[str] = (), columns: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """Read a CSV/TSV export with the multithreaded pyarrow parser (Parquet inputs load directly).
+
+    ``text_columns`` are decoded as strings rather than type-inferred, so identifiers such as
+    ``00123`` or numeric ids with gaps do not come back as ``123``/``7157.0``. ``columns``
+    projects the read onto the names a loader can use; other columns are never decoded.
+    Absent names are ignored in both.
+    """
+    if path.suffix.lower() in {".parquet", ".pq"}:
+        if columns is not None and pa is not None:
+            available = set(pa_parquet.read_schema(path).names)
+            return pd.read_parquet(path, engine="pyarrow", columns=[name for name in columns if name in available])
+        return pd.read_parquet(path, engine="pyarrow")
+    sep = "\t" if path.suffix.lower() in {".tsv", ".txt"} else ","
+    if (text_columns or columns is not None) and pa is not None:
+        include = None
+        if columns is not None:
+            header = set(_header(path, sep))
+            include = [name for name in dict.fromkeys(columns) if name in header]
+        # pandas applies ``dtype`` only after Arrow has inferred numbers, so pass the types to Arrow.
+        convert = pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in text_columns},
+            include_columns=include,
+            strings_can_be_null=True,
+        )
+        table = pa_csv.read_csv(path, parse_options=pa_csv.ParseOptions(delimiter=sep), convert_options=convert)
+        # Release each Arrow column as it is converted, so Arrow and pandas copies never coexist in full.
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    return pd.read_csv(path, sep=sep, engine="pyarrow")
+
+
+def write_table(
+    df: pd.DataFrame,
+    csv_path: Path,
+    formats: Sequence[str] = ("parquet", "csv"),
+    compression: str = "zstd",
+    arrow_csv: bool = False,
+) -> Path:
+    """Write ``df`` to ``csv_path`` and/or its Parquet sibling for faster reloads.
+
+    The CSV is written by ``DataFrame.to_csv`` unless ``arrow_csv`` selects :func:`write_csv`,
+    whose quoting and number formatting differ. Existing files are unlinked rather than
+    truncated, so hard-linked snapshots of an earlier write (see ``ontology_parser``) keep
+    their content.
+    """
+    if "parquet" in formats:
+        parquet_path = csv_path.with_suffix(".parquet")
+        parquet_path.unlink(missing_ok=True)
+        df.to_parquet(parquet_path, compression=compression, index=False)
+    if "csv" in formats and csv_path.suffix.lower() != ".parquet":
+        if arrow_csv:
+            write_csv(df, csv_path)
+        else:
+            csv_path.unlink(missing_ok=True)
+            df.to_csv(csv_path, index=False)
+    return csv_path
+
+
+def write_csv(df: pd.DataFrame, path: Path) -> Path:
+    """Write ``df`` as CSV with pyarrow, falling back to ``DataFrame.to_csv``."""
+    path.unlink(missing_ok=True)  # a fresh inode; never rewrite a hard-linked file in place
+    if pa is not None:
+        try:
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+            return path
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            pass  # e.g. mixed-type object columns; pandas stringifies those per cell
+    df.to_csv(path, index=False)
+    return path
+
+
+def table_exists(csv_path: Path) -> bool:
+    """True when either the CSV or its Parquet sibling is present."""
+    return csv_path.exists() or csv_path.with_suffix(".parquet").exists()
+
+
+def read_table(csv_path: Path) -> pd.DataFrame:
+    """Read a table written by :func:`write_table`, preferring its Parquet sibling."""
+    parquet_path = csv_path.with_suffix(".parquet")
+    if parquet_path.exists():
+        # Memory-mapped so re-reads come straight from the page cache without buffered copies.
+        return pd.read_parquet(parquet_path, memory_map=True)
+    return pd.read_csv(csv_path)
+
+
+def read_sqlite(db_path: Path, query: str, params: Optional[Sequence[object]] = None) -> pd.DataFrame:
+    """Run ``query`` against a SQLite file, via connectorx/Arrow when it is installed.
+
+    connectorx has no parameter binding, so parameterised queries always use sqlite3.
+    """
+    if connectorx is not None and not params:
+        return connectorx.read_sql(f"sqlite://{Path(db_path).resolve()}", query, return_type="arrow").to_pandas()
+    with sqlite3.connect(db_path) as conn:
+        return pd.read_sql_query(query, conn, params=params)
+
+
+def present(values: pd.Series) -> pd.Series:
+    """Boolean mask of non-null, non-blank cells."""
+    mask = values.notna()
+    if values.dtype == object:
+        mask &= values.astype(str).str.strip().ne("")
+    return mask
+
+
+def coalesce(df: pd.DataFrame, columns: Sequence[str], default: object = None) -> pd.Series:
+    """Return the first non-empty value across ``columns`` for every row."""
+    result = pd.Series([default] * len(df.index), index=df.index, dtype=object)
+    for column in reversed(columns):
+        if column in df.columns:
+            values = df[column]
+            result = values.astype(object).where(present(values), result)
+    return result
+
+
+def assemble(columns: Mapping[str, object], keep: pd.Series, order: Sequence[str]) -> pd.DataFrame:
+    """Build the output frame column-wise from masked arrays, broadcasting scalars."""
+    mask = keep.to_numpy(dtype=bool)
+    arrays = {
+        name: value.to_numpy()[mask] if isinstance(value, pd.Series) else value
+        for name, value in columns.items()
+    }
+    return pd.DataFrame(arrays, index=pd.RangeIndex(int(mask.sum())), columns=list(order))
+
+
+def json_records(fields: Mapping[str, pd.Series]) -> List[str]:
+    """Serialise aligned columns into one JSON object per row, skipping missing values."""
+    names = list(fields)
+    columns = [fields[name].astype(object).where(present(fields[name]), None) for name in names]
+    records = []
+    for row in zip(*columns):
+        evidence = {name: value for name, value in zip(names, row) if value is not None}
+        records.append(dumps_json(evidence) if evidence else EMPTY_JSON)
+    return records
+
+
+__all__ = ["EMPTY_JSON", "assemble", "dumps_json", "coalesce", "present", "json_records", "read_delimited",
+           "read_sqlite", "read_table", "table_exists", "write_csv", "write_table"]
@@ -0,0 +1,135 @@
+"""Pooled HTTP session and on-disk response cache shared by the remote fetchers."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Mapping, Optional, Sequence
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+CACHE_DIR = Path(os.environ.get("RX_HTTP_CACHE", ".cache/http"))
+CACHE_VERSION = "1"
+DEFAULT_TTL = 24 * 60 * 60
+POOL_SIZE = 16
+POOL_MAXSIZE = 32
+
+
+def _build_session() -> requests.Session:
+    retry = Retry(total=5, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=("GET",))
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+    session = requests.Session()
+    # gzip/deflate, plus br when a brotli decoder is installed for urllib3.
+    session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Module-level so TCP/TLS connections are reused across calls and fetchers.
+SESSION = _build_session()
+
+
+def _cache_path(key_parts: Sequence[object]) -> Path:
+    digest = hashlib.sha256(json.dumps([CACHE_VERSION, *key_parts], sort_keys=True, default=str).encode()).hexdigest()
+    return CACHE_DIR / digest[:2] / f"{digest}.json"
+
+
+def _temp_sibling(path: Path, suffix: str) -> Path:
+    """A fresh, uniquely named file next to ``path``, so concurrent writers never share one."""
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name + ".", suffix=suffix, delete=False) as handle:
+        return Path(handle.name)
+
+
+def cached_json(key_parts: Sequence[object], compute: Callable[[], object], ttl: Optional[float] = DEFAULT_TTL) -> object:
+    """Return ``compute()`` memoised on disk under ``key_parts`` for ``ttl`` seconds."""
+    path = _cache_path(key_parts)
+    if path.exists() and (ttl is None or time.time() - path.stat().st_mtime < ttl):
+        try:
+            return json.loads(path.read_text())
+        except ValueError:
+            logging.warning("Discarding unreadable cache entry %s", path)
+    value = compute()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _temp_sibling(path, ".tmp")
+    try:
+        tmp_path.write_text(json.dumps(value))
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return value
+
+
+def get_json(
+    url: str,
+    params: Optional[Mapping[str, object]] = None,
+    *,
+    session: Optional[requests.Session] = None,
+    timeout: float = 60,
+    ttl: Optional[float] = DEFAULT_TTL,
+) -> object:
+    """GET ``url`` and decode JSON, serving repeat requests from the disk cache."""
+
+    def fetch() -> object:
+        response = (session or SESSION).get(url, params=params, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    return cached_json(["GET", url, dict(params or {})], fetch, ttl=ttl)
+
+
+def download(
+    url: str,
+    dest: Optional[Path] = None,
+    *,
+    session: Optional[requests.Session] = None,
+    timeout: float = 300,
+    chunk_size: int = 1 << 20,
+) -> Path:
+    """Stream ``url`` to disk, revalidating an existing copy with ETag/Last-Modified."""
+    if dest is None:
+        name = Path(urlsplit(url).path).name or "download"
+        dest = CACHE_DIR / "files" / hashlib.sha256(url.encode()).hexdigest()[:16] / name
+    dest = Path(dest)
+    meta_path = dest.with_name(dest.name + ".meta.json")
+
+    headers = {}
+    if dest.exists() and meta_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text())
+        except ValueError:
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    with (session or SESSION).get(url, headers=headers, stream=True, timeout=timeout) as response:
+        if response.status_code == 304:
+            return dest
+        response.raise_for_status()
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _temp_sibling(dest, ".part")
+        try:
+            with tmp_path.open("wb") as handle:
+                for chunk in response.iter_content(chunk_size):
+                    handle.write(chunk)
+            tmp_path.replace(dest)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        meta = {"url": url, "etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}
+        meta_path.write_text(json.dumps(meta))
+    return dest
+
+
+__all__ = ["CACHE_DIR", "SESSION", "cached_json", "download", "get_json"]
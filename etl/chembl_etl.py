@@ -1,17 +1,44 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import chembl_webresource_client
 from chembl_webresource_client.new_client import new_client
 import pandas as pd
 
+from etl._http import SESSION, cached_json, get_json
+
+CLIENT_VERSION = getattr(chembl_webresource_client, "__version__", "unknown")
+ACTIVITY_URL = "https://www.ebi.ac.uk/chembl/api/data/activity.json"
+PAGE_SIZE = 1000
+MAX_WORKERS = 8
+
+def _fetch_activity_page(session, target_chembl_id, fields, offset):
+    params = {
+        'target_chembl_id': target_chembl_id,
+        'only': ','.join(fields),
+        'limit': PAGE_SIZE,
+        'offset': offset,
+    }
+    return get_json(ACTIVITY_URL, params, session=session)
+
 def get_chembl_bioactivity_for_target(target_chembl_id):
     """
     Fetches bioactivity data from ChEMBL for a specific target.
     """
     print(f"Fetching ChEMBL bioactivity data for target {target_chembl_id}...")
-    activity = new_client.activity
+    fields = ['molecule_chembl_id', 'activity_type', 'standard_value', 'standard_units', 'pchembl_value']
 
-    # Search for activities related to the target
-    res = activity.filter(target_chembl_id=target_chembl_id).only(['molecule_chembl_id', 'activity_type', 'standard_value', 'standard_units', 'pchembl_value'])
+    # Query the REST API directly at the maximum page size: the first page
+    # reports the total count, the remaining pages are fetched concurrently.
+    first = _fetch_activity_page(SESSION, target_chembl_id, fields, 0)
+    records = list(first.get('activities', []))
+    total = first.get('page_meta', {}).get('total_count') or 0
+    offsets = range(PAGE_SIZE, total, PAGE_SIZE)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        pages = pool.map(lambda offset: _fetch_activity_page(SESSION, target_chembl_id, fields, offset), offsets)
+        for page in pages:
+            records.extend(page.get('activities', []))
 
-    df = pd.DataFrame(res)
+    df = pd.DataFrame(records)
 
     print(f"Fetched {len(df)} bioactivity records from ChEMBL.")
     return df
@@ -21,8 +48,11 @@ def get_target_chembl_id(gene_name):
     Gets the ChEMBL ID for a given gene name.
     """
     print(f"Fetching ChEMBL ID for gene {gene_name}...")
-    target = new_client.target
-    res = target.filter(target_synonym__icontains=gene_name, target_type='SINGLE PROTEIN').only(['target_chembl_id'])
+    def fetch():
+        target = new_client.target
+        return list(target.filter(target_synonym__icontains=gene_name, target_type='SINGLE PROTEIN').only(['target_chembl_id']))
+
+    res = cached_json(["chembl", CLIENT_VERSION, "target", gene_name], fetch)
 
     if res:
         return res[0]['target_chembl_id']
@@ -1,9 +1,13 @@
 import zipfile
 import os
-import xmltodict
+import xml.etree.ElementTree as ET
+from multiprocessing import Pool
 import pandas as pd
 
-def extract_and_process_dailymed_data():
+TARGET_SECTIONS = {"ADVERSE REACTIONS", "WARNINGS AND PRECAUTIONS", "DOSAGE AND ADMINISTRATION"}
+SECTION_PATH = "./{*}component/{*}structuredBody/{*}component/{*}section"
+
+def extract_and_process_dailymed_data(processes=None):
     """
     Extracts the DailyMed data and processes the XML files.
     """
@@ -15,72 +19,70 @@ def extract_and_process_dailymed_data():
 
     print("Extracted DailyMed data.")
 
-    extracted_data = []
-
     # The zip file contains a 'prescription' directory with more zip files.
-    # We need to unzip those as well.
-    for root, dirs, files in os.walk("dailymed_data/prescription"):
-        for filename in files:
-            if filename.endswith(".zip"):
-                zip_path = os.path.join(root, filename)
-                with zipfile.ZipFile(zip_path, 'r') as inner_zip_ref:
-                    for inner_filename in inner_zip_ref.namelist():
-                        if inner_filename.endswith(".xml"):
-                            with inner_zip_ref.open(inner_filename) as xml_file:
-                                try:
-                                    xml_string = xml_file.read()
-                                    sections = parse_spl_document(xml_string)
-                                    if sections:
-                                        extracted_data.append(sections)
-                                except Exception as e:
-                                    print(f"Error processing {inner_filename}: {e}")
+    # Each inner zip is independent, so they are parsed across worker processes.
+    extracted_data = []
+    with Pool(processes) as pool:
+        for sections_list in pool.imap(_process_inner_zip, _iter_zip_paths("dailymed_data/prescription"), chunksize=16):
+            extracted_data.extend(sections_list)
 
     df = pd.DataFrame(extracted_data)
-    df.to_csv("dailymed_processed_data.csv", index=False)
-    print("Processed DailyMed data and saved to dailymed_processed_data.csv")
+    df.to_parquet("dailymed_processed_data.parquet", index=False)
+    print("Processed DailyMed data and saved to dailymed_processed_data.parquet")
+
+def _iter_zip_paths(root):
+    """
+    Yields zip archives below root using os.scandir, which avoids a stat call per entry.
+    """
+    if not os.path.isdir(root):
+        return
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_zip_paths(entry.path)
+            elif entry.name.endswith(".zip"):
+                yield entry.path
+
+def _process_inner_zip(zip_path):
+    """
+    Parses every SPL XML document in one inner zip archive.
+    """
+    results = []
+    with zipfile.ZipFile(zip_path, 'r') as inner_zip_ref:
+        for inner_filename in inner_zip_ref.namelist():
+            if inner_filename.endswith(".xml"):
+                with inner_zip_ref.open(inner_filename) as xml_file:
+                    try:
+                        sections = parse_spl_document(xml_file.read())
+                        if sections:
+                            results.append(sections)
+                    except Exception as e:
+                        print(f"Error processing {inner_filename}: {e}")
+    return results
 
 def parse_spl_document(xml_string):
     """
     Parses the SPL XML and extracts the "ADVERSE REACTIONS", "WARNINGS", and "DOSAGE AND ADMINISTRATION" sections.
     """
-    data_dict = xmltodict.parse(xml_string)
+    root = ET.fromstring(xml_string)
 
     sections = {}
 
-    try:
-        components = data_dict['document']['component']['structuredBody']['component']
-        if not isinstance(components, list):
-            components = [components]
-
-        for component in components:
-            section = component.get('section', {})
-            if not section:
-                continue
-
-            title = section.get('title')
-            if isinstance(title, dict):
-                title = title.get('#text')
-
-            if title and title.strip().upper() in ["ADVERSE REACTIONS", "WARNINGS AND PRECAUTIONS", "DOSAGE AND ADMINISTRATION"]:
-                text_content = []
-                text_element = section.get('text', {})
-
-                if isinstance(text_element, dict):
-                    paragraphs = text_element.get('paragraph', [])
-                    if not isinstance(paragraphs, list):
-                        paragraphs = [paragraphs]
-                    for p in paragraphs:
-                        if p: # Check if paragraph is not None
-                            if isinstance(p, dict):
-                                text_content.append(p.get('#text', ''))
-                            else:
-                                text_content.append(str(p))
+    for section in root.iterfind(SECTION_PATH):
+        title_element = section.find("{*}title")
+        title = "".join(title_element.itertext()) if title_element is not None else None
 
+        if title and title.strip().upper() in TARGET_SECTIONS:
+            text_content = []
+            text_element = section.find("{*}text")
 
-                sections[title.strip()] = " ".join(text_content)
+            if text_element is not None:
+                for p in text_element.iterfind("{*}paragraph"):
+                    paragraph = "".join(p.itertext())
+                    if paragraph:
+                        text_content.append(paragraph)
 
-    except (KeyError, TypeError):
-        pass # Handle cases where the structure is different
+            sections[title.strip()] = " ".join(text_content)
 
     return sections
 
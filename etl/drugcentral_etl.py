@@ -1,7 +1,8 @@
 import pandas as pd
-import requests
 import gzip
-import io
+from pyarrow import csv as pacsv
+
+from etl._http import SESSION
 
 def get_drugcentral_interactions():
     """
@@ -9,13 +10,16 @@ def get_drugcentral_interactions():
     """
     url = "https://unmtid-dbs.net/download/DrugCentral/2021_09_01/drug.target.interaction.tsv.gz"
     print("Fetching DrugCentral drug-target interaction data...")
-    response = requests.get(url)
-    response.raise_for_status()
+    with SESSION.get(url, stream=True, timeout=300) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
 
-    # The file is a gzipped tsv file
-    with gzip.open(io.BytesIO(response.content), 'rt') as f:
-        df = pd.read_csv(f, sep='	')
+        # The file is a gzipped tsv file; decompress the stream straight into
+        # Arrow's multithreaded CSV reader instead of buffering the download.
+        with gzip.GzipFile(fileobj=response.raw) as f:
+            table = pacsv.read_csv(f, parse_options=pacsv.ParseOptions(delimiter='\t'))
 
+    df = table.to_pandas()
     print(f"Fetched {len(df)} interactions from DrugCentral.")
     return df
 
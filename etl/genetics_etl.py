@@ -1,117 +1,114 @@
 """Loaders for genetics evidence (OpenTargets, GWAS, DisGeNET)."""
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import List, Mapping, Optional
+from typing import Mapping, Optional, Sequence
 
 import pandas as pd
 
-DISEASE_GENE_COLUMNS = ["disease_id", "gene_id", "evidence_type", "score", "source", "evidence"]
+from etl._frames import assemble, coalesce, dumps_json, json_records, present, read_delimited
 
+DISEASE_GENE_COLUMNS = ["disease_id", "gene_id", "evidence_type", "score", "source", "evidence"]
 
-def _read_table(path: Optional[str | Path]) -> pd.DataFrame:
+# Identifier aliases per source; read as text so numeric-looking ids keep their spelling.
+OPENTARGETS_DISEASE = ["diseaseId", "disease_id"]
+OPENTARGETS_GENE = ["targetId", "gene_id"]
+GWAS_DISEASE = ["trait_id", "disease_id", "efo_id"]
+GWAS_GENE = ["gene_id", "ensembl_id"]
+DISGENET_DISEASE = ["diseaseId", "disease_id"]
+DISGENET_GENE = ["geneId", "gene_id"]
+# The association exports are wide; only these columns are decoded.
+OPENTARGETS_COLUMNS = [*OPENTARGETS_DISEASE, *OPENTARGETS_GENE, "datatypeId", "data_source", "association_score",
+                       "overallScore", "score"]
+
+
+def _read_table(
+    path: Optional[str | Path], text_columns: Sequence[str] = (), columns: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
     if path is None:
         return pd.DataFrame()
     file_path = Path(path)
     if not file_path.exists():
         return pd.DataFrame()
-    sep = "\t" if file_path.suffix.lower() in {".tsv", ".txt"} else ","
-    return pd.read_csv(file_path, sep=sep)
+    return read_delimited(file_path, text_columns, columns)
+
+
+def _finalise(disease: pd.Series, gene: pd.Series, frame: Mapping[str, object]) -> pd.DataFrame:
+    keep = present(disease) & present(gene)
+    result = assemble(
+        {"disease_id": disease.astype(str), "gene_id": gene.astype(str), **frame},
+        keep,
+        DISEASE_GENE_COLUMNS,
+    )
+    result.drop_duplicates(subset=["disease_id", "gene_id", "evidence_type"], inplace=True)
+    return result.reset_index(drop=True)
 
 
 def load_opentargets(path: Optional[str | Path]) -> pd.DataFrame:
-    df = _read_table(path)
+    df = _read_table(path, [*OPENTARGETS_DISEASE, *OPENTARGETS_GENE], OPENTARGETS_COLUMNS)
     if df.empty:
         return pd.DataFrame(columns=DISEASE_GENE_COLUMNS)
 
-    records: List[Mapping[str, object]] = []
-    for record in df.to_dict(orient="records"):
-        disease = record.get("diseaseId") or record.get("disease_id")
-        gene = record.get("targetId") or record.get("gene_id")
-        if not disease or not gene:
-            continue
-        score = record.get("overallScore") or record.get("score")
-        datatype = record.get("datatypeId") or record.get("data_source") or "opentargets"
-        evidence = {"data_type": datatype}
-        association_score = record.get("association_score")
-        if association_score is not None:
-            evidence["association_score"] = association_score
-        records.append(
-            {
-                "disease_id": str(disease),
-                "gene_id": str(gene),
-                "evidence_type": str(datatype),
-                "score": float(score) if pd.notna(score) else None,
-                "source": "OpenTargets",
-                "evidence": json.dumps(evidence),
-            }
-        )
-
-    result = pd.DataFrame(records, columns=DISEASE_GENE_COLUMNS)
-    result.drop_duplicates(subset=["disease_id", "gene_id", "evidence_type"], inplace=True)
-    return result
+    disease = coalesce(df, OPENTARGETS_DISEASE)
+    gene = coalesce(df, OPENTARGETS_GENE)
+    datatype = coalesce(df, ["datatypeId", "data_source"], default="opentargets").astype(str)
+    evidence = {"data_type": datatype}
+    if "association_score" in df.columns:
+        evidence["association_score"] = df["association_score"]
+    return _finalise(
+        disease,
+        gene,
+        {
+            "evidence_type": datatype,
+            "score": pd.to_numeric(coalesce(df, ["overallScore", "score"]), errors="coerce"),
+            "source": "OpenTargets",
+            "evidence": pd.Series(json_records(evidence), index=df.index),
+        },
+    )
 
 
 def load_gwas(path: Optional[str | Path]) -> pd.DataFrame:
-    df = _read_table(path)
+    df = _read_table(path, [*GWAS_DISEASE, *GWAS_GENE])
     if df.empty:
         return pd.DataFrame(columns=DISEASE_GENE_COLUMNS)
 
-    records: List[Mapping[str, object]] = []
-    for record in df.to_dict(orient="records"):
-        disease = record.get("trait_id") or record.get("disease_id") or record.get("efo_id")
-        gene = record.get("gene_id") or record.get("ensembl_id")
-        pval = record.get("p_value") or record.get("pvalue")
-        odds = record.get("odds_ratio") or record.get("or")
-        if not disease or not gene:
-            continue
-        evidence = {}
-        if pval is not None and pd.notna(pval):
-            evidence["p_value"] = float(pval)
-        if odds is not None and pd.notna(odds):
-            evidence["odds_ratio"] = float(odds)
-        records.append(
-            {
-                "disease_id": str(disease),
-                "gene_id": str(gene),
-                "evidence_type": "GWAS",
-                "score": float(record.get("beta")) if record.get("beta") is not None else None,
-                "source": "GWASCatalog",
-                "evidence": json.dumps(evidence) if evidence else json.dumps({}),
-            }
-        )
-    result = pd.DataFrame(records, columns=DISEASE_GENE_COLUMNS)
-    result.drop_duplicates(subset=["disease_id", "gene_id", "evidence_type"], inplace=True)
-    return result
+    disease = coalesce(df, GWAS_DISEASE)
+    gene = coalesce(df, GWAS_GENE)
+    evidence = {
+        "p_value": pd.to_numeric(coalesce(df, ["p_value", "pvalue"]), errors="coerce"),
+        "odds_ratio": pd.to_numeric(coalesce(df, ["odds_ratio", "or"]), errors="coerce"),
+    }
+    return _finalise(
+        disease,
+        gene,
+        {
+            "evidence_type": "GWAS",
+            "score": pd.to_numeric(coalesce(df, ["beta"]), errors="coerce"),
+            "source": "GWASCatalog",
+            "evidence": pd.Series(json_records(evidence), index=df.index),
+        },
+    )
 
 
 def load_disgenet(path: Optional[str | Path]) -> pd.DataFrame:
-    df = _read_table(path)
+    df = _read_table(path, [*DISGENET_DISEASE, *DISGENET_GENE])
     if df.empty:
         return pd.DataFrame(columns=DISEASE_GENE_COLUMNS)
 
-    records: List[Mapping[str, object]] = []
-    for record in df.to_dict(orient="records"):
-        disease = record.get("diseaseId") or record.get("disease_id")
-        gene = record.get("geneId") or record.get("gene_id")
-        if not disease or not gene:
-            continue
-        score = record.get("score") or record.get("DSI") or record.get("DPI")
-        evidence = {"source": record.get("source")}
-        records.append(
-            {
-                "disease_id": str(disease),
-                "gene_id": str(gene),
-                "evidence_type": "DisGeNET",
-                "score": float(score) if score is not None and pd.notna(score) else None,
-                "source": "DisGeNET",
-                "evidence": json.dumps(evidence),
-            }
-        )
-    result = pd.DataFrame(records, columns=DISEASE_GENE_COLUMNS)
-    result.drop_duplicates(subset=["disease_id", "gene_id", "evidence_type"], inplace=True)
-    return result
+    disease = coalesce(df, DISGENET_DISEASE)
+    gene = coalesce(df, DISGENET_GENE)
+    source = coalesce(df, ["source"])
+    evidence = [dumps_json({"source": value}) for value in source]
+    return _finalise(
+        disease,
+        gene,
+        {
+            "evidence_type": "DisGeNET",
+            "score": pd.to_numeric(coalesce(df, ["score", "DSI", "DPI"]), errors="coerce"),
+            "source": "DisGeNET",
+            "evidence": pd.Series(evidence, index=df.index),
+        },
+    )
 
 
 __all__ = ["load_opentargets", "load_gwas", "load_disgenet", "DISEASE_GENE_COLUMNS"]
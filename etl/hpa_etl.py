@@ -1,7 +1,7 @@
 import pandas as pd
-import requests
 import zipfile
-import io
+
+from etl._http import download
 
 def get_hpa_protein_atlas_data():
     """
@@ -9,11 +9,8 @@ def get_hpa_protein_atlas_data():
     """
     url = "https://www.proteinatlas.org/download/proteinatlas.tsv.zip"
     print("Fetching HPA proteinatlas.tsv data...")
-    response = requests.get(url)
-    response.raise_for_status()
-
-    # The file is a zip archive, so we need to extract it in memory
-    with zipfile.ZipFile(io.BytesIO(response.content)) as z:
+    # The zip archive is cached on disk and revalidated on later runs
+    with zipfile.ZipFile(download(url)) as z:
         # Find the .tsv file in the zip archive
         tsv_file_name = [name for name in z.namelist() if name.endswith('.tsv')][0]
         with z.open(tsv_file_name) as f:
@@ -31,31 +28,24 @@ def parse_and_filter_ocular_tissues(df):
     # The 'RNA tissue specific nTPM' column is a string of 'tissue:value;tissue:value;...'
     # We need to parse this string to extract the expression values for each tissue.
 
-    # Create a new DataFrame to store the parsed data
-    expression_data = []
-
-    for index, row in df.iterrows():
-        gene = row['Gene']
-        expression_string = row['RNA tissue specific nTPM']
-
-        if pd.isna(expression_string):
-            continue
-
-        tissues = expression_string.split(';')
-        for tissue in tissues:
-            try:
-                tissue_name, value = tissue.split(':')
-                if tissue_name.lower() in ocular_tissues:
-                    expression_data.append({
-                        'Gene': gene,
-                        'Tissue': tissue_name,
-                        'nTPM': float(value)
-                    })
-            except ValueError:
-                # Handle cases where the split doesn't produce two values
-                continue
-
-    ocular_df = pd.DataFrame(expression_data)
+    # Explode the pairs into one row each, then split and filter column-wise.
+    pairs = (
+        df[['Gene', 'RNA tissue specific nTPM']]
+        .dropna(subset=['RNA tissue specific nTPM'])
+        .assign(pair=lambda frame: frame['RNA tissue specific nTPM'].str.split(';'))
+        .explode('pair', ignore_index=True)
+    )
+    well_formed = pairs['pair'].str.count(':') == 1
+    parts = pairs['pair'].str.split(':', n=1, expand=True).reindex(columns=[0, 1])
+    is_ocular = parts[0].str.lower().isin(ocular_tissues)
+    values = pd.to_numeric(parts[1], errors='coerce')
+    keep = well_formed & is_ocular & values.notna()
+
+    ocular_df = pd.DataFrame({
+        'Gene': pairs.loc[keep, 'Gene'],
+        'Tissue': parts.loc[keep, 0],
+        'nTPM': values[keep],
+    }).reset_index(drop=True)
     print(f"Found {len(ocular_df)} records for ocular tissues.")
     return ocular_df
 
@@ -1,6 +1,6 @@
 import pandas as pd
-import requests
-import io
+
+from etl._http import download
 
 def get_iuphar_interactions():
     """
@@ -8,11 +8,8 @@ def get_iuphar_interactions():
     """
     url = "https://www.guidetopharmacology.org/DATA/interactions.tsv"
     print("Fetching IUPHAR/BPS interaction data...")
-    response = requests.get(url)
-    response.raise_for_status()
-
-    # The file is a tsv file
-    df = pd.read_csv(io.StringIO(response.text), sep='	')
+    # The file is a tsv file; the local copy is revalidated rather than re-downloaded
+    df = pd.read_csv(download(url), sep='	')
 
     print(f"Fetched {len(df)} interactions from IUPHAR/BPS.")
     return df
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import mmap
+import os
 import re
 import shutil
-from collections import defaultdict, deque
+import tempfile
+from collections import deque
 from datetime import date
+from itertools import chain
 from pathlib import Path
 from typing import Dict, Iterable, Mapping, Sequence, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
+from etl._frames import write_table
+
 DEFAULT_OUTPUT_ROOT = Path("data/ontology")
 
 DEFAULT_OCULAR_ROOTS = {
@@ -22,52 +30,115 @@ DEFAULT_OCULAR_ROOTS = {
     "HP:0000615": "lacrimal_system",
 }
 
-def parse_obo(filename, allowed_prefixes):
+SUBGRAPH_COLUMNS = ["root_id", "root_scope", "phenotype_id"]
+
+# Part of every cache key below; bump when parse_obo or the descendant closure changes output.
+CACHE_VERSION = "2"
+
+OBO_KEYS = ("id", "name", "synonym", "xref", "is_a")
+_ANY_KEY_LINE = re.compile(r"^([^:]+?)\s*:\s*(.*)$")
+
+
+def _key_line_pattern(wanted_keys: Iterable[str] | None) -> re.Pattern:
+    if wanted_keys is None:
+        return _ANY_KEY_LINE
+    keys = "|".join(re.escape(key) for key in wanted_keys)
+    return re.compile(rf"^({keys})\s*:\s*(.*)$")
+
+
+def parse_obo(filename, allowed_prefixes, wanted_keys: Iterable[str] | None = OBO_KEYS):
     """
     Parses an OBO file, yielding only the terms that match the allowed prefixes.
+
+    Only ``wanted_keys`` tags are kept (all tags when ``None``). The file is
+    memory-mapped and scanned as bytes, so unwanted lines are rejected by a
+    ``bytes.startswith`` check before any decoding or regex work.
     """
-    with open(filename, 'r', encoding='utf-8') as f:
-        term = {}
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            if line == '[Term]':
-                if term:
-                    # Check if the term's ID has one of the allowed prefixes
-                    term_id = term.get('id', [None])[0]
-                    if term_id and any(term_id.startswith(p) for p in allowed_prefixes):
+    allowed_prefixes = tuple(allowed_prefixes)
+    pattern = _key_line_pattern(wanted_keys)
+    line_prefixes = (b"[",) + tuple(key.encode() for key in wanted_keys) if wanted_keys is not None else b""
+    term = None
+
+    def accept(candidate):
+        ids = candidate.get('id') if candidate else None
+        return bool(ids) and ids[0].startswith(allowed_prefixes)
+
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for raw in iter(mapped.readline, b""):
+                if not raw.startswith(line_prefixes):
+                    continue
+                line = raw.decode('utf-8').strip()
+                if not line:
+                    continue
+                if line[0] == '[':
+                    # A stanza header closes the current term; only [Term] opens a new one.
+                    if accept(term):
                         yield term
-                term = {}
-            elif ':' in line:
-                key, value = line.split(':', 1)
-                if key.strip() not in term:
-                    term[key.strip()] = []
-                term[key.strip()].append(value.strip())
-    if term:
-        term_id = term.get('id', [None])[0]
-        if term_id and any(term_id.startswith(p) for p in allowed_prefixes):
-            yield term
-
-
-def _extract_hpo_relationships(phenotype_terms):
-    """Return parent/child maps for the supplied HPO terms."""
-    parents = defaultdict(set)
-    for term in phenotype_terms:
-        term_id = term.get("id", [None])[0]
-        if not term_id:
-            continue
-        for rel in term.get("is_a", []):
-            parent_id = rel.split("!")[0].strip()
-            if parent_id.startswith("HP"):
-                parents[term_id].add(parent_id)
+                    term = {} if line == '[Term]' else None
+                elif term is not None:
+                    match = pattern.match(line)
+                    if match:
+                        term.setdefault(match.group(1), []).append(match.group(2))
+    if accept(term):
+        yield term
+
 
-    children = defaultdict(set)
-    for child_id, parent_set in parents.items():
-        for parent_id in parent_set:
-            children[parent_id].add(child_id)
+def _write_atomic(path: Path, write) -> None:
+    """Run ``write(tmp_path)`` on a unique sibling, then move it over ``path`` in one step.
 
-    return parents, children
+    An interrupted write leaves only the temp file, never a truncated cache entry at ``path``.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False) as handle:
+        tmp_path = Path(handle.name)
+    try:
+        write(tmp_path)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def obo_frame(
+    filename: Path,
+    allowed_prefixes: Sequence[str],
+    wanted_keys: Sequence[str] = OBO_KEYS,
+    cache_dir: Path | None = None,
+) -> pd.DataFrame:
+    """Return the parsed terms as one list-valued column per tag.
+
+    With ``cache_dir`` the table is memoised as Parquet, keyed by ``CACHE_VERSION``, the
+    file's mtime/size and the filter arguments, so unchanged OBOs are not reparsed.
+    """
+    filename = Path(filename)
+    wanted_keys = list(wanted_keys)
+    cache_path = None
+    if cache_dir is not None:
+        stat = filename.stat()
+        key = json.dumps([CACHE_VERSION, stat.st_mtime_ns, stat.st_size, list(allowed_prefixes), wanted_keys])
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        cache_path = Path(cache_dir) / f"{filename.stem}-{digest}.parquet"
+        if cache_path.exists():
+            return pd.read_parquet(cache_path)
+
+    terms = parse_obo(filename, allowed_prefixes, wanted_keys=wanted_keys)
+    frame = pd.DataFrame.from_records(
+        ({key: term.get(key) for key in wanted_keys} for term in terms), columns=wanted_keys
+    )
+    if cache_path is not None:
+        _write_atomic(cache_path, lambda tmp_path: frame.to_parquet(tmp_path, index=False))
+    return frame
+
+
+def _hpo_children(terms: pd.DataFrame) -> Dict[str, Set[str]]:
+    """Return the parent -> children map from the ``is_a`` edges of HPO terms."""
+    edges = pd.DataFrame({"child": terms["id"].str[0], "is_a": terms["is_a"]}).explode("is_a")
+    edges["parent"] = edges["is_a"].str.split("!").str[0].str.strip()
+    edges = edges[edges["child"].notna() & edges["parent"].str.startswith("HP", na=False)]
+    return edges.groupby("parent", sort=False)["child"].agg(set).to_dict()
 
 
 def _collect_descendants(children: Mapping[str, Set[str]], root_ids: Iterable[str]) -> Set[str]:
@@ -87,6 +158,41 @@ def _collect_descendants(children: Mapping[str, Set[str]], root_ids: Iterable[st
     return visited
 
 
+def _children_csr(children: Mapping[str, Set[str]]) -> Tuple[list, Dict[str, int], np.ndarray, np.ndarray]:
+    """Flatten the child map into dense ids plus CSR ``(indptr, indices)`` arrays."""
+    nodes = list(dict.fromkeys(chain(children, chain.from_iterable(children.values()))))
+    index = {node: i for i, node in enumerate(nodes)}
+    counts = np.zeros(len(nodes) + 1, dtype=np.int64)
+    for parent, kids in children.items():
+        counts[index[parent] + 1] = len(kids)
+    indptr = np.cumsum(counts)
+    indices = np.fromiter(
+        (index[child] for parent in nodes for child in children.get(parent, ())),
+        dtype=np.int32,
+        count=int(indptr[-1]),
+    )
+    return nodes, index, indptr, indices
+
+
+def _descendants_csr(indptr: np.ndarray, indices: np.ndarray, root: int) -> np.ndarray:
+    """Level-synchronous traversal over CSR arrays; returns a visited mask."""
+    visited = np.zeros(len(indptr) - 1, dtype=bool)
+    visited[root] = True
+    frontier = np.array([root], dtype=np.int64)
+    while frontier.size:
+        starts = indptr[frontier]
+        lengths = indptr[frontier + 1] - starts
+        total = int(lengths.sum())
+        if not total:
+            break
+        # Gather every child slice of the frontier in one fancy-index.
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+        reached = indices[offsets]
+        frontier = np.unique(reached[~visited[reached]])
+        visited[frontier] = True
+    return visited
+
+
 def build_ocular_descendants(
     children: Mapping[str, Set[str]],
     ocular_roots: Mapping[str, str] | None = None,
@@ -94,40 +200,131 @@ def build_ocular_descendants(
     """Return the descendant sets for each ocular root."""
 
     roots = ocular_roots or DEFAULT_OCULAR_ROOTS
-    return {root: _collect_descendants(children, {root}) for root in roots}
+    nodes, index, indptr, indices = _children_csr(children)
+    descendants: Dict[str, Set[str]] = {}
+    for root in roots:
+        if root not in index:
+            descendants[root] = {root}
+            continue
+        visited = _descendants_csr(indptr, indices, index[root])
+        descendants[root] = {nodes[i] for i in np.flatnonzero(visited)}
+    return descendants
+
+
+def hpo_ocular_descendants(
+    hp_path: Path,
+    ocular_roots: Mapping[str, str] | None = None,
+    cache_dir: Path | None = None,
+) -> Dict[str, Set[str]]:
+    """Return :func:`build_ocular_descendants` for ``hp_path``'s ``is_a`` closure.
+
+    The terms are always read from ``hp_path`` itself (through the :func:`obo_frame` cache),
+    so the result depends only on what the key covers. With ``cache_dir`` the sets are
+    memoised as JSON, keyed by ``CACHE_VERSION``, the file's mtime/size and the roots.
+    """
+    hp_path = Path(hp_path)
+    roots = ocular_roots or DEFAULT_OCULAR_ROOTS
+    cache_path = None
+    if cache_dir is not None:
+        stat = hp_path.stat()
+        key = json.dumps([CACHE_VERSION, stat.st_mtime_ns, stat.st_size, sorted(roots)])
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        cache_path = Path(cache_dir) / f"{hp_path.stem}-descendants-{digest}.json"
+        if cache_path.exists():
+            return {root: set(ids) for root, ids in json.loads(cache_path.read_text()).items()}
+
+    hpo_terms = obo_frame(hp_path, ["HP"], wanted_keys=("id", "name", "is_a"), cache_dir=cache_dir)
+    descendants = build_ocular_descendants(_hpo_children(hpo_terms), roots)
+    if cache_path is not None:
+        payload = json.dumps({root: sorted(ids) for root, ids in descendants.items()})
+        _write_atomic(cache_path, lambda tmp_path: tmp_path.write_text(payload))
+    return descendants
 
 
 def annotate_phenotypes(
     phenotype_df: pd.DataFrame,
     ocular_descendants: Mapping[str, Set[str]],
     ocular_roots: Mapping[str, str] | None = None,
-) -> Tuple[pd.DataFrame, Sequence[Dict[str, str]]]:
-    """Annotate the phenotype dataframe with ocular scope metadata."""
+    as_frame: bool = False,
+) -> Tuple[pd.DataFrame, pd.DataFrame | Sequence[Dict[str, str]]]:
+    """Annotate the phenotype dataframe with ocular scope metadata.
+
+    The root/phenotype subgraph is returned as a list of row dicts, or as a
+    DataFrame when ``as_frame`` is set.
+    """
 
     roots = ocular_roots or DEFAULT_OCULAR_ROOTS
 
-    ocular_phenotypes: Set[str] = set().union(*ocular_descendants.values())
+    ids = phenotype_df["id"]
+    no_match = np.zeros(len(ids), dtype=bool)
+    id_index = pd.Index(ids)
+    if id_index.is_unique:
+        # Hash the phenotype ids once; each root then only looks up its own descendants
+        # and scatters them into a dense row mask, instead of re-probing every id per root.
+        masks = {}
+        for root, descendants in ocular_descendants.items():
+            positions = id_index.get_indexer(list(descendants))
+            mask = no_match.copy()
+            mask[positions[positions >= 0]] = True
+            masks[root] = mask
+    else:
+        masks = {root: ids.isin(descendants).to_numpy() for root, descendants in ocular_descendants.items()}
+
+    # One boolean mask per distinct scope, then comma-join the scopes in sorted order.
+    scope_masks: Dict[str, np.ndarray] = {}
+    for root, scope in roots.items():
+        scope_masks[scope] = scope_masks.get(scope, no_match) | masks.get(root, no_match)
+    ocular_scope = pd.Series("", index=phenotype_df.index, dtype=object)
+    for scope in sorted(scope_masks):
+        mask = scope_masks[scope]
+        ocular_scope[mask] = np.where(ocular_scope[mask] == "", scope, ocular_scope[mask] + "," + scope)
+
+    phenotype_df = phenotype_df.assign(
+        is_ocular=np.logical_or.reduce(list(masks.values())) if masks else no_match,
+        ocular_scope=ocular_scope,
+    )
 
-    def infer_scope(hpo_id: str) -> str:
-        scopes = [scope for root, scope in roots.items() if hpo_id in ocular_descendants[root]]
-        return ",".join(sorted(set(scopes))) if scopes else ""
+    frames = [
+        pd.DataFrame(
+            {
+                "root_id": root_id,
+                "root_scope": scope,
+                "phenotype_id": sorted(ocular_descendants.get(root_id, set())),
+            },
+            columns=SUBGRAPH_COLUMNS,
+        )
+        for root_id, scope in roots.items()
+    ]
+    subgraph = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=SUBGRAPH_COLUMNS)
 
-    phenotype_df = phenotype_df.copy()
-    phenotype_df["is_ocular"] = phenotype_df["id"].isin(ocular_phenotypes)
-    phenotype_df["ocular_scope"] = phenotype_df["id"].apply(infer_scope)
+    return phenotype_df, subgraph if as_frame else subgraph.to_dict("records")
+
+
+def clean_xrefs(xrefs: pd.Series) -> pd.Series:
+    """Keep the identifier before the first space, dropping xrefs that start with one."""
+    cleaned = xrefs.astype(object).str.split(" ", n=1).str[0]
+    return cleaned[cleaned.str.len() > 0]
+
+
+def _join_by_owner(values: pd.Series, owners: pd.Index) -> pd.Series:
+    """Pipe-join values grouped by their integer owner index, aligned to ``owners``."""
+    if values.empty:
+        return pd.Series("", index=owners, dtype=object)
+    return values.groupby(level=0, sort=False).agg("|".join).reindex(owners, fill_value="")
 
-    subgraph_rows = []
-    for root_id, scope in roots.items():
-        for phenotype_id in sorted(ocular_descendants.get(root_id, set())):
-            subgraph_rows.append(
-                {
-                    "root_id": root_id,
-                    "root_scope": scope,
-                    "phenotype_id": phenotype_id,
-                }
-            )
 
-    return phenotype_df, subgraph_rows
+def normalize_external_ids(ids: pd.Series) -> pd.Series:
+    """Canonicalise OMIM/ORPHA identifiers (zero-padded OMIM, unpadded ORPHA)."""
+    text = ids.where(ids.map(lambda value: isinstance(value, str)))
+    text = text.str.strip().str.replace("OMIMPS:", "OMIM:", regex=False)
+    number = text.str.split(":").str[1]
+    numeric = number.str.isdigit().eq(True)
+    omim = text.str.startswith("OMIM:", na=False) & numeric
+    orpha = text.str.startswith("ORPHA:", na=False) & numeric
+    text = text.astype(object)
+    text[omim] = "OMIM:" + number[omim].str.zfill(6)
+    text[orpha] = "ORPHA:" + number[orpha].astype(int).astype(str)
+    return text
 
 
 def build_manifest(
@@ -164,11 +361,24 @@ def build_manifest(
     return manifest
 
 
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link ``src`` to ``dst``, copying only when linking is not possible.
+
+    Safe because ``write_table`` and the manifest writer unlink a path before writing it,
+    so a rerun never truncates an inode that ``latest/`` still shares.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 def process_ontologies(
     ontology_dir: Path | str = Path("."),
     output_root: Path | str = DEFAULT_OUTPUT_ROOT,
     release: str | None = None,
     ensure_latest_copy: bool = True,
+    cache_dir: Path | str | None = None,
 ):
     """
     Processes the MONDO, DOID, and HPO ontologies to create structured tables
@@ -192,108 +402,105 @@ def process_ontologies(
         "hpo_annotations": str((ontology_dir / "phenotype.hpoa").resolve()),
     }
 
-    disease_terms = list(
-        parse_obo(ontology_dir / "mondo.obo", ["MONDO", "DOID"])
-    ) + list(parse_obo(ontology_dir / "doid.obo", ["MONDO", "DOID"]))
-
-    diseases_data = []
-    for term in disease_terms:
-        # Additional check to ensure we only process disease terms
-        if 'id' in term and (term['id'][0].startswith("MONDO") or term['id'][0].startswith("DOID")):
-            synonyms = "|".join([s.split('"')[1] for s in term.get('synonym', []) if '"' in s])
-
-            clean_xrefs = []
-            for xref in term.get('xref', []):
-                match = re.match(r'([^ ]+)', xref)
-                if match:
-                    clean_xrefs.append(match.group(1))
-
-            diseases_data.append({
-                'id': term['id'][0],
-                'name': term['name'][0],
-                'synonyms': synonyms,
-                'xrefs': "|".join(clean_xrefs)
-            })
+    cache_dir = Path(cache_dir) if cache_dir is not None else output_root / "_cache"
+    disease_terms = pd.concat(
+        [
+            obo_frame(ontology_dir / "mondo.obo", ["MONDO", "DOID"], cache_dir=cache_dir),
+            obo_frame(ontology_dir / "doid.obo", ["MONDO", "DOID"], cache_dir=cache_dir),
+        ],
+        ignore_index=True,
+    )
+
+    # Explode synonyms/xrefs into (term index, raw value) pairs.
+    disease_ids = disease_terms["id"].str[0]
+    disease_names = disease_terms["name"].str[0]
+    synonym_raw = disease_terms["synonym"].explode().dropna()
+    xref_raw = disease_terms["xref"].explode().dropna()
+
+    terms_index = pd.RangeIndex(len(disease_ids))
+    synonyms = synonym_raw.astype(object).str.extract(r'^[^"]*"([^"]*)', expand=False)
+    xrefs = clean_xrefs(xref_raw)
+    diseases_data = {
+        'id': disease_ids,
+        'name': disease_names,
+        'synonyms': _join_by_owner(synonyms.dropna(), terms_index),
+        'xrefs': _join_by_owner(xrefs, terms_index),
+    }
 
     disease_df = pd.DataFrame(diseases_data)
     disease_df = disease_df.drop_duplicates(subset='id', keep='first')
     disease_path = output_dir / "disease.csv"
-    disease_df.to_csv(disease_path, index=False)
+    write_table(disease_df, disease_path)
     print(f"Created {disease_path} with {len(disease_df):,} records.")
 
     # --- Create phenotype table (from HPO only) ---
-    phenotype_terms = list(parse_obo(ontology_dir / "hp.obo", ["HP"]))
-    phenotypes_data = []
-    for term in phenotype_terms:
-        if 'id' in term and term['id'][0].startswith("HP"):
-            phenotypes_data.append({
-                'id': term['id'][0],
-                'name': term['name'][0]
-            })
-
-    parents, children = _extract_hpo_relationships(phenotype_terms)
-    ocular_descendants = build_ocular_descendants(children)
+    hpo_terms = obo_frame(ontology_dir / "hp.obo", ["HP"], wanted_keys=("id", "name", "is_a"), cache_dir=cache_dir)
+    ocular_descendants = hpo_ocular_descendants(ontology_dir / "hp.obo", cache_dir=cache_dir)
 
-    phenotype_df = pd.DataFrame(phenotypes_data)
-    phenotype_df, subgraph_rows = annotate_phenotypes(phenotype_df, ocular_descendants)
+    phenotype_df = pd.DataFrame({'id': hpo_terms["id"].str[0], 'name': hpo_terms["name"].str[0]})
+    phenotype_df, subgraph_df = annotate_phenotypes(phenotype_df, ocular_descendants, as_frame=True)
 
     phenotype_path = output_dir / "phenotype.csv"
-    phenotype_df.to_csv(phenotype_path, index=False)
+    write_table(phenotype_df, phenotype_path)
     print(
         "Created %s with %s records (ocular phenotypes: %s)."
         % (phenotype_path, f"{len(phenotype_df):,}", f"{phenotype_df['is_ocular'].sum():,}")
     )
 
     ocular_pheno_path = output_dir / "ocular_phenotypes.csv"
-    phenotype_df.loc[phenotype_df["is_ocular"]].to_csv(ocular_pheno_path, index=False)
+    write_table(phenotype_df.loc[phenotype_df["is_ocular"]], ocular_pheno_path)
     print(f"Saved ocular-specific phenotype annotations to {ocular_pheno_path}.")
 
     ocular_subgraph_path = output_dir / "ocular_subgraphs.csv"
-    pd.DataFrame(subgraph_rows).to_csv(ocular_subgraph_path, index=False)
+    write_table(subgraph_df, ocular_subgraph_path)
     print(f"Saved ocular scope subgraph relationships to {ocular_subgraph_path}.")
 
     # --- Build the external to internal lookup table ---
     print("Building external ID to internal disease ID lookup table...")
 
-    def normalize(ext_id):
-        if not isinstance(ext_id, str): return None
-        ext_id = ext_id.strip().replace("OMIMPS:", "OMIM:")
-        if ext_id.startswith("OMIM:"):
-            parts = ext_id.split(':')
-            if len(parts) > 1 and parts[1].isdigit():
-                return f"OMIM:{parts[1].zfill(6)}"
-        if ext_id.startswith("ORPHA:"):
-            parts = ext_id.split(':')
-            if len(parts) > 1 and parts[1].isdigit():
-                return f"ORPHA:{int(parts[1])}"
-        return ext_id
-
-    ext2disease = {}
-    for row in disease_df.itertuples():
-        key = normalize(row.id)
-        if key not in ext2disease: ext2disease[key] = row.id
-        if pd.notna(row.xrefs):
-            for ext in row.xrefs.split('|'):
-                key = normalize(ext)
-                if key and key not in ext2disease: ext2disease[key] = row.id
+    ids = disease_df["id"]
+    xrefs = disease_df["xrefs"].fillna("").str.split("|").explode()
+    xrefs = xrefs[xrefs != ""]
+    position = pd.Series(np.arange(len(ids)), index=ids.index)
+    candidates = pd.DataFrame(
+        {
+            "key": pd.concat([normalize_external_ids(ids), normalize_external_ids(xrefs)], ignore_index=True),
+            "disease_id": pd.concat([ids, ids.loc[xrefs.index]], ignore_index=True),
+            "row": np.concatenate([position.to_numpy(), position.loc[xrefs.index].to_numpy()]),
+            "is_xref": np.repeat([False, True], [len(ids), len(xrefs)]),
+        }
+    )
+    # First occurrence wins, scanning each disease's own id before its xrefs, in file order.
+    candidates = candidates[candidates["key"].notna() & (candidates["key"] != "")]
+    candidates = candidates.sort_values(["row", "is_xref"], kind="stable").drop_duplicates("key", keep="first")
+    ext2disease = pd.Series(candidates["disease_id"].to_numpy(), index=candidates["key"].to_numpy())
 
     print(f"Lookup table created with {len(ext2disease):,} entries.")
 
-    # --- Analyze phenotype.hpoa using the lookup dictionary ---
+    # --- Analyze phenotype.hpoa using the lookup table ---
     print("Processing phenotype.hpoa to create disease-phenotype bridge...")
 
     hpoa = pd.read_csv(
         ontology_dir / "phenotype.hpoa", sep="\t", skiprows=4, header=0,
         names=["database_id", "disease_name", "qualifier", "hpo_id", "reference", "evidence", "onset", "frequency", "sex", "modifier", "aspect", "biocuration"],
-        dtype=str
-    )[lambda x: (x["qualifier"] != "NOT") & x["hpo_id"].notna()].copy()
-
-    hpoa["disease_id"] = hpoa["database_id"].apply(lambda db_id: ext2disease.get(normalize(db_id)))
-    hpoa["phenotype_id"] = hpoa["hpo_id"].str.strip()
+        usecols=["database_id", "qualifier", "hpo_id"],
+        dtype={"database_id": "category", "qualifier": "category", "hpo_id": "category"},
+    )
+    hpoa = hpoa[(hpoa["qualifier"] != "NOT") & hpoa["hpo_id"].notna()]
+
+    # Normalise and look up each distinct category once; Series.map on a categorical
+    # maps the categories and broadcasts the result through the codes.
+    database_ids = hpoa["database_id"].cat.categories
+    disease_by_id = normalize_external_ids(pd.Series(database_ids, index=database_ids, dtype=object)).map(ext2disease)
+    hpo_ids = hpoa["hpo_id"].cat.categories
+    hpoa = hpoa.assign(
+        disease_id=hpoa["database_id"].map(disease_by_id),
+        phenotype_id=hpoa["hpo_id"].map(pd.Series(hpo_ids.str.strip(), index=hpo_ids)),
+    )
 
     bridge = hpoa.dropna(subset=["disease_id"])[["disease_id", "phenotype_id"]].drop_duplicates()
     bridge_path = output_dir / "disease_phenotype.csv"
-    bridge.to_csv(bridge_path, index=False)
+    write_table(bridge, bridge_path)
     print(f"Created {bridge_path} with {len(bridge):,} records.")
 
     manifest = build_manifest(
@@ -306,14 +513,17 @@ def process_ontologies(
     )
 
     manifest_path = output_dir / "manifest.json"
+    manifest_path.unlink(missing_ok=True)  # may be hard-linked into latest/
     manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
     print(f"Wrote ontology manifest to {manifest_path}.")
 
     if ensure_latest_copy:
         latest_dir = output_root / "latest"
-        if latest_dir.exists():
+        if latest_dir.is_symlink():
+            latest_dir.unlink()
+        elif latest_dir.exists():
             shutil.rmtree(latest_dir)
-        shutil.copytree(output_dir, latest_dir)
+        shutil.copytree(output_dir, latest_dir, copy_function=_link_or_copy)
         print(f"Updated latest ontology snapshot at {latest_dir}.")
 
 if __name__ == "__main__":
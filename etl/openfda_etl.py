@@ -1,24 +1,38 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import requests
 
-def get_openfda_adverse_events(search_term):
+from etl._http import get_json
+
+BASE_URL = "https://api.fda.gov/drug/event.json"
+PAGE_SIZE = 1000  # openFDA's maximum page size
+MAX_WORKERS = 8
+
+def get_openfda_adverse_events(search_term, max_records=PAGE_SIZE):
     """
     Fetches adverse events from openFDA for a given search term.
     """
-    # Base URL for the openFDA drug event API
-    base_url = "https://api.fda.gov/drug/event.json"
+    search = f'patient.reaction.reactionmeddrapt:"{search_term}"'
 
-    # Parameters for the API request
-    params = {
-        'search': f'patient.reaction.reactionmeddrapt:"{search_term}"',
-        'limit': 1000
-    }
+    def fetch_page(skip):
+        params = {'search': search, 'limit': min(PAGE_SIZE, max_records - skip)}
+        if skip:
+            params['skip'] = skip
+        # Responses are cached on disk for a day so repeated runs skip the API.
+        try:
+            return get_json(BASE_URL, params).get('results', [])
+        except requests.HTTPError as exc:
+            # openFDA answers 404 once skip runs past the last matching report.
+            if skip and exc.response is not None and exc.response.status_code == 404:
+                return []
+            raise
 
     print("Fetching openFDA adverse events...")
-    response = requests.get(base_url, params=params)
-    response.raise_for_status()
-
-    results = response.json().get('results', [])
+    # Pages are requested concurrently over the shared keep-alive session.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        pages = list(pool.map(fetch_page, range(0, max_records, PAGE_SIZE)))
+    results = [report for page in pages for report in page]
 
     # Extract relevant data from the results
     adverse_events = []
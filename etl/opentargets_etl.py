@@ -1,8 +1,14 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
-import requests
 from pathlib import Path
-import pyarrow.parquet as pq
-from ftplib import FTP
+import pyarrow.dataset as ds
+
+from etl._http import SESSION, download
+
+BASE_URL = "https://ftp.ebi.ac.uk/pub/databases/opentargets/genetics/latest/d2v2g_scored/"
+MAX_WORKERS = 8
 
 def get_opentargets_associations():
     """
@@ -13,33 +19,24 @@ def get_opentargets_associations():
     data_dir = Path("opentargets_data")
     data_dir.mkdir(exist_ok=True)
 
-    # Get the list of files from the FTP server
-    ftp = FTP('ftp.ebi.ac.uk')
-    ftp.login()
-    ftp.cwd('pub/databases/opentargets/genetics/latest/d2v2g_scored')
-    filenames = ftp.nlst()
-    ftp.quit()
-
-    all_associations = []
-
-    for filename in filenames:
-        if filename.endswith(".parquet"):
-            url = f"https://ftp.ebi.ac.uk/pub/databases/opentargets/genetics/latest/d2v2g_scored/{filename}"
-
-            print(f"Downloading {filename}...")
-            response = requests.get(url)
-            response.raise_for_status()
+    # The EBI FTP tree is also served over HTTPS, so list it from the directory index
+    response = SESSION.get(BASE_URL, timeout=60)
+    response.raise_for_status()
+    filenames = sorted(set(re.findall(r'href="([^"/?]+\.parquet)"', response.text)))
 
-            filepath = data_dir / filename
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+    def fetch(filename):
+        print(f"Downloading {filename}...")
+        return str(download(BASE_URL + filename, dest=data_dir / filename))
 
-            print(f"Reading {filename}...")
-            df = pd.read_parquet(filepath)
-            all_associations.append(df)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        paths = list(pool.map(fetch, filenames))
 
-    # Concatenate all dataframes
-    associations_df = pd.concat(all_associations, ignore_index=True)
+    # Scan every part as one dataset so pyarrow decodes the files in parallel
+    # and the result is materialised once instead of via a pandas concat.
+    print(f"Reading {len(paths)} parquet files...")
+    table = ds.dataset(paths, format="parquet").to_table()
+    associations_df = table.to_pandas(self_destruct=True, split_blocks=True)
+    del table
 
     print(f"Fetched {len(associations_df)} associations from Open Targets.")
     return associations_df
@@ -1,10 +1,12 @@
 """Utility helpers to query the ocular disease scope derived from ontologies."""
 import argparse
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Tuple
 
 import pandas as pd
 
+from etl._frames import read_table, table_exists
+
 DEFAULT_QUERIES = [
     "AMD",
     "glaucoma",
@@ -15,7 +17,7 @@ DEFAULT_QUERIES = [
 
 
 def _require_files(paths: Iterable[Path]) -> None:
-    missing = [str(path) for path in paths if not path.exists()]
+    missing = [str(path) for path in paths if not table_exists(path)]
     if missing:
         raise FileNotFoundError(
             "The following prerequisite files are missing: " + ", ".join(missing)
@@ -31,52 +33,48 @@ def _load_tables(base_dir: Path) -> Dict[str, pd.DataFrame]:
     }
     _require_files(files.values())
 
-    return {name: pd.read_csv(path) for name, path in files.items()}
-
-
-def _build_hpo_maps(phenotype_df: pd.DataFrame, bridge_df: pd.DataFrame):
-    label_map = phenotype_df.set_index("id")["name"].to_dict()
-    ocular_flag = phenotype_df.set_index("id")["is_ocular"].to_dict()
-    scope_map = phenotype_df.set_index("id")["ocular_scope"].to_dict()
+    return {name: read_table(path) for name, path in files.items()}
 
-    disease_to_hpo: Dict[str, List[str]] = {}
-    for row in bridge_df.itertuples(index=False):
-        disease_to_hpo.setdefault(row.disease_id, []).append(row.phenotype_id)
 
-    return disease_to_hpo, label_map, ocular_flag, scope_map
+def _build_hpo_entries(phenotype_df: pd.DataFrame, bridge_df: pd.DataFrame) -> Dict[Tuple[str, bool], List[str]]:
+    """Format every bridged phenotype once, grouped by ``(disease_id, is_ocular)``."""
+    phenotypes = phenotype_df[["id", "name", "is_ocular", "ocular_scope"]].drop_duplicates("id", keep="last")
+    enriched = bridge_df[["disease_id", "phenotype_id"]].merge(
+        phenotypes, left_on="phenotype_id", right_on="id", how="left", validate="many_to_one"
+    )
 
+    hpo_id = enriched["phenotype_id"].astype(str)
+    label = enriched["name"].fillna("").astype(str)
+    scope = enriched["ocular_scope"].fillna("").astype(str)
+    entry = hpo_id.where(label.eq(""), hpo_id + " :: " + label)
+    entry = entry.where(scope.eq(""), entry + " [scope=" + scope + "]")
 
-def _format_hpo_list(hpo_ids: Iterable[str], label_map, ocular_flag, scope_map):
-    ocular_entries, other_entries = [], []
-    for hpo_id in hpo_ids:
-        label = label_map.get(hpo_id, "")
-        scope = scope_map.get(hpo_id, "")
-        entry = f"{hpo_id} :: {label}" if label else hpo_id
-        if scope:
-            entry += f" [scope={scope}]"
-        if ocular_flag.get(hpo_id, False):
-            ocular_entries.append(entry)
-        else:
-            other_entries.append(entry)
-    return ocular_entries, other_entries
+    is_ocular = enriched["is_ocular"].eq(True)
+    return entry.groupby([enriched["disease_id"], is_ocular], sort=False).agg(list).to_dict()
 
 
-def query_diseases(term: str, tables: Dict[str, pd.DataFrame], limit: int = 5) -> pd.DataFrame:
-    disease_df = tables["disease"].copy()
-    if "synonyms" not in disease_df:
-        disease_df["synonyms"] = ""
-    disease_df["synonyms"].fillna("", inplace=True)
+def _match_mask(disease_df: pd.DataFrame, term: str) -> Tuple[pd.Series, pd.Series]:
+    if "synonyms" in disease_df:
+        synonyms = disease_df["synonyms"].fillna("")
+    else:
+        synonyms = pd.Series("", index=disease_df.index, dtype=object)
 
     mask = (
         disease_df["name"].str.contains(term, case=False, na=False)
-        | disease_df["synonyms"].str.contains(term, case=False, na=False)
+        | synonyms.str.contains(term, case=False, na=False)
     )
-    result = disease_df[mask].copy()
+    return mask, synonyms
 
-    tagged_cols = tables["tagged"][
-        ["id", "is_ocular", "ocular_scopes", "tag_source"]
-    ].copy()
-    result = result.merge(tagged_cols, on="id", how="left")
+
+def query_diseases(term: str, tables: Dict[str, pd.DataFrame], limit: int = 5) -> pd.DataFrame:
+    disease_df = tables["disease"]
+    mask, synonyms = _match_mask(disease_df, term)
+
+    tagged_cols = tables["tagged"][["id", "is_ocular", "ocular_scopes", "tag_source"]]
+    # One tag row per disease id; a duplicate would silently repeat the matched diseases.
+    result = disease_df.loc[mask].assign(synonyms=synonyms[mask]).merge(
+        tagged_cols, on="id", how="left", validate="many_to_one"
+    )
 
     return result.head(limit)
 
@@ -84,9 +82,15 @@ def query_diseases(term: str, tables: Dict[str, pd.DataFrame], limit: int = 5) -
 def run_queries(queries: Iterable[str], limit: int = 5, base_dir: Path | None = None) -> None:
     base_dir = base_dir or Path("data/ontology/latest")
     tables = _load_tables(base_dir)
-    disease_to_hpo, label_map, ocular_flag, scope_map = _build_hpo_maps(
-        tables["phenotype"], tables["bridge"]
-    )
+    hpo_entries = _build_hpo_entries(tables["phenotype"], tables["bridge"])
+
+    # One case-insensitive pass with the alternation of every query narrows the
+    # disease table; each query then only rescans that small candidate set.
+    queries = list(queries)
+    if queries:
+        combined = "|".join(f"(?:{query})" for query in queries)
+        mask, _ = _match_mask(tables["disease"], combined)
+        tables = {**tables, "disease": tables["disease"].loc[mask]}
 
     tagged_info = tables["tagged"].set_index("id")
 
@@ -99,10 +103,8 @@ def run_queries(queries: Iterable[str], limit: int = 5, base_dir: Path | None =
 
         for row in matches.itertuples():
             disease_id = row.id
-            hpo_ids = disease_to_hpo.get(disease_id, [])
-            ocular_entries, other_entries = _format_hpo_list(
-                hpo_ids, label_map, ocular_flag, scope_map
-            )
+            ocular_entries = hpo_entries.get((disease_id, True), [])
+            other_entries = hpo_entries.get((disease_id, False), [])
 
             tag_row = tagged_info.loc[disease_id] if disease_id in tagged_info.index else None
             is_ocular = bool(tag_row["is_ocular"]) if tag_row is not None else False
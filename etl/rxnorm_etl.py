@@ -2,11 +2,15 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Mapping, Optional
+from typing import Optional
 
 import pandas as pd
 
+from etl._frames import assemble, coalesce, present, read_delimited
+
 DRUG_COLUMNS = ["drug_id", "preferred_name", "synonyms", "source"]
+# RXCUIs are numeric-looking identifiers; read them as text so they are never re-spelled.
+RXCUI_COLUMNS = ["RXCUI", "rxcui", "drug_id"]
 
 
 def _read_table(path: Optional[str | Path]) -> pd.DataFrame:
@@ -15,8 +19,7 @@ def _read_table(path: Optional[str | Path]) -> pd.DataFrame:
     file_path = Path(path)
     if not file_path.exists():
         return pd.DataFrame()
-    sep = "\t" if file_path.suffix.lower() in {".tsv", ".txt"} else ","
-    return pd.read_csv(file_path, sep=sep)
+    return read_delimited(file_path, RXCUI_COLUMNS)
 
 
 def load_rxnorm_drugs(path: Optional[str | Path]) -> pd.DataFrame:
@@ -24,26 +27,21 @@ def load_rxnorm_drugs(path: Optional[str | Path]) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame(columns=DRUG_COLUMNS)
 
-    records: List[Mapping[str, object]] = []
-    for record in df.to_dict(orient="records"):
-        rxcui = record.get("RXCUI") or record.get("rxcui") or record.get("drug_id")
-        name = record.get("STR") or record.get("name") or record.get("preferred_name")
-        if not rxcui or not name:
-            continue
-        synonyms = record.get("synonym") or record.get("SYNONYMS") or record.get("synonyms")
-        if isinstance(synonyms, list):
-            synonyms_text = ";".join(str(item) for item in synonyms)
-        else:
-            synonyms_text = str(synonyms) if synonyms else ""
-        records.append(
-            {
-                "drug_id": str(rxcui),
-                "preferred_name": str(name),
-                "synonyms": synonyms_text,
-                "source": "RxNorm",
-            }
-        )
-    result = pd.DataFrame(records, columns=DRUG_COLUMNS)
+    rxcui = coalesce(df, RXCUI_COLUMNS)
+    name = coalesce(df, ["STR", "name", "preferred_name"])
+    synonyms = coalesce(df, ["synonym", "SYNONYMS", "synonyms"], default="")
+    synonyms = synonyms.map(lambda value: ";".join(map(str, value)) if isinstance(value, list) else str(value))
+
+    result = assemble(
+        {
+            "drug_id": rxcui.astype(str),
+            "preferred_name": name.astype(str),
+            "synonyms": synonyms,
+            "source": "RxNorm",
+        },
+        present(rxcui) & present(name),
+        DRUG_COLUMNS,
+    )
     result.drop_duplicates(subset=["drug_id"], inplace=True)
     return result
 
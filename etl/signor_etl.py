@@ -1,6 +1,6 @@
 import pandas as pd
-import requests
-import io
+
+from etl._http import download
 
 def get_signor_interactions():
     """
@@ -8,13 +8,8 @@ def get_signor_interactions():
     """
     url = "https://signor.uniroma2.it/getData.php?organism=9606&format=tsv"
     print("Fetching SIGNOR interactions...")
-    response = requests.get(url)
-    response.raise_for_status()
-
-    # Use io.StringIO to treat the string content as a file
-    data = io.StringIO(response.text)
-
-    df = pd.read_csv(data, sep='	')
+    # The export is cached on disk and revalidated on later runs
+    df = pd.read_csv(download(url), sep='	')
     print(f"Fetched {len(df)} interactions from SIGNOR.")
     return df
 
@@ -1,21 +1,32 @@
 import pandas as pd
-import requests
-import gzip
-import io
 
-def get_string_interactions():
+from etl._http import download
+
+# Protein ids repeat heavily and scores are 0-1000, so narrow dtypes cut memory ~5x
+STRING_DTYPES = {'protein1': 'category', 'protein2': 'category', 'combined_score': 'uint16'}
+
+def get_string_interactions(chunksize=None):
     """
     Fetches the STRING protein-protein interaction data for Homo sapiens.
+
+    With ``chunksize``, returns an iterator of DataFrames instead so callers can
+    stream the ~13M edges (see ``graph.build_graph.normalize_string_chunks``).
     """
     # The taxonomic ID for Homo sapiens is 9606
     url = "https://stringdb-downloads.org/download/protein.links.v12.0/9606.protein.links.v12.0.txt.gz"
     print("Fetching STRING interactions...")
-    response = requests.get(url, stream=True)
-    response.raise_for_status()
-
-    # Use gzip to decompress the file in memory
-    with gzip.open(io.BytesIO(response.content), 'rt') as f:
-        df = pd.read_csv(f, sep=' ')
+    if chunksize:
+        # pyarrow's reader has no chunked mode; the C parser yields bounded frames.
+        return pd.read_csv(
+            download(url), sep=' ', compression='gzip', usecols=list(STRING_DTYPES),
+            dtype=STRING_DTYPES, chunksize=chunksize,
+        )
+    # The archive is streamed to disk (never buffered in RAM) and only re-downloaded when it changes
+    # pyarrow's multithreaded reader projects only the three edge columns.
+    df = pd.read_csv(
+        download(url), sep=' ', compression='gzip', engine='pyarrow',
+        usecols=list(STRING_DTYPES), dtype=STRING_DTYPES,
+    )
 
     print(f"Fetched {len(df)} interactions from STRING.")
     return df
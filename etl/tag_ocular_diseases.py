@@ -1,9 +1,12 @@
 import argparse
+import re
 from pathlib import Path
-from collections import defaultdict
 
+import numpy as np
 import pandas as pd
 
+from etl._frames import read_table, table_exists, write_table
+
 OCULAR_KEYWORDS = [
     "ocular",
     "eye",
@@ -20,40 +23,53 @@ OCULAR_KEYWORDS = [
     "lacrimal",
 ]
 
+# One case-insensitive alternation scans each string once for every keyword,
+# without materialising lower-cased copies of the name/synonym columns.
+_KEYWORD_PATTERN = re.compile("|".join(re.escape(keyword) for keyword in OCULAR_KEYWORDS), re.IGNORECASE)
+
 
 def _load_tables(input_dir: Path):
-    disease_df = pd.read_csv(input_dir / "disease.csv")
-    phenotype_df = pd.read_csv(input_dir / "phenotype.csv")
-    bridge_df = pd.read_csv(input_dir / "disease_phenotype.csv")
+    disease_df = read_table(input_dir / "disease.csv")
+    phenotype_df = read_table(input_dir / "phenotype.csv")
+    bridge_df = read_table(input_dir / "disease_phenotype.csv")
     return disease_df, phenotype_df, bridge_df
 
 
+def _sorted_join(pairs: pd.DataFrame) -> pd.Series:
+    """Pipe-join the sorted distinct ``value`` entries of each ``disease_id``."""
+    pairs = pairs.dropna().drop_duplicates().sort_values(["disease_id", "value"])
+    return pairs.groupby("disease_id", sort=False)["value"].agg("|".join)
+
+
 def _aggregate_phenotypes(phenotype_df, bridge_df):
-    ocular_ids = set(
-        phenotype_df.loc[phenotype_df["is_ocular"], "id"]
-    )
-    label_map = phenotype_df.set_index("id")["name"].to_dict()
-    scope_map = phenotype_df.set_index("id")["ocular_scope"].to_dict()
+    phenotypes = phenotype_df.drop_duplicates("id", keep="last").set_index("id")
+    ocular_ids = phenotypes.index[phenotypes["is_ocular"].eq(True)]
+
+    ocular_bridge = bridge_df.loc[bridge_df["phenotype_id"].isin(ocular_ids), ["disease_id", "phenotype_id"]]
+    disease_id = ocular_bridge["disease_id"]
+    phenotype_id = ocular_bridge["phenotype_id"]
+    scopes = phenotype_id.map(phenotypes["ocular_scope"]).fillna("").astype(str).str.split(",").explode()
 
-    ocular_bridge = bridge_df[bridge_df["phenotype_id"].isin(ocular_ids)]
-    aggregated = defaultdict(lambda: {"ids": [], "labels": [], "scopes": set()})
+    return pd.DataFrame(
+        {
+            "ocular_phenotype_ids": _sorted_join(pd.DataFrame({"disease_id": disease_id, "value": phenotype_id})),
+            "ocular_phenotype_labels": _sorted_join(
+                pd.DataFrame({"disease_id": disease_id, "value": phenotype_id.map(phenotypes["name"])})
+            ),
+            "ocular_scopes": _sorted_join(
+                pd.DataFrame({"disease_id": disease_id.loc[scopes.index], "value": scopes.replace("", np.nan)})
+            ),
+        }
+    ).fillna("")
 
-    for row in ocular_bridge.itertuples(index=False):
-        phenotype_id = row.phenotype_id
-        disease_id = row.disease_id
-        aggregated[disease_id]["ids"].append(phenotype_id)
-        if phenotype_id in label_map:
-            aggregated[disease_id]["labels"].append(label_map[phenotype_id])
-        scope_value = scope_map.get(phenotype_id, "")
-        if scope_value:
-            for scope in scope_value.split(","):
-                if scope:
-                    aggregated[disease_id]["scopes"].add(scope)
 
-    return aggregated
+OUTPUT_FORMATS = {"both": ("parquet", "csv"), "parquet": ("parquet",), "csv": ("csv",)}
 
+# Low-cardinality text columns stored as categoricals in the Parquet outputs.
+CATEGORY_COLUMNS = ["ocular_scopes", "tag_source"]
 
-def tag_ocular_diseases(input_dir: Path, output_dir: Path | None = None):
+
+def tag_ocular_diseases(input_dir: Path, output_dir: Path | None = None, output_format: str = "both"):
     """Tag diseases that belong to the ocular scope using ontology relations."""
 
     output_dir = output_dir or input_dir
@@ -62,59 +78,51 @@ def tag_ocular_diseases(input_dir: Path, output_dir: Path | None = None):
     disease_df, phenotype_df, bridge_df = _load_tables(input_dir)
     aggregated = _aggregate_phenotypes(phenotype_df, bridge_df)
 
-    disease_df["is_ocular"] = False
-    disease_df["ocular_phenotype_ids"] = ""
-    disease_df["ocular_phenotype_labels"] = ""
-    disease_df["ocular_scopes"] = ""
-    disease_df["tag_source"] = ""
-
-    for idx, row in disease_df.iterrows():
-        disease_id = row["id"]
-        sources = []
-        if disease_id in aggregated:
-            payload = aggregated[disease_id]
-            unique_ids = sorted(set(payload["ids"]))
-            unique_labels = sorted(set(payload["labels"]))
-            scopes = sorted(payload["scopes"])
-
-            disease_df.at[idx, "is_ocular"] = True
-            disease_df.at[idx, "ocular_phenotype_ids"] = "|".join(unique_ids)
-            disease_df.at[idx, "ocular_phenotype_labels"] = "|".join(unique_labels)
-            disease_df.at[idx, "ocular_scopes"] = "|".join(scopes)
-            sources.append("phenotype")
-
-        if not disease_df.at[idx, "is_ocular"]:
-            name = str(row["name"]).lower()
-            synonyms = str(row.get("synonyms", "")).lower()
-            for keyword in OCULAR_KEYWORDS:
-                if keyword in name or keyword in synonyms:
-                    disease_df.at[idx, "is_ocular"] = True
-                    sources.append("keyword")
-                    break
-        elif str(row.get("synonyms", "")).strip():
-            synonyms = str(row.get("synonyms", "")).lower()
-            name = str(row["name"]).lower()
-            if any(keyword in name or keyword in synonyms for keyword in OCULAR_KEYWORDS):
-                sources.append("keyword")
-
-        if sources:
-            disease_df.at[idx, "tag_source"] = "|".join(sorted(set(sources)))
+    tagged = disease_df[["id"]].join(aggregated, on="id")
+    by_phenotype = tagged["ocular_phenotype_ids"].notna().to_numpy()
+
+    if "synonyms" in disease_df:
+        # ``str`` per cell as the row loop did: a missing synonym reads as "nan", which is non-blank.
+        synonyms = disease_df["synonyms"].astype(str)
+    else:
+        synonyms = pd.Series("", index=disease_df.index, dtype=object)
+    keyword_hit = (
+        disease_df["name"].astype(str).str.contains(_KEYWORD_PATTERN)
+        | synonyms.str.contains(_KEYWORD_PATTERN)
+    ).to_numpy()
+    # Phenotype-tagged diseases only get the keyword source when their synonyms cell is non-blank.
+    by_keyword = keyword_hit & (~by_phenotype | synonyms.str.strip().ne("").to_numpy())
+
+    # Assemble every output column as an array and attach them in one assign.
+    disease_df = disease_df.assign(
+        is_ocular=by_phenotype | keyword_hit,
+        **{column: tagged[column].fillna("").to_numpy() for column in aggregated.columns},
+        tag_source=np.select(
+            [by_keyword & by_phenotype, by_keyword, by_phenotype],
+            ["keyword|phenotype", "keyword", "phenotype"],
+            default="",
+        ),
+    )
+
+    disease_df = disease_df.astype({column: "category" for column in CATEGORY_COLUMNS})
+    formats = OUTPUT_FORMATS[output_format]
 
     tagged_path = output_dir / "disease_tagged.csv"
-    disease_df.to_csv(tagged_path, index=False)
+    write_table(disease_df, tagged_path, formats, compression="snappy")
     print(f"Tagged {int(disease_df['is_ocular'].sum()):,} ocular diseases.")
     print(f"Saved the tagged data to {tagged_path}")
 
-    ocular_summary = disease_df[disease_df["is_ocular"]].copy()
-    ocular_summary[[
+    summary_path = output_dir / "ocular_disease_summary.csv"
+    ocular_summary = disease_df.loc[disease_df["is_ocular"], [
         "id",
         "name",
         "ocular_scopes",
         "ocular_phenotype_ids",
         "ocular_phenotype_labels",
         "tag_source",
-    ]].to_csv(output_dir / "ocular_disease_summary.csv", index=False)
-    print(f"Saved ocular disease summary to {output_dir / 'ocular_disease_summary.csv'}")
+    ]]
+    write_table(ocular_summary, summary_path, formats, compression="snappy")
+    print(f"Saved ocular disease summary to {summary_path}")
 
 
 def main():
@@ -131,15 +139,21 @@ def main():
         default=None,
         help="Destination directory for tagged outputs. Defaults to --input-dir.",
     )
+    parser.add_argument(
+        "--format",
+        choices=sorted(OUTPUT_FORMATS),
+        default="both",
+        help="Write the tagged tables as Parquet, CSV or both (default).",
+    )
     args = parser.parse_args()
 
     input_dir = args.input_dir
-    if not (input_dir / "disease.csv").exists():
+    if not table_exists(input_dir / "disease.csv"):
         raise FileNotFoundError(
             f"Could not find ontology exports in {input_dir}. Run ontology_parser first."
         )
 
-    tag_ocular_diseases(input_dir, args.output_dir)
+    tag_ocular_diseases(input_dir, args.output_dir, args.format)
 
 
 if __name__ == "__main__":
@@ -2,15 +2,25 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import importlib
 import json
 import logging
 import sqlite3
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+from typing import Callable, Dict, Iterable, Iterator, Mapping, Optional, Sequence, Union
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 
+from etl._frames import EMPTY_JSON, assemble, dumps_json, json_records, present
 from etl.clinicaltrials_etl import load_clinicaltrials
 from etl.expression_etl import load_hpa, load_plae
 from etl.genetics_etl import load_disgenet, load_gwas, load_opentargets
@@ -21,6 +31,9 @@ from graph import schema as schema_module
 
 LOGGER = logging.getLogger(__name__)
 
+# Connector and file loads are I/O-bound and independent of one another.
+MAX_WORKERS = 8
+
 EDGE_COLUMNS = [
     "src_gene_id",
     "dst_gene_id",
@@ -69,30 +82,74 @@ TRIAL_COLUMNS = [
 ]
 
 
-def _truthy(value) -> bool:
-    if isinstance(value, bool):
-        return value
-    if value is None:
-        return False
-    if isinstance(value, (int, float)):
-        return value != 0
-    text = str(value).strip().lower()
-    return text in {"1", "true", "t", "yes", "y", "direct", "up"}
+# Low-cardinality text columns kept as categoricals in memory; the SQL writers
+# convert values back to Python objects.
+EDGE_CATEGORY_COLUMNS = ["relation", "sign", "source"]
+DRUG_TARGET_CATEGORY_COLUMNS = [
+    "drug_id", "target_id", "target_type", "action", "affinity_unit", "moa_category", "source",
+]
+# Identifier keys repeat heavily (many genes per disease, many tissues per gene), so they are categorised too.
+DISEASE_GENE_CATEGORY_COLUMNS = ["disease_id", "gene_id", "evidence_type", "source"]
+TISSUE_CATEGORY_COLUMNS = ["gene_id", "tissue", "unit", "source"]
 
+TRUTHY_TEXT = {"1", "true", "t", "yes", "y", "direct", "up"}
 
-def _first(record: Mapping, keys: Iterable[str]) -> Optional[str]:
-    for key in keys:
-        if key not in record:
-            continue
-        value = record.get(key)
-        if value is None:
-            continue
-        if isinstance(value, float) and pd.isna(value):
+
+def _truthy(values: pd.Series) -> np.ndarray:
+    """Boolean mask of flag-like cells, dispatching on the column dtype once."""
+    if pd.api.types.is_bool_dtype(values.dtype):
+        return values.fillna(False).to_numpy(dtype=bool)
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        return (values.fillna(0) != 0).to_numpy(dtype=bool)
+    text = values.astype(str).str.strip().str.lower()
+    return (text.isin(TRUTHY_TEXT) & values.notna()).to_numpy(dtype=bool)
+
+
+def _first(df: pd.DataFrame, keys: Iterable[str]) -> pd.Series:
+    """Column-wise coalesce: the first non-blank stripped text across ``keys``, else None."""
+    result = pd.Series([None] * len(df.index), index=df.index, dtype=object)
+    for key in reversed(list(keys)):
+        if key not in df.columns:
             continue
-        text = str(value).strip()
-        if text:
-            return text
-    return None
+        values = df[key]
+        text = values.astype(str).str.strip()
+        result = text.where(values.notna() & text.ne(""), result)
+    return result
+
+
+def _any_truthy(df: pd.DataFrame, keys: Iterable[str]) -> np.ndarray:
+    mask = np.zeros(len(df.index), dtype=bool)
+    for key in keys:
+        if key in df.columns:
+            mask |= _truthy(df[key])
+    return mask
+
+
+def _categorise(df: pd.DataFrame, columns: Sequence[str]) -> pd.DataFrame:
+    return df.astype({column: "category" for column in columns})
+
+
+def _concat_categorical(frames: Sequence[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate frames, unioning categories so categorical columns stay categorical."""
+    frames = [frame for frame in frames if not frame.empty] or list(frames[:1])
+    columns = list(dict.fromkeys(chain.from_iterable(frame.columns for frame in frames)))
+    if len(frames) > 1:
+        # pandas is deprecating the rule that all-NA parts do not affect the result dtype, so leave
+        # such parts out explicitly wherever another frame holds values; they come back as NA.
+        filled = [frame.notna().any() for frame in frames]
+        has_values = {column: any(mask.get(column, False) for mask in filled) for column in columns}
+        trimmed = [
+            frame.drop(columns=[column for column in frame.columns if has_values[column] and not mask[column]])
+            for frame, mask in zip(frames, filled)
+        ]
+        combined = pd.concat(trimmed, ignore_index=True).reindex(columns=columns)
+    else:
+        combined = pd.concat(frames, ignore_index=True)
+    for column in frames[0].columns:
+        parts = [frame[column] for frame in frames]
+        if len(parts) > 1 and all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            combined[column] = union_categoricals(parts, ignore_order=True)
+    return combined
 
 
 def _safe_fetch(fetcher, name: str) -> pd.DataFrame:
@@ -103,227 +160,226 @@ def _safe_fetch(fetcher, name: str) -> pd.DataFrame:
         return pd.DataFrame()
 
 
-def _load_omnipath() -> pd.DataFrame:
+@lru_cache(maxsize=None)
+def _optional_import(module: str, attr: str, label: str) -> Optional[Callable[[], pd.DataFrame]]:
+    """Resolve an optional connector once; failures are logged once and cached as None."""
     try:
-        from etl.omnipath_etl import get_omnipath_interactions  # type: ignore
+        return getattr(importlib.import_module(module), attr)
     except Exception as exc:  # pragma: no cover - optional dependency
-        LOGGER.warning("OmniPath connector unavailable: %s", exc)
-        return pd.DataFrame()
-    return _safe_fetch(get_omnipath_interactions, "OmniPath")
+        LOGGER.warning("%s connector unavailable: %s", label, exc)
+        return None
+
+
+def _load_connector(module: str, attr: str, label: str) -> pd.DataFrame:
+    fetcher = _optional_import(module, attr, label)
+    return _safe_fetch(fetcher, label) if fetcher is not None else pd.DataFrame()
+
+
+def _load_omnipath() -> pd.DataFrame:
+    return _load_connector("etl.omnipath_etl", "get_omnipath_interactions", "OmniPath")
 
 
 def _load_signor() -> pd.DataFrame:
-    try:
-        from etl.signor_etl import get_signor_interactions  # type: ignore
-    except Exception as exc:  # pragma: no cover - optional dependency
-        LOGGER.warning("SIGNOR connector unavailable: %s", exc)
-        return pd.DataFrame()
-    return _safe_fetch(get_signor_interactions, "SIGNOR")
+    return _load_connector("etl.signor_etl", "get_signor_interactions", "SIGNOR")
 
 
 def _load_string() -> pd.DataFrame:
-    try:
-        from etl.string_etl import get_string_interactions  # type: ignore
-    except Exception as exc:  # pragma: no cover - optional dependency
-        LOGGER.warning("STRING connector unavailable: %s", exc)
-        return pd.DataFrame()
-    return _safe_fetch(get_string_interactions, "STRING")
+    return _load_connector("etl.string_etl", "get_string_interactions", "STRING")
+
+
+def _load_string_chunks(chunksize: int) -> Iterable[pd.DataFrame]:
+    fetcher = _optional_import("etl.string_etl", "get_string_interactions", "STRING")
+    if fetcher is None:
+        return []
+    chunks = _safe_fetch(lambda: fetcher(chunksize=chunksize), "STRING")
+    return [chunks] if isinstance(chunks, pd.DataFrame) else chunks
 
 
 def _load_drugcentral() -> pd.DataFrame:
-    try:
-        from etl.drugcentral_etl import get_drugcentral_interactions  # type: ignore
-    except Exception as exc:  # pragma: no cover - optional dependency
-        LOGGER.warning("DrugCentral connector unavailable: %s", exc)
-        return pd.DataFrame()
-    return _safe_fetch(get_drugcentral_interactions, "DrugCentral")
+    return _load_connector("etl.drugcentral_etl", "get_drugcentral_interactions", "DrugCentral")
 
 
 def _load_iuphar() -> pd.DataFrame:
-    try:
-        from etl.iuphar_etl import get_iuphar_interactions  # type: ignore
-    except Exception as exc:  # pragma: no cover - optional dependency
-        LOGGER.warning("IUPHAR connector unavailable: %s", exc)
-        return pd.DataFrame()
-    return _safe_fetch(get_iuphar_interactions, "IUPHAR")
+    return _load_connector("etl.iuphar_etl", "get_iuphar_interactions", "IUPHAR")
 
 
 def normalize_signed_edges(df: pd.DataFrame, source_name: str) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame(columns=EDGE_COLUMNS)
 
-    records: List[Mapping[str, object]] = []
-    for record in df.to_dict(orient="records"):
-        src = _first(record, ["source_genesymbol", "source", "ENTITYA", "ENTITY_A", "ENTITYA_NAME"])
-        dst = _first(record, ["target_genesymbol", "target", "ENTITYB", "ENTITY_B", "ENTITYB_NAME"])
-        if not src or not dst:
-            continue
-
-        relation = (
-            _first(record, ["consensus_direction", "interaction_type", "type", "mechanism", "MECHANISM", "EFFECT"])
-            or "interaction"
-        )
-        relation = relation.replace(" ", "_")
-
-        sign = None
-        if any(
-            _truthy(record.get(key))
-            for key in ("is_stimulation", "consensus_stimulation", "stimulation", "UP_REGULATION", "up-regulates")
-        ):
-            sign = "+"
-        elif any(
-            _truthy(record.get(key))
-            for key in ("is_inhibition", "consensus_inhibition", "inhibition", "DOWN_REGULATION", "down-regulates")
-        ):
-            sign = "-"
-        effect = (_first(record, ["EFFECT"]) or "").lower()
-        if sign is None:
-            if "activ" in effect:
-                sign = "+"
-            elif "inhib" in effect or "down" in effect:
-                sign = "-"
-        if sign is None:
-            continue
-
-        direct = any(
-            _truthy(record.get(key))
-            for key in ("is_direct", "direct", "DIRECT", "is_directed")
-        )
-        evidence = _first(record, ["references", "curation_effort", "pmid", "REFERENCE", "PMID"])
-
-        records.append(
-            {
-                "src_gene_id": src,
-                "dst_gene_id": dst,
-                "relation": relation,
-                "sign": sign,
-                "direct": bool(direct or source_name == "OmniPath"),
-                "evidence": json.dumps({"raw": evidence}) if evidence else json.dumps({}),
-                "source": source_name,
-                "source_reference": evidence or "",
-            }
-        )
+    src = _first(df, ["source_genesymbol", "source", "ENTITYA", "ENTITY_A", "ENTITYA_NAME"])
+    dst = _first(df, ["target_genesymbol", "target", "ENTITYB", "ENTITY_B", "ENTITYB_NAME"])
+    relation = (
+        _first(df, ["consensus_direction", "interaction_type", "type", "mechanism", "MECHANISM", "EFFECT"])
+        .fillna("interaction")
+        .str.replace(" ", "_", regex=False)
+    )
 
-    edges = pd.DataFrame(records, columns=EDGE_COLUMNS)
+    # Explicit stimulation/inhibition flags win; otherwise fall back to the EFFECT text.
+    effect = _first(df, ["EFFECT"]).fillna("").str.lower()
+    sign = np.select(
+        [
+            _any_truthy(df, ("is_stimulation", "consensus_stimulation", "stimulation", "UP_REGULATION", "up-regulates")),
+            _any_truthy(df, ("is_inhibition", "consensus_inhibition", "inhibition", "DOWN_REGULATION", "down-regulates")),
+            effect.str.contains("activ", regex=False).to_numpy(),
+            (effect.str.contains("inhib", regex=False) | effect.str.contains("down", regex=False)).to_numpy(),
+        ],
+        ["+", "-", "+", "-"],
+        default="",
+    )
+    direct = _any_truthy(df, ("is_direct", "direct", "DIRECT", "is_directed")) | (source_name == "OmniPath")
+    reference = _first(df, ["references", "curation_effort", "pmid", "REFERENCE", "PMID"])
+
+    edges = assemble(
+        {
+            "src_gene_id": src,
+            "dst_gene_id": dst,
+            "relation": relation,
+            "sign": pd.Series(sign, index=df.index),
+            "direct": pd.Series(direct, index=df.index),
+            "source": source_name,
+            "source_reference": reference.fillna(""),
+        },
+        src.notna() & dst.notna() & (sign != ""),
+        EDGE_COLUMNS,
+    )
+    reference = edges["source_reference"]
+    edges["evidence"] = ('{"raw":' + reference.map(dumps_json) + "}").where(reference.ne(""), EMPTY_JSON)
+    edges = _categorise(edges, EDGE_CATEGORY_COLUMNS)
     edges.drop_duplicates(subset=["src_gene_id", "dst_gene_id", "relation", "sign", "source"], inplace=True)
     return edges
 
 
+def _strip_taxon(values: pd.Series) -> pd.Series:
+    """Drop the ``9606.`` style taxon prefix from STRING protein ids."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Split each distinct protein once and broadcast through the codes.
+        categories = values.cat.categories
+        stripped = pd.Series(_strip_taxon(pd.Series(categories)).to_numpy(), index=categories)
+        return values.map(stripped).astype(object)
+    return values.astype(str).str.rsplit(".", n=1).str[-1]
+
+
 def normalize_string(df: pd.DataFrame) -> pd.DataFrame:
-    if df.empty:
+    if df.empty or "protein1" not in df.columns or "protein2" not in df.columns:
         return pd.DataFrame(columns=EDGE_COLUMNS)
 
-    records: List[Mapping[str, object]] = []
-    for record in df.to_dict(orient="records"):
-        src = record.get("protein1")
-        dst = record.get("protein2")
-        if not src or not dst:
-            continue
-        if isinstance(src, str) and "." in src:
-            src = src.split(".")[-1]
-        if isinstance(dst, str) and "." in dst:
-            dst = dst.split(".")[-1]
-        score = record.get("combined_score")
-        evidence = json.dumps({"combined_score": float(score)}) if score is not None else json.dumps({})
-        records.append(
-            {
-                "src_gene_id": str(src),
-                "dst_gene_id": str(dst),
-                "relation": "physical_interaction",
-                "sign": None,
-                "direct": False,
-                "evidence": evidence,
-                "source": "STRING",
-                "source_reference": "STRING",
-            }
-        )
-
-    edges = pd.DataFrame(records, columns=EDGE_COLUMNS)
+    src = df["protein1"]
+    dst = df["protein2"]
+    keep = present(src) & present(dst)
+    edges = assemble(
+        {
+            "src_gene_id": _strip_taxon(src),
+            "dst_gene_id": _strip_taxon(dst),
+            "relation": "physical_interaction",
+            "direct": False,
+            "source": "STRING",
+            "source_reference": "STRING",
+        },
+        keep,
+        EDGE_COLUMNS,
+    )
+    edges["sign"] = None
+    if "combined_score" in df.columns:
+        # Formatted column-wise; float64 str() is the same shortest repr json.dumps emits.
+        scores = pd.Series(df["combined_score"].to_numpy(dtype=float)[keep.to_numpy(dtype=bool)], index=edges.index)
+        edges["evidence"] = ('{"combined_score":' + scores.astype(str) + "}").where(scores.notna(), EMPTY_JSON)
+    else:
+        edges["evidence"] = EMPTY_JSON
+    edges = _categorise(edges, EDGE_CATEGORY_COLUMNS)
     edges.drop_duplicates(subset=["src_gene_id", "dst_gene_id", "source"], inplace=True)
     return edges
 
 
+def normalize_string_chunks(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """Normalise STRING chunk by chunk, dropping pairs already emitted by earlier chunks.
+
+    Cross-chunk uniqueness is tracked as a sorted array of 64-bit key hashes
+    (8 bytes per edge) rather than by holding the edges themselves.
+    """
+    seen = np.empty(0, dtype=np.uint64)
+    for chunk in chunks:
+        edges = normalize_string(chunk)
+        if edges.empty:
+            continue
+        keys = pd.util.hash_pandas_object(edges[["src_gene_id", "dst_gene_id"]], index=False).to_numpy()
+        fresh = ~np.isin(keys, seen, assume_unique=True)
+        seen = np.union1d(seen, keys[fresh])
+        yield edges[fresh].reset_index(drop=True)
+
+
 def normalize_drug_targets(df: pd.DataFrame, source_name: str) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame(columns=DRUG_TARGET_COLUMNS)
 
-    records: List[Mapping[str, object]] = []
-    for record in df.to_dict(orient="records"):
-        drug_id = _first(
-            record,
-            [
-                "drug_chembl_id",
-                "molecule_chembl_id",
-                "drugcentral_id",
-                "drugbank_id",
-                "ligand_id",
-                "drug_id",
-                "DRUG_ID",
-            ],
-        )
-        target_id = _first(
-            record,
-            [
-                "gene",
-                "target_gene_symbol",
-                "accession",
-                "uniprot_id",
-                "swissprot",
-                "target_id",
-                "target",
-            ],
-        )
-        if not drug_id or not target_id:
-            continue
-
-        action = _first(
-            record,
-            ["action_type", "action", "act_comment", "activity_comment", "mechanism_of_action", "mode_of_action"],
-        )
-        affinity_value = _first(record, ["act_value", "standard_value", "affinity", "pchembl_value", "activity_value"])
-        affinity_unit = _first(record, ["act_unit", "standard_units", "affinity_unit"])
-        target_type = _first(
-            record,
-            ["target_class", "target_type", "target_pref_name", "target_organism"],
-        )
-        moa = _first(record, ["moa", "mechanism_comment", "mechanism_of_action"])
-        references = _first(record, ["reference", "pmid", "pubmed_id", "source_reference"])
-
-        evidence = {}
-        if references:
-            evidence["references"] = references
-        if record.get("relation"):
-            evidence["relation"] = record["relation"]
-
-        affinity_numeric = None
-        if affinity_value is not None:
-            try:
-                affinity_numeric = float(affinity_value)
-            except ValueError:
-                affinity_numeric = None
-
-        records.append(
-            {
-                "drug_id": drug_id,
-                "target_id": target_id,
-                "target_type": target_type or "",
-                "action": action or "",
-                "affinity": affinity_numeric,
-                "affinity_unit": affinity_unit or "",
-                "moa_category": moa or "",
-                "source": source_name,
-                "evidence": json.dumps(evidence) if evidence else json.dumps({}),
-            }
-        )
+    drug_id = _first(
+        df,
+        [
+            "drug_chembl_id",
+            "molecule_chembl_id",
+            "drugcentral_id",
+            "drugbank_id",
+            "ligand_id",
+            "drug_id",
+            "DRUG_ID",
+        ],
+    )
+    target_id = _first(
+        df,
+        [
+            "gene",
+            "target_gene_symbol",
+            "accession",
+            "uniprot_id",
+            "swissprot",
+            "target_id",
+            "target",
+        ],
+    )
+    keep = drug_id.notna() & target_id.notna()
 
-    targets = pd.DataFrame(records, columns=DRUG_TARGET_COLUMNS)
+    action = _first(
+        df,
+        ["action_type", "action", "act_comment", "activity_comment", "mechanism_of_action", "mode_of_action"],
+    )
+    affinity_value = _first(df, ["act_value", "standard_value", "affinity", "pchembl_value", "activity_value"])
+    affinity_unit = _first(df, ["act_unit", "standard_units", "affinity_unit"])
+    target_type = _first(df, ["target_class", "target_type", "target_pref_name", "target_organism"])
+    moa = _first(df, ["moa", "mechanism_comment", "mechanism_of_action"])
+    references = _first(df, ["reference", "pmid", "pubmed_id", "source_reference"])
+    relation = df["relation"] if "relation" in df.columns else pd.Series([None] * len(df.index), index=df.index)
+    relation = relation.astype(object).where(present(relation), None)
+
+    targets = assemble(
+        {
+            "drug_id": drug_id,
+            "target_id": target_id,
+            "target_type": target_type.fillna(""),
+            "action": action.fillna(""),
+            "affinity": pd.to_numeric(affinity_value, errors="coerce"),
+            "affinity_unit": affinity_unit.fillna(""),
+            "moa_category": moa.fillna(""),
+            "source": source_name,
+        },
+        keep,
+        DRUG_TARGET_COLUMNS,
+    )
+    mask = keep.to_numpy(dtype=bool)
+    targets["evidence"] = json_records(
+        {
+            "references": pd.Series(references.to_numpy()[mask], index=targets.index),
+            "relation": pd.Series(relation.to_numpy()[mask], index=targets.index),
+        }
+    )
+    targets = _categorise(targets, DRUG_TARGET_CATEGORY_COLUMNS)
     targets.drop_duplicates(subset=["drug_id", "target_id", "source"], inplace=True)
     return targets
 
 
 @dataclass
 class BuildConfig:
-    sqlite_path: Optional[Path] = None
+    # A file path, or ``":memory:"`` / a ``file:...?mode=memory`` URI for throwaway databases.
+    sqlite_path: Optional[Union[str, Path]] = None
     postgres_dsn: Optional[str] = None
     reactome: Optional[Path] = None
     opentargets: Optional[Path] = None
@@ -334,55 +390,140 @@ class BuildConfig:
     rxnorm: Optional[Path] = None
     sider: Optional[Path] = None
     clinicaltrials: Optional[Path] = None
+    cache_dir: Optional[Path] = None
+    # Stream STRING to the SQL writers in chunks of this many rows instead of loading it whole.
+    string_chunksize: Optional[int] = None
+
+
+# Bump when a normaliser's output changes so stale cache entries are ignored.
+CACHE_VERSION = "1"
+
+
+def _path_token(path: Optional[Path]) -> object:
+    if path is None or not Path(path).exists():
+        return None
+    stat = Path(path).stat()
+    return [str(path), stat.st_mtime_ns, stat.st_size]
+
+
+def _cached_frame(
+    cache_dir: Optional[Path],
+    name: str,
+    deps: object,
+    compute: Callable[[], pd.DataFrame],
+    cache_empty: bool = True,
+) -> pd.DataFrame:
+    """Return ``compute()``, memoised as ``<cache_dir>/<name>_<hash>.parquet`` keyed by ``deps``.
+
+    With ``cache_empty=False`` an empty result is returned but not stored, so a source that
+    was unreachable is fetched again on the next build instead of staying empty for the key.
+    """
+    if cache_dir is None:
+        return compute()
+    digest = hashlib.sha256(json.dumps([CACHE_VERSION, deps], default=str).encode()).hexdigest()[:16]
+    cache_path = Path(cache_dir) / f"{name}_{digest}.parquet"
+    if cache_path.exists():
+        return pd.read_parquet(cache_path)
+    frame = compute()
+    if frame.empty and not cache_empty:
+        return frame
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per writer, so concurrent builds never interleave writes into one partial file.
+    with tempfile.NamedTemporaryFile(dir=cache_path.parent, prefix=cache_path.stem, suffix=".tmp", delete=False) as tmp:
+        tmp_path = Path(tmp.name)
+    try:
+        frame.to_parquet(tmp_path, index=False)
+        tmp_path.replace(cache_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return frame
+
+
+def _load_sources(config: BuildConfig) -> Dict[str, pd.DataFrame]:
+    """Run every independent connector/file loader (and its normaliser) concurrently."""
+    # Remote connectors carry no version, so their entries roll over daily like the HTTP cache.
+    today = datetime.now(timezone.utc).date().isoformat()
+    remote_jobs = {
+        "omnipath": lambda: normalize_signed_edges(_load_omnipath(), "OmniPath"),
+        "signor": lambda: normalize_signed_edges(_load_signor(), "SIGNOR"),
+        "string": lambda: normalize_string(_load_string()),
+        "drugcentral": lambda: normalize_drug_targets(_load_drugcentral(), "DrugCentral"),
+        "iuphar": lambda: normalize_drug_targets(_load_iuphar(), "IUPHAR"),
+    }
+    if config.string_chunksize:
+        del remote_jobs["string"]  # streamed to the writers by build_knowledge_graph
+    file_jobs = {
+        "reactome": (load_reactome, config.reactome),
+        "opentargets": (load_opentargets, config.opentargets),
+        "gwas": (load_gwas, config.gwas),
+        "disgenet": (load_disgenet, config.disgenet),
+        "hpa": (load_hpa, config.hpa),
+        "plae": (load_plae, config.plae),
+        "rxnorm": (load_rxnorm_drugs, config.rxnorm),
+        "sider": (load_sider, config.sider),
+        "clinicaltrials": (load_clinicaltrials, config.clinicaltrials),
+    }
+    jobs = {
+        # A failed or unavailable connector yields an empty frame; never pin that for the day.
+        name: (lambda name=name, job=job: _cached_frame(config.cache_dir, name, today, job, cache_empty=False))
+        for name, job in remote_jobs.items()
+    }
+    jobs.update(
+        {
+            name: (
+                lambda name=name, loader=loader, path=path: _cached_frame(
+                    config.cache_dir, name, _path_token(path), lambda: loader(path)
+                )
+            )
+            for name, (loader, path) in file_jobs.items()
+        }
+    )
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(jobs))) as pool:
+        futures = {name: pool.submit(job) for name, job in jobs.items()}
+        return {name: future.result() for name, future in futures.items()}
 
 
 def assemble_tables(config: BuildConfig) -> Dict[str, pd.DataFrame]:
-    LOGGER.info("Loading causal interaction datasets")
-    omnipath_edges = normalize_signed_edges(_load_omnipath(), "OmniPath")
-    signor_edges = normalize_signed_edges(_load_signor(), "SIGNOR")
-    string_edges = normalize_string(_load_string())
-    protein_edges = pd.concat([omnipath_edges, signor_edges, string_edges], ignore_index=True)
-    protein_edges.drop_duplicates(
-        subset=["src_gene_id", "dst_gene_id", "relation", "sign", "source"], inplace=True
-    )
+    LOGGER.info("Loading and normalising source datasets")
+    sources = _load_sources(config)
+
+    omnipath_edges = sources["omnipath"]
+    signor_edges = sources["signor"]
+    string_edges = sources.get("string", pd.DataFrame(columns=EDGE_COLUMNS))
+    # Each normaliser already de-duplicates on a key that includes ``source``, so
+    # rows from different sources can never collide and the union needs no
+    # second hash pass over the (STRING-dominated) combined frame.
+    protein_edges = _concat_categorical([omnipath_edges, signor_edges, string_edges])
     if protein_edges.empty:
         protein_edges = pd.DataFrame(columns=EDGE_COLUMNS)
 
-    LOGGER.info("Loading pathway memberships")
-    reactome = load_reactome(config.reactome)
+    reactome = sources["reactome"]
     if reactome.empty:
         reactome = pd.DataFrame(columns=PATHWAY_COLUMNS)
     else:
         reactome = reactome.assign(source="Reactome")
 
-    LOGGER.info("Loading genetics evidence")
-    genetics_frames = [
-        load_opentargets(config.opentargets),
-        load_gwas(config.gwas),
-        load_disgenet(config.disgenet),
-    ]
+    genetics_frames = [sources["opentargets"], sources["gwas"], sources["disgenet"]]
     disease_gene = pd.concat(genetics_frames, ignore_index=True)
     if disease_gene.empty:
         disease_gene = pd.DataFrame(columns=DISEASE_GENE_COLUMNS)
+    disease_gene = _categorise(disease_gene, DISEASE_GENE_CATEGORY_COLUMNS)
 
-    LOGGER.info("Loading expression datasets")
-    hpa = load_hpa(config.hpa)
-    plae = load_plae(config.plae)
-    tissue_expr = pd.concat([hpa, plae], ignore_index=True)
+    tissue_expr = pd.concat([sources["hpa"], sources["plae"]], ignore_index=True)
     if tissue_expr.empty:
         tissue_expr = pd.DataFrame(columns=TISSUE_COLUMNS)
+    tissue_expr = _categorise(tissue_expr, TISSUE_CATEGORY_COLUMNS)
 
-    LOGGER.info("Loading drug catalogues")
-    rxnorm = load_rxnorm_drugs(config.rxnorm)
-    drugcentral_targets = normalize_drug_targets(_load_drugcentral(), "DrugCentral")
-    iuphar_targets = normalize_drug_targets(_load_iuphar(), "IUPHAR")
-    drug_target = pd.concat([drugcentral_targets, iuphar_targets], ignore_index=True)
+    rxnorm = sources["rxnorm"]
+    drugcentral_targets = sources["drugcentral"]
+    iuphar_targets = sources["iuphar"]
+    drug_target = _concat_categorical([drugcentral_targets, iuphar_targets])
     if drug_target.empty:
         drug_target = pd.DataFrame(columns=DRUG_TARGET_COLUMNS)
 
-    LOGGER.info("Loading safety and trials data")
-    safety = load_sider(config.sider)
-    trials = load_clinicaltrials(config.clinicaltrials)
+    safety = sources["sider"]
+    trials = sources["clinicaltrials"]
 
     tables: Dict[str, pd.DataFrame] = {
         "protein_edge": protein_edges,
@@ -494,25 +635,109 @@ def _initialise_sqlite(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
-def _write_sqlite(conn: sqlite3.Connection, tables: Dict[str, pd.DataFrame]) -> None:
-    for table, df in tables.items():
+WRITE_CHUNK_ROWS = 200_000
+# Default STRING read chunk for the CLI; bounded frames instead of all ~13M edges at once.
+STRING_CHUNK_ROWS = 1_000_000
+
+TableData = Union[pd.DataFrame, Iterable[pd.DataFrame]]
+
+
+def _iter_chunks(data: TableData) -> Iterator[pd.DataFrame]:
+    return iter([data]) if isinstance(data, pd.DataFrame) else iter(data)
+
+
+def _iter_rows(df: pd.DataFrame, chunk_rows: int = WRITE_CHUNK_ROWS) -> Iterator[tuple]:
+    """Yield DB-ready row tuples, converting at most ``chunk_rows`` rows to objects at a time."""
+    for start in range(0, len(df), chunk_rows):
+        part = df.iloc[start : start + chunk_rows]
+        # Python objects bind directly; missing values become NULL as with to_sql.
+        yield from part.astype(object).where(part.notna(), None).itertuples(index=False, name=None)
+
+
+def _index_sqlite(conn: sqlite3.Connection) -> None:
+    """Create the schema's secondary indexes once, after the bulk load, then refresh planner stats."""
+    with conn:
+        for table in schema_module.SCHEMA:
+            if table.name in SQLITE_DDL:
+                for statement in table.indexes:
+                    conn.execute(statement)
+    conn.execute("ANALYZE")
+
+
+SQLITE_BULK_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=OFF;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-262144;
+"""
+
+
+def _write_sqlite(conn: sqlite3.Connection, tables: Mapping[str, TableData]) -> None:
+    """Bulk-insert each table; values may be frames or iterables of same-shaped chunks."""
+    conn.executescript(SQLITE_BULK_PRAGMAS)
+    for table, data in tables.items():
         if table not in SQLITE_DDL:
             LOGGER.debug("Skipping unknown table %s for SQLite load", table)
             continue
-        if df.empty:
+        if isinstance(data, pd.DataFrame) and data.empty:
             LOGGER.info("No rows to write for %s", table)
             continue
-        LOGGER.info("Writing %s rows to %s", len(df), table)
-        df.to_sql(table, conn, if_exists="append", index=False)
-    conn.commit()
+        with conn:  # one transaction per table, however many chunks feed it
+            rows = 0
+            for chunk in _iter_chunks(data):
+                if chunk.empty:
+                    continue
+                columns = list(chunk.columns)
+                insert_sql = f"INSERT INTO {table} ({','.join(columns)}) VALUES ({','.join('?' * len(columns))})"
+                conn.executemany(insert_sql, _iter_rows(chunk))
+                rows += len(chunk)
+        LOGGER.info("Wrote %s rows to %s", rows, table)
+
+
+# Binary COPY wire types for the schema's column types.
+PG_BINARY_TYPES = {
+    "TEXT": "text",
+    "INTEGER": "int4",
+    "DOUBLE PRECISION": "float8",
+    "BOOLEAN": "bool",
+    "JSONB": "jsonb",
+    "TIMESTAMPTZ": "timestamptz",
+}
 
 
-def _write_postgres(dsn: str, tables: Dict[str, pd.DataFrame]) -> None:
+def _raw_json(value: object) -> str:
+    # Evidence columns already hold serialised JSON; pass it through untouched.
+    return value if isinstance(value, str) else dumps_json(value)
+
+
+def _binary_copy_frame(df: pd.DataFrame, types: Sequence[str]) -> pd.DataFrame:
+    """Coerce columns to the Python types the binary COPY dumpers for ``types`` expect."""
+    columns = {}
+    for column, pg_type in zip(df.columns, types):
+        values = df[column]
+        if pg_type == "text":
+            columns[column] = values.astype(str).where(values.notna(), None)
+        elif pg_type == "int4":
+            columns[column] = pd.to_numeric(values, errors="coerce").round().astype("Int64")
+        elif pg_type == "float8":
+            columns[column] = pd.to_numeric(values, errors="coerce").astype(float)
+        elif pg_type == "bool":
+            columns[column] = values.astype("boolean")
+        elif pg_type == "timestamptz":
+            columns[column] = pd.to_datetime(values, utc=True, errors="coerce")
+        else:
+            columns[column] = values
+    return pd.DataFrame(columns, index=df.index)
+
+
+def _write_postgres(dsn: str, tables: Mapping[str, TableData]) -> None:
     try:
         import psycopg
+        from psycopg.types.json import set_json_dumps
     except Exception as exc:  # pragma: no cover - optional dependency
         raise RuntimeError("psycopg is required for Postgres loading") from exc
 
+    manifest = schema_module.schema_manifest()
     LOGGER.info("Applying schema to PostgreSQL instance")
     with psycopg.connect(dsn, autocommit=True) as conn:  # pragma: no cover - requires postgres
         with conn.cursor() as cursor:
@@ -520,34 +745,63 @@ def _write_postgres(dsn: str, tables: Dict[str, pd.DataFrame]) -> None:
 
     LOGGER.info("Loading tables into PostgreSQL")
     with psycopg.connect(dsn) as conn:  # pragma: no cover - requires postgres
-        for table, df in tables.items():
-            if df.empty:
+        set_json_dumps(_raw_json, conn)
+        for table, data in tables.items():
+            if isinstance(data, pd.DataFrame) and data.empty:
                 continue
-            columns = list(df.columns)
-            placeholders = ",".join(["%s"] * len(columns))
-            insert_sql = f"INSERT INTO {table} ({','.join(columns)}) VALUES ({placeholders})"
-            records = [tuple(row) for row in df.itertuples(index=False, name=None)]
             with conn.cursor() as cursor:
                 cursor.execute(f"TRUNCATE {table}")
-                for chunk_start in range(0, len(records), 1000):
-                    chunk = records[chunk_start : chunk_start + 1000]
-                    cursor.executemany(insert_sql, chunk)
+                for chunk in _iter_chunks(data):
+                    if chunk.empty:
+                        continue
+                    columns = list(chunk.columns)
+                    schema_types = manifest.get(table, {})
+                    types = [PG_BINARY_TYPES.get(schema_types.get(column, "")) for column in columns]
+                    # Binary format skips server-side text parsing, but needs every column typed.
+                    if all(types):
+                        rows = _iter_rows(_binary_copy_frame(chunk, types))
+                        schema_module.bulk_copy(cursor, table, columns, rows, types)
+                    else:
+                        schema_module.bulk_copy(cursor, table, columns, _iter_rows(chunk))
         conn.commit()
 
 
+def _connect_sqlite(target: Union[str, Path]) -> sqlite3.Connection:
+    """Open ``target``, treating ``":memory:"`` and ``file:`` URIs as in-memory databases."""
+    text = str(target)
+    if text == ":memory:" or text.startswith("file:"):
+        return sqlite3.connect(text, uri=True)
+    path = Path(target)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return sqlite3.connect(path)
+
+
+def _sql_tables(config: BuildConfig, tables: Dict[str, pd.DataFrame]) -> Mapping[str, TableData]:
+    """The tables to write, with STRING edges streamed behind the other protein edges if configured."""
+    if not config.string_chunksize:
+        return tables
+    string_chunks = normalize_string_chunks(_load_string_chunks(config.string_chunksize))
+    return {**tables, "protein_edge": chain([tables["protein_edge"]], string_chunks)}
+
+
 def build_knowledge_graph(config: BuildConfig) -> Dict[str, pd.DataFrame]:
+    """Assemble the tables and write them to the configured targets.
+
+    With ``config.string_chunksize`` the STRING edges only pass through the writers (read
+    once per target), so the returned ``protein_edge`` frame holds the other sources.
+    """
     tables = assemble_tables(config)
 
     if config.sqlite_path:
-        config.sqlite_path.parent.mkdir(parents=True, exist_ok=True)
         LOGGER.info("Writing SQLite database to %s", config.sqlite_path)
-        with sqlite3.connect(config.sqlite_path) as conn:
+        with _connect_sqlite(config.sqlite_path) as conn:
             _initialise_sqlite(conn)
-            _write_sqlite(conn, tables)
+            _write_sqlite(conn, _sql_tables(config, tables))
+            _index_sqlite(conn)
 
     if config.postgres_dsn:
         LOGGER.info("Loading tables into PostgreSQL: %s", config.postgres_dsn)
-        _write_postgres(config.postgres_dsn, tables)
+        _write_postgres(config.postgres_dsn, _sql_tables(config, tables))
 
     return tables
 
@@ -565,6 +819,11 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--rxnorm", type=Path, help="Path to RxNorm concepts export")
     parser.add_argument("--sider", type=Path, help="Path to SIDER adverse event export")
     parser.add_argument("--clinicaltrials", type=Path, help="Path to ClinicalTrials.gov export")
+    parser.add_argument("--cache-dir", type=Path, help="Directory for cached normalised source frames")
+    parser.add_argument(
+        "--string-chunksize", type=int, default=STRING_CHUNK_ROWS,
+        help="Rows per streamed STRING chunk (0 loads STRING whole)",
+    )
     parser.add_argument("--log-level", default="INFO")
     return parser
 
@@ -587,6 +846,8 @@ def main(argv: Sequence[str] | None = None) -> None:  # pragma: no cover - CLI w
         rxnorm=getattr(args, "rxnorm", None),
         sider=getattr(args, "sider", None),
         clinicaltrials=getattr(args, "clinicaltrials", None),
+        cache_dir=getattr(args, "cache_dir", None),
+        string_chunksize=getattr(args, "string_chunksize", None) or None,
     )
     build_knowledge_graph(config)
 
@@ -5,8 +5,14 @@ import argparse
 import json
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence
+
+try:  # optional C encoder; its indented output is byte-identical to the json fallback
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 LOGGER = logging.getLogger(__name__)
 
@@ -180,6 +186,8 @@ SCHEMA: Sequence[Table] = (
 )
 
 
+# SCHEMA is an immutable tuple of frozen dataclasses, so renders never go stale.
+@lru_cache(maxsize=1)
 def render_schema_sql() -> str:
     statements: List[str] = []
     for table in SCHEMA:
@@ -193,17 +201,45 @@ def apply_schema(cursor) -> None:
 
     The function does not manage transactions; callers are responsible for
     committing. It works with psycopg (PostgreSQL) as well as sqlite3 for tests.
+    The whole DDL goes over in one round trip: psycopg accepts several
+    parameterless statements per ``execute`` and sqlite3 via ``executescript``
+    (which commits any pending transaction first).
+    """
+
+    sql = render_schema_sql()
+    if hasattr(cursor, "executescript"):
+        cursor.executescript(sql)
+    else:
+        cursor.execute(sql)
+
+
+def bulk_copy(
+    cursor,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[tuple],
+    types: Optional[Sequence[str]] = None,
+) -> None:
+    """Stream ``rows`` into ``table`` with psycopg's ``COPY ... FROM STDIN``.
+
+    Use this rather than ``executemany`` for bulk loads: rows go over the wire
+    without a per-statement parse/plan, and ``None`` values become NULL. With
+    ``types`` (PostgreSQL type names, one per column) the binary format is used.
     """
 
-    statements = render_schema_sql().split(";\n")
-    for statement in statements:
-        stmt = statement.strip()
-        if not stmt:
-            continue
-        cursor.execute(stmt + ";")
+    statement = f"COPY {table} ({','.join(columns)}) FROM STDIN"
+    if types is not None:
+        statement += " WITH (FORMAT BINARY)"
+    with cursor.copy(statement) as copy:
+        if types is not None:
+            copy.set_types(list(types))
+        for row in rows:
+            copy.write_row(row)
 
 
+@lru_cache(maxsize=1)
 def schema_manifest() -> Dict[str, Dict[str, str]]:
+    """Column types per table. The returned mapping is shared; treat it as read-only."""
     return {
         table.name: {column.name: column.type for column in table.columns}
         for table in SCHEMA
@@ -218,7 +254,10 @@ def write_schema_sql(path: Path) -> None:
 
 def write_manifest(path: Path) -> None:
     manifest = schema_manifest()
-    path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2) + b"\n")
+    else:
+        path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
     LOGGER.info("Wrote schema manifest to %s", path)
 
 
@@ -2,26 +2,65 @@
 from __future__ import annotations
 
 import logging
-import sqlite3
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Sequence
 
 import pandas as pd
 
+from etl._frames import read_sqlite, write_table
 
-def load_graph_targets(db_path: Path) -> pd.DataFrame:
-    """Load drug-target relationships from the knowledge graph database."""
+
+# Stays under SQLite's default 999 host-parameter limit.
+MAX_IN_PARAMS = 900
+
+
+def load_graph_targets(
+    db_path: Path,
+    columns: Optional[Sequence[str]] = None,
+    drug_ids: Optional[Iterable[str]] = None,
+) -> pd.DataFrame:
+    """Load drug-target relationships from the knowledge graph database.
+
+    ``columns`` projects the read (e.g. skip the bulky ``evidence`` text) and
+    ``drug_ids`` pushes a ``drug_id IN (...)`` filter into SQLite.
+    """
 
     if not db_path.exists():
         raise FileNotFoundError(f"Knowledge graph database not found: {db_path}")
 
-    with sqlite3.connect(db_path) as conn:
-        df = pd.read_sql_query("SELECT * FROM drug_target", conn)
+    query = f"SELECT {', '.join(columns) if columns else '*'} FROM drug_target"
+    if drug_ids is None:
+        df = read_sqlite(db_path, query)
+    else:
+        ids = list(dict.fromkeys(drug_ids))
+        chunks = [ids[start : start + MAX_IN_PARAMS] for start in range(0, len(ids), MAX_IN_PARAMS)] or [[]]
+        df = pd.concat(
+            [
+                read_sqlite(db_path, f"{query} WHERE drug_id IN ({','.join('?' * len(chunk))})", chunk)
+                for chunk in chunks
+            ],
+            ignore_index=True,
+        )
     if df.empty:
         logging.warning("No drug_target records found in %s", db_path)
     return df
 
 
+RXNORM_PATH = "rxnorm_processed_data.csv"
+
+
+@lru_cache(maxsize=4)
+def _read_rxnorm_names(path: Path, mtime_ns: int, size: int) -> pd.DataFrame:
+    return pd.read_csv(path, usecols=["rxcui", "str"], engine="pyarrow")
+
+
+def _load_rxnorm_names(path: Path) -> pd.DataFrame:
+    """The RxNorm id/name columns, parsed once per file version (keyed on mtime and size)."""
+    stat = path.stat()
+    return _read_rxnorm_names(path, stat.st_mtime_ns, stat.st_size)
+
+
 def attach_rxnorm_synonyms(targets: pd.DataFrame, rxnorm_table: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """Attach RxNorm names to the provided drug target table."""
 
@@ -30,13 +69,22 @@ def attach_rxnorm_synonyms(targets: pd.DataFrame, rxnorm_table: Optional[pd.Data
 
     if rxnorm_table is None:
         try:
-            rxnorm_table = pd.read_csv("rxnorm_processed_data.csv")
+            rxnorm_table = _load_rxnorm_names(Path(RXNORM_PATH))
         except FileNotFoundError:
             logging.warning("rxnorm_processed_data.csv not found; skipping synonym expansion")
             return targets.copy()
 
-    rxnorm = rxnorm_table.rename(columns={"rxcui": "rxnorm_id", "str": "drug_name"})
-    merged = targets.merge(rxnorm[["rxnorm_id", "drug_name"]], left_on="drug_id", right_on="rxnorm_id", how="left")
+    rxnorm = rxnorm_table.rename(columns={"rxcui": "rxnorm_id", "str": "drug_name"})[["rxnorm_id", "drug_name"]]
+    if rxnorm["rxnorm_id"].is_unique:
+        # One name per concept: a hash lookup gives the same rows as the join without building it.
+        lookup = rxnorm.set_index("rxnorm_id")["drug_name"]
+        merged = targets.reset_index(drop=True)
+        matched = merged["drug_id"].isin(lookup.index)
+        merged["rxnorm_id"] = merged["drug_id"].where(matched)
+        merged["drug_name"] = merged["drug_id"].map(lookup)
+    else:
+        # Several names per concept expand into one row per synonym, which needs the join.
+        merged = targets.merge(rxnorm, left_on="drug_id", right_on="rxnorm_id", how="left")
     merged["preferred_name"] = merged["drug_name"].fillna(merged["drug_id"])
     return merged
 
@@ -44,15 +92,17 @@ def attach_rxnorm_synonyms(targets: pd.DataFrame, rxnorm_table: Optional[pd.Data
 def summarise_by_drug(targets: pd.DataFrame) -> pd.DataFrame:
     if targets.empty:
         return pd.DataFrame(columns=["drug_id", "n_targets", "sources"])
-    return (
-        targets.groupby("drug_id")
-        .agg(n_targets=("target_id", "nunique"), sources=("source", lambda x: "|".join(sorted(set(x)))))
-        .reset_index()
-    )
+    n_targets = targets.groupby("drug_id")["target_id"].nunique()
+    # Dedupe and sort once up front so the per-drug join is a built-in string aggregation.
+    pairs = targets[["drug_id", "source"]].dropna().drop_duplicates().sort_values(["drug_id", "source"])
+    sources = pairs.groupby("drug_id", sort=False)["source"].agg("|".join)
+    summary = n_targets.to_frame("n_targets").join(sources.rename("sources"))
+    summary["sources"] = summary["sources"].fillna("")
+    return summary.reset_index()
 
 
 def export_mapping(targets: pd.DataFrame, path: Path) -> None:
     if targets.empty:
         logging.warning("Target mapping empty; writing placeholder file to %s", path)
-    targets.to_csv(path, index=False)
+    write_table(targets, Path(path), arrow_csv=True)
     logging.info("Wrote %s drug-target associations to %s", len(targets), path)
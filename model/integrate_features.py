@@ -1,8 +1,12 @@
 """Feature integration utilities for downstream modeling."""
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
+NORMALISED_COLUMNS = ["propagation_score", "drug_count", "ocular_reports", "active_trials"]
+KEY_COLUMNS = ["target_id", "disease_id"]
+
 
 def normalise_series(series: pd.Series) -> pd.Series:
     if series.empty:
@@ -14,6 +18,17 @@ def normalise_series(series: pd.Series) -> pd.Series:
     return (series - min_val) / (max_val - min_val)
 
 
+def _lookup(keys: pd.Series, values: pd.Series) -> pd.Series:
+    """``keys.map(values)``, resolved once per category when ``keys`` is categorical."""
+    if not isinstance(keys.dtype, pd.CategoricalDtype):
+        return keys.map(values)
+    per_category = values.reindex(keys.cat.categories).to_numpy()
+    codes = keys.cat.codes.to_numpy()
+    if (codes < 0).any():
+        per_category = np.append(per_category.astype(float), np.nan)
+    return pd.Series(per_category[codes], index=keys.index)
+
+
 def integrate_features(
     target_scores: pd.DataFrame,
     drug_targets: pd.DataFrame,
@@ -31,35 +46,24 @@ def integrate_features(
         features["disease_id"] = ""
     if "score" in features.columns and "propagation_score" not in features.columns:
         features.rename(columns={"score": "propagation_score"}, inplace=True)
+    # Keys repeat across diseases and targets; as categoricals every lookup below runs per category.
+    # Their caller-facing dtypes are restored before returning.
+    key_dtypes = features.dtypes[KEY_COLUMNS].to_dict()
+    features = features.astype({column: "category" for column in KEY_COLUMNS})
 
+    # Per-target aggregates are Series keyed by target_id and attached with ``map``,
+    # a single hash lookup that avoids materialising a merged copy of ``features``.
     if not drug_targets.empty:
-        target_counts = (
-            drug_targets.groupby("target_id")
-            .agg(drug_count=("drug_id", "nunique"))
-            .reset_index()
-        )
-        features = features.merge(target_counts, on="target_id", how="left")
+        drug_count = drug_targets.groupby("target_id", observed=True)["drug_id"].nunique()
+        features["drug_count"] = _lookup(features["target_id"], drug_count)
     else:
         features["drug_count"] = 0
 
     if not safety_signals.empty and not drug_targets.empty:
-        safety_scores = (
-            safety_signals.groupby("drug")
-            .agg(ocular_reports=("reports", "sum"))
-            .reset_index()
-        )
-        target_map = (
-            drug_targets[["drug_id", "target_id"]]
-            .drop_duplicates()
-            .merge(safety_scores, left_on="drug_id", right_on="drug", how="left")
-        )
-        target_safety = (
-            target_map.groupby("target_id")
-            .agg(ocular_reports=("ocular_reports", "sum"))
-            .reset_index()
-        )
-        features = features.merge(target_safety, on="target_id", how="left")
-        features["ocular_reports"].fillna(0, inplace=True)
+        ocular_reports = safety_signals.groupby("drug", observed=True)["reports"].sum()
+        pairs = drug_targets[["drug_id", "target_id"]].drop_duplicates()
+        target_safety = _lookup(pairs["drug_id"], ocular_reports).groupby(pairs["target_id"], observed=True).sum()
+        features["ocular_reports"] = _lookup(features["target_id"], target_safety).fillna(0)
     else:
         features["ocular_reports"] = 0
 
@@ -69,17 +73,27 @@ def integrate_features(
         )
         trial_counts["active_trials"] = trial_counts.get("active_trials", trial_counts.get("nct_id", 0))
         trial_counts = trial_counts[["condition", "active_trials"]].drop_duplicates()
-        features = features.merge(
-            trial_counts.rename(columns={"condition": "disease_id"}),
-            on="disease_id",
-            how="left",
-        )
-        features["active_trials"].fillna(0, inplace=True)
+        active_trials = trial_counts.set_index("condition")["active_trials"]
+        if not active_trials.index.is_unique:
+            # A left merge here would silently repeat feature rows once per conflicting count.
+            conflicting = active_trials.index[active_trials.index.duplicated()].unique().tolist()
+            raise ValueError(f"Trials table has several active_trials values for conditions: {conflicting[:5]}")
+        features["active_trials"] = _lookup(features["disease_id"], active_trials).fillna(0)
     else:
         features["active_trials"] = 0
 
-    for col in ["propagation_score", "drug_count", "ocular_reports", "active_trials"]:
-        if col in features.columns:
+    columns = [col for col in NORMALISED_COLUMNS if col in features.columns]
+    if features.empty:
+        for col in columns:
             features[f"{col}_norm"] = normalise_series(features[col].fillna(0))
+    elif columns:
+        # One min/max reduction and one fused rescale over all feature columns at once.
+        values = features[columns].fillna(0).to_numpy(dtype=float)
+        low = values.min(axis=0)
+        span = values.max(axis=0) - low
+        constant = span == 0
+        scaled = (values - low) / np.where(constant, 1.0, span)
+        scaled[:, constant] = 0.0
+        features[[f"{col}_norm" for col in columns]] = scaled
 
-    return features
+    return features.astype(key_dtypes)
@@ -7,6 +7,7 @@ from pathlib import Path
 
 import pandas as pd
 
+from etl._frames import write_csv
 from model.integrate_features import integrate_features
 from model.train_validate import TrainingResult, train_model
 
@@ -15,8 +16,8 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--scores", type=Path, default=Path("target_scores.csv"))
     parser.add_argument("--mapping", type=Path, default=Path("drug_target_mapping.csv"))
-    parser.add_argument("--safety", type=Path, default=Path("ocular_safety.csv"))
-    parser.add_argument("--trials", type=Path, default=Path("trial_summary.csv"))
+    parser.add_argument("--safety", type=Path, default=Path("ocular_safety.parquet"))
+    parser.add_argument("--trials", type=Path, default=Path("trial_summary.parquet"))
     parser.add_argument("--labels", type=Path, help="Optional training labels CSV")
     parser.add_argument("--features-out", type=Path, default=Path("model_features.csv"))
     parser.add_argument("--metrics-out", type=Path, default=Path("model_metrics.json"))
@@ -26,6 +27,8 @@ def parse_args() -> argparse.Namespace:
 def load_csv(path: Path) -> pd.DataFrame:
     if path is None or not path.exists():
         return pd.DataFrame()
+    if path.suffix.lower() in {".parquet", ".pq"}:
+        return pd.read_parquet(path)
     return pd.read_csv(path)
 
 
@@ -41,13 +44,14 @@ def main() -> None:
 
     if args.labels and args.labels.exists():
         labels = pd.read_csv(args.labels)
-        features = features.merge(labels, on=["target_id", "disease_id"], how="left")
+        # At most one label per (target, disease) pair, so feature rows are never repeated.
+        features = features.merge(labels, on=["target_id", "disease_id"], how="left", validate="many_to_one")
         features["label"].fillna(0, inplace=True)
 
         result: TrainingResult = train_model(features)
         args.metrics_out.write_text(json.dumps({"auc": result.auc, "average_precision": result.average_precision}))
 
-    features.to_csv(args.features_out, index=False)
+    write_csv(features, args.features_out)
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import average_precision_score, roc_auc_score
@@ -24,11 +25,15 @@ FEATURE_COLUMNS = [
     "active_trials_norm",
 ]
 
+# Below this many training rows lbfgs converges faster than the stochastic saga solver.
+SAGA_MIN_ROWS = 5000
+
 
 def prepare_dataset(features: pd.DataFrame, label_column: str = "label") -> Tuple[pd.DataFrame, pd.Series]:
     if label_column not in features.columns:
         raise KeyError(f"Label column '{label_column}' missing from features")
-    X = features[[col for col in FEATURE_COLUMNS if col in features.columns]].fillna(0)
+    # Features are min-max normalised to [0, 1], so float32 loses nothing and halves the buffers.
+    X = features[[col for col in FEATURE_COLUMNS if col in features.columns]].fillna(0).astype(np.float32)
     y = features[label_column].astype(int)
     return X, y
 
@@ -42,7 +47,8 @@ def train_model(
     X, y = prepare_dataset(features, label_column)
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state)
 
-    model = LogisticRegression(max_iter=1000)
+    solver = "saga" if len(X_train) >= SAGA_MIN_ROWS else "lbfgs"
+    model = LogisticRegression(solver=solver, max_iter=1000, tol=1e-4)
     model.fit(X_train, y_train)
 
     probs = model.predict_proba(X_test)[:, 1]
@@ -1,61 +1,140 @@
 """Graph interconnectivity metrics used as complementary evidence."""
 from __future__ import annotations
 
-from itertools import combinations
-from typing import Iterable
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import networkx as nx
 import numpy as np
 import pandas as pd
+from scipy import sparse
+from scipy.sparse import csgraph
 
 
-def average_shortest_path(graph: nx.Graph, nodes: Iterable[str]) -> float:
-    sub_nodes = [node for node in nodes if node in graph]
-    if len(sub_nodes) < 2:
+def graph_csr(graph: nx.Graph) -> Tuple[sparse.csr_array, Dict[object, int]]:
+    """Weighted CSR adjacency of ``graph`` plus a node -> row lookup."""
+    nodelist = list(graph.nodes())
+    csr = nx.to_scipy_sparse_array(graph, nodelist=nodelist, weight="weight", dtype=float, format="csr")
+    return csr, {node: idx for idx, node in enumerate(nodelist)}
+
+
+def _mean_pair_distance(csr: sparse.csr_array, indices: Sequence[int], directed: bool) -> float:
+    """Mean finite distance over index pairs ``i < j``, as ``combinations`` would visit them."""
+    if len(indices) < 2:
         return float("nan")
-    lengths = []
-    for a, b in combinations(sub_nodes, 2):
-        try:
-            lengths.append(nx.shortest_path_length(graph, a, b, weight="weight"))
-        except nx.NetworkXNoPath:
-            continue
-    if not lengths:
+    # One multi-source run instead of a Dijkstra per pair; columns restricted to the sources.
+    dist = csgraph.dijkstra(csr, directed=directed, indices=indices)[:, indices]
+    lengths = dist[np.triu_indices(len(indices), k=1)]
+    lengths = lengths[np.isfinite(lengths)]
+    if not lengths.size:
         return float("inf")
     return float(np.mean(lengths))
 
 
-def connectivity_zscore(graph: nx.Graph, nodes: Iterable[str], iterations: int = 1000) -> float:
-    """Compare the observed average path length against random node sets."""
+# Per-process state for the Monte Carlo workers; set once by the pool initializer.
+_WORKER_GRAPH: Optional[Tuple[sparse.csr_array, bool]] = None
 
-    observed = average_shortest_path(graph, nodes)
-    if np.isnan(observed) or np.isinf(observed):
+
+def _init_worker(csr: sparse.csr_array, directed: bool) -> None:
+    global _WORKER_GRAPH
+    _WORKER_GRAPH = (csr, directed)
+
+
+def _worker_means(samples: np.ndarray) -> List[float]:
+    csr, directed = _WORKER_GRAPH
+    return [_mean_pair_distance(csr, sample, directed) for sample in samples]
+
+
+def _random_means(
+    csr: sparse.csr_array, samples: np.ndarray, directed: bool, n_jobs: Optional[int]
+) -> List[float]:
+    workers = min(n_jobs or os.cpu_count() or 1, len(samples))
+    if workers <= 1:
+        return [_mean_pair_distance(csr, sample, directed) for sample in samples]
+    # The CSR is shipped to each worker once via the initializer, not with every task;
+    # samples go out in contiguous batches so results come back in draw order.
+    batch = -(-len(samples) // (workers * 4))
+    batches = [samples[start : start + batch] for start in range(0, len(samples), batch)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(csr, directed)) as pool:
+        return [mean for means in pool.map(_worker_means, batches) for mean in means]
+
+
+def average_shortest_path(graph: nx.Graph, nodes: Iterable[str]) -> float:
+    sub_nodes = [node for node in nodes if node in graph]
+    if len(sub_nodes) < 2:
         return float("nan")
+    csr, node_to_idx = graph_csr(graph)
+    return _mean_pair_distance(csr, [node_to_idx[node] for node in sub_nodes], graph.is_directed())
+
+
+def connectivity_zscore(
+    graph: nx.Graph, nodes: Iterable[str], iterations: int = 1000, n_jobs: Optional[int] = None
+) -> float:
+    """Compare the observed average path length against random node sets.
+
+    The random sets are scored across ``n_jobs`` processes (default: all CPUs, 1 = serial).
+    """
 
     sub_nodes = [node for node in nodes if node in graph]
     if len(sub_nodes) < 2:
         return float("nan")
 
-    nodes_list = list(graph.nodes())
+    # The CSR is built once and shared by the observed and every random set.
+    csr, node_to_idx = graph_csr(graph)
+    directed = graph.is_directed()
+    observed = _mean_pair_distance(csr, [node_to_idx[node] for node in sub_nodes], directed)
+    if np.isnan(observed) or np.isinf(observed):
+        return float("nan")
+
+    # Random sets come from the largest (weakly) connected component, so disconnected
+    # draws cannot contribute infinite means; on a connected graph this is every node.
+    _, labels = csgraph.connected_components(csr, directed=directed, connection="weak")
+    pool = np.flatnonzero(labels == np.bincount(labels).argmax())
+    size = len(sub_nodes)
+    if len(pool) < size:
+        return float("nan")
+
     rng = np.random.default_rng(42)
-    random_lengths = []
-    for _ in range(iterations):
-        sample = rng.choice(nodes_list, size=len(sub_nodes), replace=False)
-        random_lengths.append(average_shortest_path(graph, sample))
-
-    random_array = np.array(random_lengths, dtype=float)
-    mu = np.nanmean(random_array)
-    sigma = np.nanstd(random_array)
+    # Row indices drawn straight from the generator into one (iterations, k) array, so batches
+    # ship to workers as single contiguous slices; the draw sequence matches sampling node labels.
+    samples = np.empty((iterations, size), dtype=np.intp)
+    for row in samples:
+        row[:] = pool[rng.choice(len(pool), size=size, replace=False)]
+    random_array = np.array(_random_means(csr, samples, directed, n_jobs), dtype=float)
+    random_array = random_array[np.isfinite(random_array)]
+    if not random_array.size:
+        return float("nan")
+    mu = np.mean(random_array)
+    sigma = np.std(random_array)
     if sigma == 0 or np.isnan(sigma):
         return float("nan")
     return float((observed - mu) / sigma)
 
 
-def enrich_interactions(graph: nx.Graph, nodes: Iterable[str]) -> pd.DataFrame:
-    """Return edges among the provided nodes for inspection."""
+def enrich_interactions(
+    graph: nx.Graph,
+    nodes: Iterable[str],
+    csr: Optional[Tuple[sparse.csr_array, Dict[object, int]]] = None,
+) -> pd.DataFrame:
+    """Return edges among the provided nodes for inspection.
+
+    Pass a ``graph_csr(graph)`` result as ``csr`` to reuse it across calls.
+    """
 
     sub_nodes = [node for node in nodes if node in graph]
-    subgraph = graph.subgraph(sub_nodes)
-    records = []
-    for u, v, data in subgraph.edges(data=True):
-        records.append({"src": u, "dst": v, "weight": data.get("weight", 1.0)})
-    return pd.DataFrame(records)
+    if not sub_nodes:
+        return pd.DataFrame(columns=["src", "dst", "weight"])
+    matrix, node_to_idx = csr if csr is not None else graph_csr(graph)
+    # Induced subgraph as one CSR row/column slice, in graph node order like ``graph.subgraph``.
+    indices = np.unique(np.array([node_to_idx[node] for node in sub_nodes], dtype=np.intp))
+    sub = matrix[indices][:, indices].tocoo()
+    rows, cols = sub.row, sub.col
+    if not graph.is_directed():
+        keep = rows <= cols  # undirected edges are stored in both triangles
+        rows, cols, data = rows[keep], cols[keep], sub.data[keep]
+    else:
+        data = sub.data
+    order = np.lexsort((cols, rows))
+    labels = np.array(list(node_to_idx), dtype=object)[indices]
+    return pd.DataFrame({"src": labels[rows[order]], "dst": labels[cols[order]], "weight": data[order]})
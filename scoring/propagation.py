@@ -1,49 +1,83 @@
 """Network propagation utilities for disease module scoring."""
 from __future__ import annotations
 
-from typing import Mapping
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence
 
 import networkx as nx
 import numpy as np
 import pandas as pd
+from scipy import sparse
 
 
-def heat_diffusion(
-    graph: nx.Graph,
+def transition_transpose(graph: nx.Graph, nodes: Sequence[str]) -> sparse.csr_array:
+    """Transpose of the row-normalised weighted adjacency, kept sparse (O(nnz) memory)."""
+    adjacency = nx.to_scipy_sparse_array(graph, nodelist=nodes, weight="weight", dtype=float, format="csr")
+    degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    degree[degree == 0] = 1
+    return (sparse.diags_array(1.0 / degree) @ adjacency).T.tocsr()
+
+
+@dataclass(frozen=True)
+class Transition:
+    """Precomputed propagation operator, reusable across seed sets on the same graph."""
+
+    nodes: List[str]
+    index: Dict[str, int]
+    matrix_t: sparse.csr_array
+
+
+def build_transition(graph: nx.Graph) -> Transition:
+    nodes = list(graph.nodes())
+    if not nodes:
+        return Transition(nodes, {}, sparse.csr_array((0, 0)))
+    return Transition(nodes, {node: i for i, node in enumerate(nodes)}, transition_transpose(graph, nodes))
+
+
+def heat_diffusion_precomputed(
+    transition: Transition,
     seeds: Mapping[str, float],
     alpha: float = 0.7,
     tol: float = 1e-6,
     max_iter: int = 100,
 ) -> pd.DataFrame:
-    """Perform heat diffusion propagation over the graph."""
+    """Heat diffusion over a :class:`Transition` built once with :func:`build_transition`."""
 
-    if graph.number_of_nodes() == 0:
+    if not transition.nodes:
         return pd.DataFrame(columns=["node", "score"])
 
-    nodes = list(graph.nodes())
-    index = {node: i for i, node in enumerate(nodes)}
-    seed_vec = np.zeros(len(nodes))
+    seed_vec = np.zeros(len(transition.nodes))
     for node, weight in seeds.items():
-        if node in index:
-            seed_vec[index[node]] = weight
-
-    adjacency = nx.to_numpy_array(graph, nodelist=nodes, weight="weight", dtype=float)
-    degree = adjacency.sum(axis=1)
-    degree[degree == 0] = 1
-    normalised = adjacency / degree[:, None]
+        if node in transition.index:
+            seed_vec[transition.index[node]] = weight
 
     scores = seed_vec.copy()
     for _ in range(max_iter):
-        updated = alpha * seed_vec + (1 - alpha) * normalised.T.dot(scores)
+        updated = alpha * seed_vec + (1 - alpha) * transition.matrix_t.dot(scores)
         if np.linalg.norm(updated - scores, ord=1) < tol:
             scores = updated
             break
         scores = updated
 
-    df = pd.DataFrame({"node": nodes, "score": scores})
+    df = pd.DataFrame({"node": transition.nodes, "score": scores})
     return df.sort_values("score", ascending=False).reset_index(drop=True)
 
 
+def heat_diffusion(
+    graph: nx.Graph,
+    seeds: Mapping[str, float],
+    alpha: float = 0.7,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    transition: Optional[Transition] = None,
+) -> pd.DataFrame:
+    """Perform heat diffusion propagation over the graph."""
+
+    if transition is None:
+        transition = build_transition(graph)
+    return heat_diffusion_precomputed(transition, seeds, alpha=alpha, tol=tol, max_iter=max_iter)
+
+
 def propagate_multiple(
     graph: nx.Graph,
     seed_sets: Mapping[str, Mapping[str, float]],
@@ -52,8 +86,9 @@ def propagate_multiple(
     """Propagate multiple seed dictionaries and return stacked scores."""
 
     frames = []
+    transition = build_transition(graph) if seed_sets else None
     for label, seeds in seed_sets.items():
-        result = heat_diffusion(graph, seeds, **kwargs)
+        result = heat_diffusion(graph, seeds, transition=transition, **kwargs)
         result.insert(0, "seed_set", label)
         frames.append(result)
     if not frames:
@@ -3,24 +3,21 @@ from __future__ import annotations
 
 import argparse
 import logging
-import sqlite3
 from pathlib import Path
 from typing import Dict
 
 import networkx as nx
+import numpy as np
 import pandas as pd
 
-from scoring.propagation import heat_diffusion
+from etl._frames import read_sqlite, write_table
+from scoring.propagation import build_transition, heat_diffusion_precomputed
 
 
 def load_graph(db_path: Path) -> nx.Graph:
-    with sqlite3.connect(db_path) as conn:
-        df = pd.read_sql_query("SELECT src, dst, sign FROM protein_edge", conn)
-    graph = nx.DiGraph()
-    for row in df.itertuples(index=False):
-        weight = 1.0 if row.sign == "+" else -1.0
-        graph.add_edge(row.src, row.dst, weight=weight)
-    return graph
+    df = read_sqlite(db_path, "SELECT src, dst, sign FROM protein_edge")
+    df["weight"] = np.where(df["sign"].to_numpy() == "+", 1.0, -1.0)
+    return nx.from_pandas_edgelist(df, source="src", target="dst", edge_attr="weight", create_using=nx.DiGraph)
 
 
 def load_seeds(path: Path) -> Dict[str, Dict[str, float]]:
@@ -44,9 +41,11 @@ def main() -> None:
     logging.info("Loaded graph with %s nodes and %s edges", graph.number_of_nodes(), graph.number_of_edges())
 
     seed_sets = load_seeds(args.seeds)
+    # The graph is fixed for the run, so the transition matrix is built once for every disease.
+    transition = build_transition(graph)
     all_scores = []
     for disease_id, seeds in seed_sets.items():
-        scores = heat_diffusion(graph, seeds)
+        scores = heat_diffusion_precomputed(transition, seeds)
         scores.insert(0, "disease_id", disease_id)
         all_scores.append(scores)
 
@@ -56,7 +55,7 @@ def main() -> None:
 
     result = pd.concat(all_scores, ignore_index=True)
     result.rename(columns={"node": "target_id"}, inplace=True)
-    result.to_csv(args.output, index=False)
+    write_table(result, args.output, arrow_csv=True)
     logging.info("Wrote scores to %s", args.output)
 
 
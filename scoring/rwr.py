@@ -7,6 +7,8 @@ import networkx as nx
 import numpy as np
 import pandas as pd
 
+from scoring.propagation import transition_transpose
+
 
 def random_walk_with_restart(
     graph: nx.Graph,
@@ -26,14 +28,11 @@ def random_walk_with_restart(
         if node in index:
             seed_vec[index[node]] = weight / norm
 
-    adjacency = nx.to_numpy_array(graph, nodelist=nodes, weight="weight", dtype=float)
-    degree = adjacency.sum(axis=1)
-    degree[degree == 0] = 1
-    transition = adjacency / degree[:, None]
+    transition_t = transition_transpose(graph, nodes)
 
     scores = seed_vec.copy()
     for _ in range(max_iter):
-        updated = (1 - restart_prob) * transition.T.dot(scores) + restart_prob * seed_vec
+        updated = (1 - restart_prob) * transition_t.dot(scores) + restart_prob * seed_vec
         if np.linalg.norm(updated - scores, ord=1) < tol:
             scores = updated
             break
@@ -3,17 +3,22 @@ from __future__ import annotations
 
 import json
 import logging
-import math
+import os
 import pathlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Iterable, List, Optional, Sequence
 
 import numpy as np
 import pandas as pd
 
+from signatures.expression import normal_pvalues, row_moments, welch_pvalues
+
 
 logger = logging.getLogger(__name__)
 
+MAX_WORKERS = 8
+
 
 @dataclass
 class ExpressionStudy:
@@ -33,7 +38,7 @@ class ExpressionStudy:
         `disease_id`, `study_id`, `gene_symbol`, `logfc`, `se`, `pvalue`.
         """
 
-        matrix = self.expression.copy()
+        matrix = self.expression
         if self.gene_column not in matrix.columns:
             raise KeyError(f"Expression table missing gene column '{self.gene_column}'")
 
@@ -45,86 +50,68 @@ class ExpressionStudy:
         if missing:
             raise KeyError(f"Expression table missing sample columns: {missing}")
 
-        matrix = matrix.set_index(self.gene_column).astype(float)
-        case = matrix[list(self.case_samples)]
-        control = matrix[list(self.control_samples)]
-
-        case_mean = case.mean(axis=1)
-        control_mean = control.mean(axis=1)
-        logfc = np.log2((case_mean + 1e-6) / (control_mean + 1e-6))
-
-        case_var = case.var(axis=1, ddof=1)
-        control_var = control.var(axis=1, ddof=1)
+        genes = matrix[self.gene_column].to_numpy()
+        case_mean, case_var = row_moments(matrix[list(self.case_samples)].to_numpy(dtype=np.float32))
+        control_mean, control_var = row_moments(matrix[list(self.control_samples)].to_numpy(dtype=np.float32))
         case_n = len(self.case_samples)
         control_n = len(self.control_samples)
 
-        se = np.sqrt(case_var / case_n + control_var / control_n)
-        se.replace(0, np.nan, inplace=True)
-
         with np.errstate(divide="ignore", invalid="ignore"):
+            logfc = np.log2((case_mean + 1e-6) / (control_mean + 1e-6))
+            se = np.sqrt(case_var / case_n + control_var / control_n)
+            se[se == 0] = np.nan
             t_stat = logfc / se
 
-        dof_num = (case_var / case_n + control_var / control_n) ** 2
-        dof_den = (
-            (case_var**2) / ((case_n**2) * max(case_n - 1, 1))
-            + (control_var**2) / ((control_n**2) * max(control_n - 1, 1))
-        )
-        with np.errstate(divide="ignore", invalid="ignore"):
+            dof_num = (case_var / case_n + control_var / control_n) ** 2
+            dof_den = (
+                (case_var**2) / ((case_n**2) * max(case_n - 1, 1))
+                + (control_var**2) / ((control_n**2) * max(control_n - 1, 1))
+            )
             dof = dof_num / dof_den
 
-        try:
-            from scipy.stats import t as student_t  # type: ignore
-
-            pvalues = 2 * student_t.sf(np.abs(t_stat), dof)
-        except Exception:  # pragma: no cover - SciPy optional
-            pvalues = 2 * (1 - 0.5 * (1 + np.vectorize(_erf)(np.abs(t_stat) / math.sqrt(2))))
+        # Rows with a missing effect or SE are dropped, so the p-value is only computed for the rest.
+        keep = ~(np.isnan(logfc) | np.isnan(se))
+        t_stat, dof = t_stat[keep], dof[keep]
+        pvalues = welch_pvalues(t_stat, dof)
+        pvalues = np.asarray(pvalues, dtype=float)
+        has_pvalue = ~np.isnan(pvalues)
+        rows = np.flatnonzero(keep)[has_pvalue]
 
-        result = pd.DataFrame(
+        return pd.DataFrame(
             {
                 "disease_id": self.disease_id,
                 "study_id": self.study_id,
-                "gene_symbol": matrix.index,
-                "logfc": logfc.values,
-                "se": se.values,
-                "pvalue": np.asarray(pvalues),
-            }
+                "gene_symbol": genes[rows],
+                "logfc": logfc[rows],
+                "se": se[rows],
+                "pvalue": pvalues[has_pvalue],
+            },
+            index=rows,
         )
-        return result.dropna(subset=["logfc", "se", "pvalue"])
-
-
-def _erf(x: float) -> float:
-    """Numerically stable error function fallback."""
-
-    # Polynomial approximation (Abramowitz & Stegun 7.1.26)
-    sign = 1 if x >= 0 else -1
-    x = abs(x)
-    t = 1.0 / (1.0 + 0.5 * x)
-    tau = t * math.exp(
-        -x * x
-        - 1.26551223
-        + 1.00002368 * t
-        + 0.37409196 * t**2
-        + 0.09678418 * t**3
-        - 0.18628806 * t**4
-        + 0.27886807 * t**5
-        - 1.13520398 * t**6
-        + 1.48851587 * t**7
-        - 0.82215223 * t**8
-        + 0.17087277 * t**9
-    )
-    return sign * (1 - tau)
 
 
-def run_study_analysis(studies: Iterable[ExpressionStudy]) -> List[pd.DataFrame]:
-    """Execute differential expression across all studies."""
+def _run_study(study: ExpressionStudy) -> Optional[pd.DataFrame]:
+    try:
+        return study.run()
+    except Exception as exc:  # pragma: no cover - defensive guard
+        logger.error("Study %s failed: %s", study.study_id, exc)
+        return None
+
 
-    outputs: List[pd.DataFrame] = []
-    for study in studies:
-        try:
-            outputs.append(study.run())
-        except Exception as exc:  # pragma: no cover - defensive guard
-            logger.error("Study %s failed: %s", study.study_id, exc)
-    return outputs
+def run_study_analysis(studies: Iterable[ExpressionStudy], n_jobs: Optional[int] = None) -> List[pd.DataFrame]:
+    """Execute differential expression across all studies.
+
+    Studies run in ``n_jobs`` processes (default: all CPUs, 1 = serial); output keeps input order.
+    """
+
+    studies = list(studies)
+    workers = min(n_jobs or os.cpu_count() or 1, len(studies))
+    if workers <= 1:
+        results = [_run_study(study) for study in studies]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_study, studies))
+    return [table for table in results if table is not None]
 
 
 def meta_analyse_studies(study_tables: Sequence[pd.DataFrame]) -> pd.DataFrame:
@@ -162,59 +149,55 @@ def meta_analyse_studies(study_tables: Sequence[pd.DataFrame]) -> pd.DataFrame:
             ]
         )
 
-    def _per_group(df: pd.DataFrame) -> pd.Series:
-        df = df.copy()
-        df["variance"] = df["se"] ** 2
-        df = df.replace([np.inf, -np.inf], np.nan).dropna(subset=["variance"])
-        df = df[df["variance"] > 0]
-        if df.empty:
-            return pd.Series(
-                {
-                    "meta_logfc": np.nan,
-                    "meta_se": np.nan,
-                    "meta_pvalue": np.nan,
-                    "tau2": np.nan,
-                    "i2": np.nan,
-                    "q": np.nan,
-                    "n_studies": 0,
-                }
-            )
-
-        weights = 1.0 / df["variance"]
-        effects = df["logfc"]
-        weighted_mean = (weights * effects).sum() / weights.sum()
-        q = (weights * (effects - weighted_mean) ** 2).sum()
-        df_deg = max(len(df) - 1, 0)
-
-        c = weights.sum() - (weights**2).sum() / weights.sum() if weights.sum() else 0.0
-        tau2 = max((q - df_deg) / c, 0.0) if c > 0 else 0.0
-
-        random_weights = 1.0 / (df["variance"] + tau2)
-        weight_sum = random_weights.sum()
-        meta = (random_weights * effects).sum() / weight_sum
-        se = math.sqrt(1.0 / weight_sum)
-        z = meta / se if se > 0 else 0.0
-        pvalue = 2 * (1 - 0.5 * (1 + math.erf(abs(z) / math.sqrt(2))))
-        i2 = max((q - df_deg) / q, 0.0) if q > 0 else 0.0
-
-        return pd.Series(
-            {
-                "meta_logfc": meta,
-                "meta_se": se,
-                "meta_pvalue": pvalue,
-                "tau2": tau2,
-                "i2": i2,
-                "q": q,
-                "n_studies": len(df),
-            }
-        )
-
-    aggregated = (
-        combined.groupby(["disease_id", "gene_symbol"], as_index=False)
-        .apply(_per_group)
-        .reset_index()
-    )
-    aggregated = aggregated.drop(columns=["level_2"], errors="ignore")
+    # Per-group sufficient statistics via bincount over group codes, in place of a Python
+    # callback per (disease, gene). Sums skip NaN effects exactly like Series.sum did.
+    for key in ("disease_id", "gene_symbol"):
+        combined[key] = combined[key].astype("category")
+    grouped = combined.groupby(["disease_id", "gene_symbol"], sort=True, observed=True)
+    codes = grouped.ngroup().to_numpy()
+    n_groups = grouped.ngroups
+
+    variance = (combined["se"].to_numpy(dtype=float)) ** 2
+    valid = np.isfinite(variance) & (variance > 0)
+    codes = codes[valid]
+    variance = variance[valid]
+    effects = combined["logfc"].to_numpy(dtype=float)[valid]
+    effects = np.where(np.isinf(effects), np.nan, effects)
+
+    def _sum(values: np.ndarray) -> np.ndarray:
+        return np.bincount(codes, weights=np.nan_to_num(values, nan=0.0), minlength=n_groups)
+
+    weights = 1.0 / variance
+    n_studies = np.bincount(codes, minlength=n_groups)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight_sum = _sum(weights)
+        weighted_mean = _sum(weights * effects) / weight_sum
+        q = _sum(weights * (effects - weighted_mean[codes]) ** 2)
+        df_deg = np.maximum(n_studies - 1, 0)
+
+        c = np.where(weight_sum != 0, weight_sum - _sum(weights**2) / weight_sum, 0.0)
+        tau2 = np.where(c > 0, np.maximum((q - df_deg) / c, 0.0), 0.0)
+
+        random_weights = 1.0 / (variance + tau2[codes])
+        random_sum = _sum(random_weights)
+        meta = _sum(random_weights * effects) / random_sum
+        meta_se = np.sqrt(1.0 / random_sum)
+        z = np.where(meta_se > 0, meta / meta_se, 0.0)
+        pvalue = normal_pvalues(z)
+        i2 = np.where(q > 0, np.maximum((q - df_deg) / q, 0.0), 0.0)
+
+    aggregated = grouped.size().index.to_frame(index=False)
+    empty = n_studies == 0
+    for name, values in (
+        ("meta_logfc", meta),
+        ("meta_se", meta_se),
+        ("meta_pvalue", pvalue),
+        ("tau2", tau2),
+        ("i2", i2),
+        ("q", q),
+    ):
+        aggregated[name] = np.where(empty, np.nan, values)
+    aggregated["n_studies"] = n_studies
     return aggregated
 
 
@@ -242,20 +225,31 @@ def integrate_disease_evidence(
     combined = meta_expression.copy()
     combined = combined.dropna(subset=["disease_id", "gene_symbol", "meta_logfc", "meta_pvalue"])
     combined["expression_score_raw"] = _expression_score(combined["meta_logfc"], combined["meta_pvalue"])
+    keys = ["disease_id", "gene_symbol"]
+    for key in keys:
+        combined[key] = combined[key].astype("category")
 
     if seeds is not None and not seeds.empty:
         seed_table = seeds.copy()
+        # Recode onto the expression categories so both sides share integer codes; seed genes
+        # absent from the expression table could never match and become NaN here.
+        for key in keys:
+            seed_table[key] = pd.Categorical(seed_table[key], categories=combined[key].cat.categories)
         seed_table = seed_table.dropna(subset=["disease_id", "gene_symbol", "score"])
-        seed_summary = (
-            seed_table.groupby(["disease_id", "gene_symbol"], as_index=False)
-            .agg(seed_score=("score", "mean"))
-        )
-        combined = combined.merge(seed_summary, on=["disease_id", "gene_symbol"], how="left")
+        # One int64 key per (disease, gene) pair: a mean-by-key plus an index lookup replaces the merge.
+        n_genes = len(combined["gene_symbol"].cat.categories)
+
+        def pair_codes(frame: pd.DataFrame) -> np.ndarray:
+            disease = frame["disease_id"].cat.codes.to_numpy(dtype=np.int64)
+            return disease * n_genes + frame["gene_symbol"].cat.codes.to_numpy(dtype=np.int64)
+
+        seed_summary = seed_table["score"].groupby(pair_codes(seed_table)).mean()
+        combined["seed_score"] = seed_summary.reindex(pair_codes(combined)).to_numpy()
     else:
         combined["seed_score"] = np.nan
 
-    combined["expression_score"] = combined.groupby("disease_id")["expression_score_raw"].transform(_normalise)
-    combined["seed_score_norm"] = combined.groupby("disease_id")["seed_score"].transform(_normalise)
+    combined["expression_score"] = _normalise(combined["expression_score_raw"], combined["disease_id"])
+    combined["seed_score_norm"] = _normalise(combined["seed_score"], combined["disease_id"])
 
     weight_sum = max(expression_weight + seed_weight, 1e-9)
     combined_score = (
@@ -264,48 +258,42 @@ def integrate_disease_evidence(
     ) / weight_sum
     combined["combined_score"] = combined_score.clip(0, 1)
 
-    def build_sources(row: pd.Series) -> List[str]:
-        evidence: List[str] = []
-        if not math.isnan(row.get("expression_score", np.nan)):
-            evidence.append("expression")
-        if not math.isnan(row.get("seed_score", np.nan)):
-            evidence.append("seed")
-        return evidence
-
-    combined["sources"] = combined.apply(build_sources, axis=1)
-    return combined[
-        [
-            "disease_id",
-            "gene_symbol",
-            "combined_score",
-            "expression_score",
-            "seed_score",
-            "n_studies",
-            "sources",
-        ]
-    ].sort_values(["disease_id", "combined_score"], ascending=[True, False])
+    # Two evidence bits select one of four prebuilt lists; rows share them, nothing mutates them here.
+    source_lists = np.empty(4, dtype=object)
+    source_lists[:] = [[], ["seed"], ["expression"], ["expression", "seed"]]
+    has_expression = combined["expression_score"].notna().to_numpy()
+    has_seed = combined["seed_score"].notna().to_numpy()
+    combined["sources"] = source_lists[has_expression * 2 + has_seed]
+    # Stable lexsort on the disease codes (lexical category order) and descending score,
+    # the same order sort_values gave, gathered with a single take.
+    order = np.lexsort(
+        (-combined["combined_score"].to_numpy(dtype=float), combined["disease_id"].cat.codes.to_numpy())
+    )
+    columns = ["disease_id", "gene_symbol", "combined_score", "expression_score", "seed_score", "n_studies", "sources"]
+    return combined[columns].take(order)
 
 
 def _expression_score(logfc: pd.Series, pvalue: pd.Series) -> pd.Series:
     with np.errstate(divide="ignore"):
         signed_logp = np.sign(logfc) * (-np.log10(pvalue.clip(lower=1e-12)))
-    signed_logp = signed_logp.replace([np.inf, -np.inf], np.nan)
-    signed_logp.fillna(0, inplace=True)
-    return signed_logp
+    # One finite mask covers both the +/-inf and NaN cases.
+    return signed_logp.where(np.isfinite(signed_logp), 0.0)
+
+
+def _normalise(series: pd.Series, groups: pd.Series) -> pd.Series:
+    """Min-max scale ``series`` within each group, broadcasting C-level group reductions.
 
+    All-missing groups stay missing; constant groups keep their values with gaps filled by 0.
+    """
 
-def _normalise(series: pd.Series) -> pd.Series:
-    if series.isna().all():
-        return series
-    valid = series.dropna()
-    if valid.empty:
-        return series
-    min_val = valid.min()
-    max_val = valid.max()
-    if math.isclose(min_val, max_val):
-        return series.fillna(0)
-    scaled = (series - min_val) / (max_val - min_val)
-    return scaled.fillna(0)
+    grouped = series.groupby(groups, observed=True)
+    min_val = grouped.transform("min")
+    max_val = grouped.transform("max")
+    span = max_val - min_val
+    # math.isclose with its default rel_tol, per row.
+    constant = span.abs() <= 1e-9 * np.maximum(min_val.abs(), max_val.abs())
+    scaled = ((series - min_val) / span.where(~constant)).where(~constant, series).fillna(0)
+    return scaled.where(min_val.notna())
 
 
 def load_study_config(path: str | pathlib.Path) -> List[ExpressionStudy]:
@@ -321,19 +309,29 @@ def load_study_config(path: str | pathlib.Path) -> List[ExpressionStudy]:
         entries = payload if isinstance(payload, list) else payload.get("studies", [])
         records = pd.DataFrame(entries)
     else:
-        records = pd.read_csv(path)
+        records = pd.read_csv(path, engine="pyarrow")
 
     required = {"study_id", "disease_id", "expression_path", "case_samples", "control_samples"}
     missing = required.difference(records.columns)
     if missing:
         raise ValueError(f"Study config missing columns: {sorted(missing)}")
 
+    rows = records.to_dict(orient="records")
+    paths = [pathlib.Path(row["expression_path"]).resolve() for row in rows]
+    # Studies sharing an expression file (multi-contrast re-analyses) share one read; reads overlap.
+    unique_paths = list(dict.fromkeys(paths))
+    tables = {}
+    if unique_paths:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(unique_paths))) as pool:
+            futures = {path: pool.submit(_load_expression_table, path) for path in unique_paths}
+            tables = {path: future.result() for path, future in futures.items()}
+
     studies: List[ExpressionStudy] = []
-    for row in records.to_dict(orient="records"):
+    for row, path in zip(rows, paths):
         gene_column = row.get("gene_column", "gene_symbol")
         case_samples = _parse_list(row["case_samples"])
         control_samples = _parse_list(row["control_samples"])
-        expression = _load_expression_table(row["expression_path"])
+        expression = tables[path]
         studies.append(
             ExpressionStudy(
                 study_id=str(row["study_id"]),
@@ -361,19 +359,25 @@ def _load_expression_table(path: str | pathlib.Path) -> pd.DataFrame:
         raise FileNotFoundError(file_path)
     suffix = file_path.suffix.lower()
     if suffix in {".parquet", ".pq"}:
-        return pd.read_parquet(file_path)
+        return pd.read_parquet(file_path, engine="pyarrow")
     if suffix in {".tsv", ".tab"}:
-        return pd.read_csv(file_path, sep="\t")
-    return pd.read_csv(file_path)
+        return pd.read_csv(file_path, sep="\t", engine="pyarrow")
+    return pd.read_csv(file_path, engine="pyarrow")
 
 
 def save_dataframe(df: pd.DataFrame, path: str | pathlib.Path) -> None:
+    """Write ``df`` as CSV/TSV when the suffix asks for text, otherwise as zstd Parquet."""
+
     path = pathlib.Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    if path.suffix.lower() in {".parquet", ".pq"}:
-        df.to_parquet(path, index=False)
-    else:
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
         df.to_csv(path, index=False)
+    elif suffix in {".tsv", ".tab"}:
+        df.to_csv(path, sep="\t", index=False)
+    else:
+        # List-valued ``sources`` is stored natively as a Parquet list column.
+        df.to_parquet(path, index=False, engine="pyarrow", compression="zstd", compression_level=3)
 
 
 def run_pipeline(
@@ -394,7 +398,7 @@ def run_pipeline(
     meta = meta_analyse_studies(tables)
     save_dataframe(meta, output_expression)
 
-    seeds = pd.read_csv(seed_path) if seed_path else None
+    seeds = pd.read_csv(seed_path, engine="pyarrow") if seed_path else None
     integrated = integrate_disease_evidence(meta, seeds, expression_weight, seed_weight)
     save_dataframe(integrated, output_disease_gene)
 
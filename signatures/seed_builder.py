@@ -3,11 +3,16 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from pathlib import Path
+from typing import Iterable, List, Mapping, Optional
 
 import numpy as np
 import pandas as pd
 
+from etl._frames import write_table
+
+SEED_COLUMNS = ["disease_id", "gene_symbol", "score", "source", "evidence_type", "details"]
+
 
 @dataclass
 class SeedEvidence:
@@ -107,8 +112,9 @@ def load_gwas_seeds(efo_ids: Iterable[str], max_pvalue: float = 5e-8) -> pd.Data
         if df.empty:
             continue
         df["disease_id"] = efo_id
-        df["score"] = -df["pvalue"].apply(lambda x: pd.NA if x <= 0 else np.log10(x))
-        df["score"].fillna(-8, inplace=True)
+        pvalues = df["pvalue"].to_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            df["score"] = np.where(pvalues > 0, -np.log10(pvalues), -8.0)
         df["source"] = "GWAS"
         df["evidence_type"] = "genetic"
         frames.append(df[["disease_id", "gene_symbol", "score", "source", "evidence_type"]])
@@ -126,25 +132,41 @@ def assemble_seed_table(
 ) -> pd.DataFrame:
     """Merge the available seed evidence into a harmonised table."""
 
-    frames: List[pd.DataFrame] = []
+    sources: List[Mapping[str, object]] = []
     if opentargets is not None and not opentargets.empty:
-        frames.append(opentargets.copy())
+        sources.append(opentargets)
     if gwas is not None and not gwas.empty:
-        frames.append(gwas.copy())
+        sources.append(gwas)
     if curated:
-        frames.append(pd.DataFrame([item.as_dict() for item in curated]))
-
-    if not frames:
-        return pd.DataFrame(columns=["disease_id", "gene_symbol", "score", "source", "evidence_type", "details"])
-
-    merged = pd.concat(frames, ignore_index=True, sort=False)
-    if "details" not in merged.columns:
-        merged["details"] = ""
-    merged["details"].fillna("", inplace=True)
-    merged["score"] = pd.to_numeric(merged["score"], errors="coerce")
-    merged = merged.dropna(subset=["disease_id", "gene_symbol", "score"])
-    merged["disease_id"] = merged["disease_id"].astype(str)
-    merged["gene_symbol"] = merged["gene_symbol"].astype(str)
+        curated = list(curated)
+        sources.append({name: [getattr(item, name) for item in curated] for name in SEED_COLUMNS})
+
+    if not sources:
+        return pd.DataFrame(columns=SEED_COLUMNS)
+
+    # Fill one preallocated array per output column rather than concatenating per-source frames.
+    sizes = [len(source["disease_id"]) for source in sources]
+    total = int(sum(sizes))
+    arrays = {name: np.empty(total, dtype=object) for name in SEED_COLUMNS if name != "score"}
+    score = np.empty(total, dtype=np.float64)
+    offset = 0
+    for source, size in zip(sources, sizes):
+        window = slice(offset, offset + size)
+        for name, array in arrays.items():
+            values = source.get(name)
+            array[window] = None if values is None else np.asarray(values, dtype=object)
+        score[window] = pd.to_numeric(pd.Series(np.asarray(source["score"], dtype=object)), errors="coerce")
+        offset += size
+
+    details = arrays["details"]
+    details[pd.isna(details)] = ""
+    keep = pd.notna(arrays["disease_id"]) & pd.notna(arrays["gene_symbol"]) & ~np.isnan(score)
+    columns = {name: array[keep] for name, array in arrays.items()}
+    columns["score"] = score[keep]
+    # Categorical keys: the sort here and the later (disease, gene) groupbys/merges run on int codes.
+    columns["disease_id"] = pd.Categorical(columns["disease_id"].astype(str))
+    columns["gene_symbol"] = pd.Categorical(columns["gene_symbol"].astype(str))
+    merged = pd.DataFrame({name: columns[name] for name in SEED_COLUMNS}, copy=False)
     merged = merged.sort_values(["disease_id", "score"], ascending=[True, False])
     return merged.reset_index(drop=True)
 
@@ -155,7 +177,7 @@ def summarise_by_disease(seeds: pd.DataFrame) -> pd.DataFrame:
     if seeds.empty:
         return pd.DataFrame(columns=["disease_id", "n_genes", "mean_score"])
     return (
-        seeds.groupby("disease_id")
+        seeds.groupby("disease_id", observed=True)
         .agg(n_genes=("gene_symbol", "nunique"), mean_score=("score", "mean"))
         .reset_index()
     )
@@ -164,5 +186,5 @@ def summarise_by_disease(seeds: pd.DataFrame) -> pd.DataFrame:
 def save_seed_table(seeds: pd.DataFrame, path: str) -> None:
     if seeds.empty:
         logging.warning("Seed table is empty; writing placeholder file to %s", path)
-    seeds.to_csv(path, index=False)
+    write_table(seeds, Path(path))
     logging.info("Seed table with %s rows written to %s", len(seeds), path)
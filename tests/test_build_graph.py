@@ -23,7 +23,16 @@ def _write_tsv(path: Path, df: pd.DataFrame) -> Path:
     return path
 
 
-def test_assemble_tables_with_local_sources(monkeypatch, tmp_path):
+def _write_parquet(path: Path, df: pd.DataFrame) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(path, engine="pyarrow", compression=None, index=False)
+    return path
+
+
+@pytest.fixture(scope="session")
+def assembled_tables(tmp_path_factory):
+    # Built once per session; the tests below only read the resulting tables.
+    tmp_path = tmp_path_factory.mktemp("sources")
     reactome_path = _write_tsv(
         tmp_path / "reactome.tsv",
         pd.DataFrame(
@@ -34,8 +43,8 @@ def test_assemble_tables_with_local_sources(monkeypatch, tmp_path):
             }
         ),
     )
-    opentargets_path = _write_tsv(
-        tmp_path / "opentargets.tsv",
+    opentargets_path = _write_parquet(
+        tmp_path / "opentargets.parquet",
         pd.DataFrame(
             {
                 "diseaseId": ["EFO_0001"],
@@ -44,8 +53,8 @@ def test_assemble_tables_with_local_sources(monkeypatch, tmp_path):
             }
         ),
     )
-    gwas_path = _write_tsv(
-        tmp_path / "gwas.tsv",
+    gwas_path = _write_parquet(
+        tmp_path / "gwas.parquet",
         pd.DataFrame(
             {
                 "trait_id": ["EFO_0001"],
@@ -54,8 +63,8 @@ def test_assemble_tables_with_local_sources(monkeypatch, tmp_path):
             }
         ),
     )
-    disgenet_path = _write_tsv(
-        tmp_path / "disgenet.tsv",
+    disgenet_path = _write_parquet(
+        tmp_path / "disgenet.parquet",
         pd.DataFrame(
             {
                 "diseaseId": ["EFO_0001"],
@@ -64,8 +73,8 @@ def test_assemble_tables_with_local_sources(monkeypatch, tmp_path):
             }
         ),
     )
-    hpa_path = _write_tsv(
-        tmp_path / "hpa.tsv",
+    hpa_path = _write_parquet(
+        tmp_path / "hpa.parquet",
         pd.DataFrame(
             {
                 "Gene": ["ENSG000001"],
@@ -74,8 +83,8 @@ def test_assemble_tables_with_local_sources(monkeypatch, tmp_path):
             }
         ),
     )
-    plae_path = _write_tsv(
-        tmp_path / "plae.tsv",
+    plae_path = _write_parquet(
+        tmp_path / "plae.parquet",
         pd.DataFrame(
             {
                 "gene_id": ["ENSG000001"],
@@ -84,8 +93,8 @@ def test_assemble_tables_with_local_sources(monkeypatch, tmp_path):
             }
         ),
     )
-    rxnorm_path = _write_tsv(
-        tmp_path / "rxnorm.tsv",
+    rxnorm_path = _write_parquet(
+        tmp_path / "rxnorm.parquet",
         pd.DataFrame(
             {
                 "RXCUI": ["123"],
@@ -94,8 +103,8 @@ def test_assemble_tables_with_local_sources(monkeypatch, tmp_path):
             }
         ),
     )
-    sider_path = _write_tsv(
-        tmp_path / "sider.tsv",
+    sider_path = _write_parquet(
+        tmp_path / "sider.parquet",
         pd.DataFrame(
             {
                 "drug_id": ["123"],
@@ -147,12 +156,6 @@ def test_assemble_tables_with_local_sources(monkeypatch, tmp_path):
         }
     )
 
-    monkeypatch.setattr(build_graph, "_load_omnipath", lambda: omni_df)
-    monkeypatch.setattr(build_graph, "_load_signor", lambda: pd.DataFrame())
-    monkeypatch.setattr(build_graph, "_load_string", lambda: string_df)
-    monkeypatch.setattr(build_graph, "_load_drugcentral", lambda: drugcentral_df)
-    monkeypatch.setattr(build_graph, "_load_iuphar", lambda: iuphar_df)
-
     config = build_graph.BuildConfig(
         sqlite_path=None,
         reactome=reactome_path,
@@ -165,9 +168,18 @@ def test_assemble_tables_with_local_sources(monkeypatch, tmp_path):
         sider=sider_path,
         clinicaltrials=trials_path,
     )
-    tables = build_graph.assemble_tables(config)
+    # ``monkeypatch`` is function-scoped, so patch the remote loaders only around the build.
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(build_graph, "_load_omnipath", lambda: omni_df)
+        monkeypatch.setattr(build_graph, "_load_signor", lambda: pd.DataFrame())
+        monkeypatch.setattr(build_graph, "_load_string", lambda: string_df)
+        monkeypatch.setattr(build_graph, "_load_drugcentral", lambda: drugcentral_df)
+        monkeypatch.setattr(build_graph, "_load_iuphar", lambda: iuphar_df)
+        return build_graph.assemble_tables(config)
+
 
-    assert set(tables.keys()) >= {
+def test_assemble_tables_with_local_sources(assembled_tables):
+    assert set(assembled_tables.keys()) >= {
         "protein_edge",
         "pathway_member",
         "disease_gene",
@@ -177,14 +189,17 @@ def test_assemble_tables_with_local_sources(monkeypatch, tmp_path):
         "safety_ae",
         "trial",
     }
-    assert len(tables["protein_edge"]) == 2
-    assert len(tables["drug_target"]) == 2
-    assert len(tables["disease_gene"]) == 3
-    assert len(tables["drug"]) == 1
-    assert len(tables["trial"]) == 1
 
 
-def test_build_knowledge_graph_sqlite(monkeypatch, tmp_path):
+@pytest.mark.parametrize(
+    ("table", "rows"),
+    [("protein_edge", 2), ("drug_target", 2), ("disease_gene", 3), ("drug", 1), ("trial", 1)],
+)
+def test_assembled_table_row_counts(assembled_tables, table, rows):
+    assert len(assembled_tables[table]) == rows
+
+
+def test_build_knowledge_graph_sqlite(monkeypatch):
     monkeypatch.setattr(build_graph, "assemble_tables", lambda config: {
         "protein_edge": pd.DataFrame(
             [
@@ -208,10 +223,72 @@ def test_build_knowledge_graph_sqlite(monkeypatch, tmp_path):
         "safety_ae": pd.DataFrame(),
         "trial": pd.DataFrame(),
     })
-    db_path = tmp_path / "kg.sqlite"
-    config = build_graph.BuildConfig(sqlite_path=db_path)
-    build_graph.build_knowledge_graph(config)
-    assert db_path.exists()
-    with sqlite3.connect(db_path) as conn:
+    # A shared-cache in-memory database lives while any connection is open, so hold one across the build.
+    uri = "file:kg?mode=memory&cache=shared"
+    conn = sqlite3.connect(uri, uri=True)
+    try:
+        build_graph.build_knowledge_graph(build_graph.BuildConfig(sqlite_path=uri))
         rows = conn.execute("SELECT COUNT(*) FROM protein_edge").fetchone()[0]
+    finally:
+        conn.close()
     assert rows == 1
+
+
+def test_streamed_string_chunks_dedupe_across_chunks():
+    string_df = pd.DataFrame(
+        {
+            "protein1": ["9606.ENSP1", "9606.ENSP2", "9606.ENSP1", "9606.ENSP3"],
+            "protein2": ["9606.ENSP2", "9606.ENSP1", "9606.ENSP2", "9606.ENSP4"],
+            "combined_score": [900, 800, 900, 150],
+        }
+    )
+    chunks = build_graph.normalize_string_chunks([string_df.iloc[:2], string_df.iloc[2:]])
+
+    with sqlite3.connect(":memory:") as conn:
+        build_graph._initialise_sqlite(conn)
+        build_graph._write_sqlite(conn, {"protein_edge": chunks})
+        pairs = conn.execute("SELECT src_gene_id, dst_gene_id FROM protein_edge ORDER BY edge_id").fetchall()
+    assert pairs == [("ENSP1", "ENSP2"), ("ENSP2", "ENSP1"), ("ENSP3", "ENSP4")]
+
+
+def test_cached_frame_skips_empty_remote_results(tmp_path):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return pd.DataFrame() if len(calls) == 1 else pd.DataFrame({"a": [1]})
+
+    assert build_graph._cached_frame(tmp_path, "remote", "day", fetch, cache_empty=False).empty
+    assert len(build_graph._cached_frame(tmp_path, "remote", "day", fetch, cache_empty=False)) == 1
+    assert len(build_graph._cached_frame(tmp_path, "remote", "day", fetch, cache_empty=False)) == 1
+    assert len(calls) == 2
+    assert [path.suffix for path in tmp_path.iterdir()] == [".parquet"]
+
+
+def test_build_knowledge_graph_streams_string_into_sqlite(monkeypatch):
+    string_df = pd.DataFrame(
+        {
+            "protein1": ["9606.ENSP1", "9606.ENSP2", "9606.ENSP1"],
+            "protein2": ["9606.ENSP2", "9606.ENSP3", "9606.ENSP2"],
+            "combined_score": [900, 800, 900],
+        }
+    )
+    empty = pd.DataFrame()
+    for loader in ("_load_omnipath", "_load_signor", "_load_drugcentral", "_load_iuphar"):
+        monkeypatch.setattr(build_graph, loader, lambda: empty)
+    monkeypatch.setattr(build_graph, "_load_string", lambda: pytest.fail("STRING should be streamed"))
+    monkeypatch.setattr(
+        build_graph,
+        "_load_string_chunks",
+        lambda chunksize: [string_df.iloc[start : start + chunksize] for start in range(0, len(string_df), chunksize)],
+    )
+
+    uri = "file:kg_stream?mode=memory&cache=shared"
+    conn = sqlite3.connect(uri, uri=True)
+    try:
+        tables = build_graph.build_knowledge_graph(build_graph.BuildConfig(sqlite_path=uri, string_chunksize=2))
+        rows = conn.execute("SELECT COUNT(*) FROM protein_edge WHERE source = 'STRING'").fetchone()[0]
+    finally:
+        conn.close()
+    assert rows == 2
+    assert tables["protein_edge"].empty
@@ -1,5 +1,6 @@
 import math
 
+import numpy as np
 import pytest
 
 pd = pytest.importorskip("pandas")
@@ -37,7 +38,10 @@ def test_run_study_analysis_produces_effect_sizes():
     assert len(tables) == 1
     result = tables[0]
     assert set(result.columns) == {"disease_id", "study_id", "gene_symbol", "logfc", "se", "pvalue"}
-    assert math.isclose(result.loc[result["gene_symbol"] == "GENE1", "logfc"].iloc[0], math.log2(5.5 / 2.0), rel_tol=1e-4)
+    expected = {"GENE1": math.log2(5.5 / 2.0)}
+    np.testing.assert_allclose(
+        result.set_index("gene_symbol").loc[list(expected), "logfc"].to_numpy(), list(expected.values()), rtol=1e-4
+    )
 
 
 def test_meta_analyse_combines_two_studies():
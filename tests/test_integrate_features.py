@@ -13,3 +13,4 @@ def test_integrate_features_combines_tables():
     assert "drug_count" in features.columns
     assert features["drug_count"].iloc[0] == 1
     assert features["active_trials"].iloc[0] == 3
+    assert features["target_id"].dtype == object and features["disease_id"].dtype == object
@@ -1,3 +1,5 @@
+import re
+
 import pytest
 
 pd = pytest.importorskip("pandas")
@@ -6,6 +8,7 @@ from etl.ontology_parser import (
     DEFAULT_OCULAR_ROOTS,
     annotate_phenotypes,
     build_manifest,
+    clean_xrefs,
 )
 
 
@@ -66,3 +69,34 @@ def test_build_manifest_counts_records():
     assert manifest["ocular_phenotype_records"] == 1
     assert manifest["disease_phenotype_records"] == 1
     assert manifest["source_files"]["mondo"] == "mondo.obo"
+
+
+def test_clean_xrefs_matches_leading_token_regex():
+    raw = pd.Series(
+        ["OMIM:123456", 'UMLS:C0001 {source="MONDO:equivalentTo"}', " leading", "Orphanet:98"],
+        index=[0, 0, 1, 2],
+    )
+
+    cleaned = clean_xrefs(raw)
+
+    expected = [re.match(r"([^ ]+)", value) for value in raw]
+    assert cleaned.tolist() == [match.group(1) for match in expected if match]
+    assert cleaned.index.tolist() == [0, 0, 2]
+
+
+def test_rewriting_a_release_leaves_linked_snapshot_intact(tmp_path):
+    import os
+
+    from etl._frames import write_table
+
+    release = tmp_path / "release" / "disease.csv"
+    release.parent.mkdir()
+    write_table(pd.DataFrame({"id": ["D1"]}), release)
+    latest = tmp_path / "latest"
+    latest.mkdir()
+    for name in ("disease.csv", "disease.parquet"):
+        os.link(release.parent / name, latest / name)
+
+    write_table(pd.DataFrame({"id": ["D2"]}), release)
+    assert pd.read_csv(latest / "disease.csv")["id"].tolist() == ["D1"]
+    assert pd.read_parquet(latest / "disease.parquet")["id"].tolist() == ["D1"]
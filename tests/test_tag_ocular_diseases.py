@@ -0,0 +1,29 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from etl.tag_ocular_diseases import tag_ocular_diseases
+
+
+def test_tag_source_keeps_keyword_for_missing_synonyms(tmp_path):
+    pd.DataFrame(
+        {
+            "id": ["D1", "D2", "D3"],
+            "name": ["Retinal dystrophy", "Macular disease", "Kidney disease"],
+            "synonyms": [None, " ", "eye thing"],
+        }
+    ).to_csv(tmp_path / "disease.csv", index=False)
+    pd.DataFrame(
+        {"id": ["HP:1"], "name": ["Abnormal retina"], "is_ocular": [True], "ocular_scope": ["retina"]}
+    ).to_csv(tmp_path / "phenotype.csv", index=False)
+    pd.DataFrame({"disease_id": ["D1", "D2"], "phenotype_id": ["HP:1", "HP:1"]}).to_csv(
+        tmp_path / "disease_phenotype.csv", index=False
+    )
+
+    tag_ocular_diseases(tmp_path, output_format="csv")
+    tagged = pd.read_csv(tmp_path / "disease_tagged.csv", keep_default_na=False).set_index("id")
+
+    # Empty synonym cells read back as NaN, which the tagger has always treated as non-blank text.
+    assert tagged.loc["D1", "tag_source"] == "keyword|phenotype"
+    assert tagged.loc["D2", "tag_source"] == "phenotype"
+    assert tagged.loc["D3", "tag_source"] == "keyword"
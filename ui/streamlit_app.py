@@ -2,49 +2,110 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+try:  # scans only the selected disease's rows out of the Parquet siblings
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:  # pragma: no cover - optional dependency
+    ds = None
+
+from etl._frames import read_table, table_exists
+
 SEED_PATH = Path("disease_seeds.csv")
 SCORE_PATH = Path("target_scores.csv")
 DRUG_TARGET_PATH = Path("drug_target_mapping.csv")
 
 
 @st.cache_data
+def _read_table(path: str, mtime_ns: int) -> pd.DataFrame:
+    # ``mtime_ns`` is only part of the cache key (no leading underscore, so Streamlit hashes it).
+    return read_table(Path(path))
+
+
+@st.cache_data
+def _read_disease_slice(path: str, disease_id: str, columns: Tuple[str, ...], mtime_ns: int) -> pd.DataFrame:
+    parquet_path = Path(path).with_suffix(".parquet")
+    if ds is None or not parquet_path.exists():
+        return _filter_disease(read_table(Path(path)), disease_id, columns)
+    dataset = ds.dataset(parquet_path, format="parquet")
+    column = next((name for name in columns if name in dataset.schema.names), None)
+    if column is None:
+        return dataset.to_table().to_pandas()
+    # Pushed into the scan: row groups whose min/max statistics exclude the disease are never
+    # decoded, and the score writer emits rows grouped by disease.
+    return dataset.to_table(filter=ds.field(column).cast(pa.string()) == disease_id).to_pandas()
+
+
+@st.cache_data
+def _disease_list(path: str, mtime_ns: int) -> list[str]:
+    # Sorted once per file version rather than on every widget rerun; only the id column is read.
+    parquet_path = Path(path).with_suffix(".parquet")
+    if parquet_path.exists():
+        values = pd.read_parquet(parquet_path, columns=["disease_id"])["disease_id"]
+    else:
+        values = pd.read_csv(path, usecols=["disease_id"])["disease_id"]
+    return sorted(values.dropna().unique().tolist())
+
+
+def _disease_mask(values: pd.Series, disease_id: str) -> np.ndarray:
+    """``values.astype(str) == disease_id`` without stringifying columns that already hold text."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Match against the categories once, then compare integer codes.
+        matches = [code for code, name in enumerate(values.cat.categories.astype(str)) if name == disease_id]
+        return values.cat.codes.isin(matches).to_numpy()
+    if pd.api.types.is_string_dtype(values.dtype) and pd.api.types.infer_dtype(values, skipna=True) == "string":
+        return (values == disease_id).to_numpy(dtype=bool, na_value=False)
+    return (values.astype(str) == disease_id).to_numpy()
+
+
+def _filter_disease(df: pd.DataFrame, disease_id: str, columns: Sequence[str]) -> pd.DataFrame:
+    column = next((name for name in columns if name in df.columns), None)
+    return df if column is None else df.loc[_disease_mask(df[column], disease_id)]
+
+
+def _mtime_ns(path: Path) -> int:
+    return max(candidate.stat().st_mtime_ns for candidate in (path, path.with_suffix(".parquet")) if candidate.exists())
+
+
 def load_table(path: Path) -> pd.DataFrame:
-    if not path.exists():
+    """Load ``path``, preferring the Parquet sibling the pipeline writes next to each CSV."""
+    if not table_exists(path):
+        return pd.DataFrame()
+    return _read_table(str(path), _mtime_ns(path))
+
+
+def load_disease_slice(path: Path, disease_id: str, columns: Sequence[str] = ("disease_id",)) -> pd.DataFrame:
+    """Rows of ``path`` whose first present ``columns`` entry equals ``disease_id`` (all rows if none)."""
+    if not table_exists(path):
         return pd.DataFrame()
-    return pd.read_csv(path)
+    return _read_disease_slice(str(path), str(disease_id), tuple(columns), _mtime_ns(path))
 
 
 def main() -> None:
     st.title("Rx Repurpose Dashboard")
 
     seeds = load_table(SEED_PATH)
-    scores = load_table(SCORE_PATH)
-    targets = load_table(DRUG_TARGET_PATH)
 
-    disease_list = sorted(seeds["disease_id"].unique()) if not seeds.empty else []
+    disease_list = _disease_list(str(SEED_PATH), _mtime_ns(SEED_PATH)) if not seeds.empty else []
     selected_disease = st.selectbox("Select disease", disease_list)
 
     if selected_disease:
-        disease_seeds = seeds[seeds["disease_id"] == selected_disease]
+        disease_seeds = seeds.loc[_disease_mask(seeds["disease_id"], selected_disease)]
         st.subheader("Seed genes")
         st.dataframe(disease_seeds[["gene_symbol", "score", "source"]])
 
-        if not scores.empty:
-            if "disease_id" in scores.columns:
-                disease_scores = scores[scores["disease_id"].astype(str) == selected_disease]
-            elif "seed_set" in scores.columns:
-                disease_scores = scores[scores["seed_set"] == selected_disease]
-            else:
-                disease_scores = scores
+        if table_exists(SCORE_PATH):
+            disease_scores = load_disease_slice(SCORE_PATH, selected_disease, ("disease_id", "seed_set"))
             st.subheader("Propagated targets")
             st.dataframe(disease_scores.head(50))
 
-        if not targets.empty:
-            linked = targets[targets["disease_id"] == selected_disease] if "disease_id" in targets.columns else targets
+        if table_exists(DRUG_TARGET_PATH):
+            linked = load_disease_slice(DRUG_TARGET_PATH, selected_disease)
             st.subheader("Drug-targets")
             st.dataframe(linked.head(50))
 